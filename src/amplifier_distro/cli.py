@@ -17,7 +17,6 @@ from .config import (
     save_config,
 )
 from .doctor import CheckStatus, DoctorReport, run_diagnostics, run_fixes
-from .migrate import migrate_memory
 from .preflight import PreflightReport, run_preflight
 from .schema import DistroConfig, IdentityConfig, looks_like_path, normalize_path
 from .update_check import (
@@ -155,7 +154,9 @@ def init() -> None:
     save_config(config)
     click.echo(f"\nSaved to {path}")
 
-    # Migrate memory store
+    # Migrate memory store (only init needs it; keep it off the import path)
+    from .migrate import migrate_memory
+
     click.echo("\nMemory store:")
     result = migrate_memory()
     if result.migrated:
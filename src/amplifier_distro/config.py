@@ -1,8 +1,10 @@
 """Config I/O and environment detection for distro.yaml."""
 
+import copy
 import logging
 import subprocess
 from pathlib import Path
+from typing import Any
 
 import yaml
 from pydantic import ValidationError  # noqa: F401 - re-exported for callers
@@ -12,6 +14,11 @@ from .schema import DistroConfig
 
 logger = logging.getLogger(__name__)
 
+# Last parsed distro.yaml, keyed on (path, inode, mtime_ns, size) so an
+# unchanged file is not re-parsed. save_config writes via rename, which
+# always produces a new inode.
+_parsed_cache: tuple[tuple[str, int, int, int], Any] | None = None
+
 
 def config_path() -> Path:
     """Return the path to distro.yaml, expanded."""
@@ -24,14 +31,23 @@ def load_config() -> DistroConfig:
     Raises ValidationError if the file contains invalid values.
     Callers should catch and handle appropriately for their context.
     """
+    global _parsed_cache
+
     path = config_path()
-    if not path.exists():
+    try:
+        st = path.stat()
+    except FileNotFoundError:
         return DistroConfig()
 
-    try:
-        data = yaml.safe_load(path.read_text())
-    except yaml.YAMLError as exc:
-        raise ValueError(f"Malformed YAML in {path}: {exc}") from exc
+    key = (str(path), st.st_ino, st.st_mtime_ns, st.st_size)
+    if _parsed_cache is not None and _parsed_cache[0] == key:
+        data = copy.deepcopy(_parsed_cache[1])
+    else:
+        try:
+            data = yaml.safe_load(path.read_text())
+        except yaml.YAMLError as exc:
+            raise ValueError(f"Malformed YAML in {path}: {exc}") from exc
+        _parsed_cache = (key, copy.deepcopy(data))
 
     if not data:
         return DistroConfig()
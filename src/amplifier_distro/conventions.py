@@ -31,6 +31,7 @@ DISTRO_CONFIG_FILENAME = "distro.yaml"
 # --- Memory Store ---
 MEMORY_DIR = "memory"  # relative to AMPLIFIER_HOME
 MEMORY_STORE_FILENAME = "memory-store.yaml"
+MEMORY_JOURNAL_FILENAME = "memory-store.jsonl"  # appends not yet in the YAML
 WORK_LOG_FILENAME = "work-log.yaml"
 PROJECT_NOTES_FILENAME = "project-notes.md"
 # Full paths: ~/.amplifier/memory/memory-store.yaml, etc.
@@ -1,6 +1,7 @@
 """File utilities for amplifier-distro.
 
-Provides atomic_write() for crash-safe file persistence.
+Provides atomic_write() and atomic_write_stream() for crash-safe file
+persistence.
 """
 
 from __future__ import annotations
@@ -8,7 +9,9 @@ from __future__ import annotations
 import contextlib
 import os
 import tempfile
+from collections.abc import Callable
 from pathlib import Path
+from typing import TextIO
 
 
 def atomic_write(path: Path, content: str) -> None:
@@ -24,12 +27,22 @@ def atomic_write(path: Path, content: str) -> None:
     Works on all platforms (``os.replace`` is atomic on POSIX; on Windows it
     is atomic when source and destination are on the same volume).
     """
+    atomic_write_stream(path, lambda f: f.write(content))
+
+
+def atomic_write_stream(path: Path, write: Callable[[TextIO], object]) -> None:
+    """Atomically replace *path* with whatever *write* emits to a text stream.
+
+    Same guarantees as atomic_write(), but the content is produced
+    incrementally by ``write(f)`` instead of being built as one string
+    first. If *write* raises, the previous file is left untouched.
+    """
     path.parent.mkdir(parents=True, exist_ok=True)
     fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
     try:
         with os.fdopen(fd, "w", encoding="utf-8") as f:
             fd = -1  # os.fdopen owns the fd now
-            f.write(content)
+            write(f)
             f.flush()
             os.fsync(f.fileno())
         os.replace(tmp, path)
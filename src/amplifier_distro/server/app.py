@@ -32,7 +32,7 @@ from pathlib import Path
 from typing import Any
 
 from fastapi import APIRouter, Depends, FastAPI, HTTPException, Request
-from fastapi.responses import HTMLResponse, JSONResponse, RedirectResponse
+from fastapi.responses import HTMLResponse, ORJSONResponse, RedirectResponse
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
 logger = logging.getLogger(__name__)
@@ -120,6 +120,7 @@ class DistroServer:
             version=version,
             docs_url="/api/docs",
             openapi_url="/api/openapi.json",
+            default_response_class=ORJSONResponse,
         )
         self._core_router = APIRouter(prefix="/api", tags=["core"])
         self._setup_core_routes()
@@ -273,7 +274,7 @@ class DistroServer:
             }
 
         @self._core_router.put("/config", dependencies=[Depends(verify_api_key)])
-        async def update_config(request: Request) -> JSONResponse:
+        async def update_config(request: Request) -> ORJSONResponse:
             """Update distro.yaml with partial config values.
 
             Accepts a JSON body with keys matching DistroConfig fields.
@@ -299,22 +300,22 @@ class DistroServer:
                         cfg.identity.git_email = body["identity"]["git_email"]
 
                 save_config(cfg)
-                return JSONResponse(content=cfg.model_dump())
+                return ORJSONResponse(content=cfg.model_dump())
             except (ValidationError, ValueError) as e:
                 logger.info("Config update rejected: %s", e)
-                return JSONResponse(
+                return ORJSONResponse(
                     status_code=400,
                     content={"error": str(e), "type": type(e).__name__},
                 )
             except Exception as e:
                 logger.warning("Config update failed: %s", e, exc_info=True)
-                return JSONResponse(
+                return ORJSONResponse(
                     status_code=500,
                     content={"error": str(e), "type": type(e).__name__},
                 )
 
         @self._core_router.get("/integrations")
-        async def get_integrations() -> JSONResponse:
+        async def get_integrations() -> ORJSONResponse:
             """Status of each integration (Slack, Voice)."""
             import os
             from pathlib import Path as _Path
@@ -353,12 +354,12 @@ class DistroServer:
                     "setup_url": "/apps/voice/",
                 },
             }
-            return JSONResponse(content=integrations)
+            return ORJSONResponse(content=integrations)
 
         @self._core_router.post(
             "/test-provider", dependencies=[Depends(verify_api_key)]
         )
-        async def test_provider(request: Request) -> JSONResponse:
+        async def test_provider(request: Request) -> ORJSONResponse:
             """Test a provider connection with a minimal API request.
 
             Body: {"provider": "anthropic"} or {"provider": "openai"}
@@ -373,12 +374,12 @@ class DistroServer:
             from amplifier_distro.server.stub import is_stub_mode, stub_test_provider
 
             if is_stub_mode():
-                return JSONResponse(content=stub_test_provider(provider))
+                return ORJSONResponse(content=stub_test_provider(provider))
 
             if provider == "anthropic":
                 api_key = os.environ.get("ANTHROPIC_API_KEY", "")
                 if not api_key:
-                    return JSONResponse(
+                    return ORJSONResponse(
                         content={
                             "provider": provider,
                             "ok": False,
@@ -401,7 +402,7 @@ class DistroServer:
                             },
                         )
                     ok = resp.status_code == 200
-                    return JSONResponse(
+                    return ORJSONResponse(
                         content={
                             "provider": provider,
                             "ok": ok,
@@ -410,7 +411,7 @@ class DistroServer:
                     )
                 except (httpx.HTTPError, OSError) as e:
                     logger.debug("Anthropic provider test failed: %s", e)
-                    return JSONResponse(
+                    return ORJSONResponse(
                         content={
                             "provider": provider,
                             "ok": False,
@@ -421,7 +422,7 @@ class DistroServer:
             elif provider == "openai":
                 api_key = os.environ.get("OPENAI_API_KEY", "")
                 if not api_key:
-                    return JSONResponse(
+                    return ORJSONResponse(
                         content={
                             "provider": provider,
                             "ok": False,
@@ -437,7 +438,7 @@ class DistroServer:
                             },
                         )
                     ok = resp.status_code == 200
-                    return JSONResponse(
+                    return ORJSONResponse(
                         content={
                             "provider": provider,
                             "ok": ok,
@@ -446,7 +447,7 @@ class DistroServer:
                     )
                 except (httpx.HTTPError, OSError) as e:
                     logger.debug("OpenAI provider test failed: %s", e)
-                    return JSONResponse(
+                    return ORJSONResponse(
                         content={
                             "provider": provider,
                             "ok": False,
@@ -454,7 +455,7 @@ class DistroServer:
                         }
                     )
             else:
-                return JSONResponse(
+                return ORJSONResponse(
                     status_code=400,
                     content={
                         "error": f"Unknown provider: {provider}. "
@@ -492,7 +493,7 @@ class DistroServer:
             response_model=None,
             dependencies=[Depends(verify_api_key)],
         )
-        async def create_session(request: Request) -> JSONResponse:
+        async def create_session(request: Request) -> ORJSONResponse:
             """Create an Amplifier session via the shared backend."""
             from amplifier_distro.server.services import get_services
 
@@ -504,7 +505,7 @@ class DistroServer:
                     bundle_name=body.get("bundle_name"),
                     description=body.get("description", ""),
                 )
-                return JSONResponse(
+                return ORJSONResponse(
                     content={
                         "session_id": info.session_id,
                         "project_id": info.project_id,
@@ -513,7 +514,7 @@ class DistroServer:
                 )
             except Exception as e:  # noqa: BLE001
                 logger.warning("Session creation failed: %s", e, exc_info=True)
-                return JSONResponse(
+                return ORJSONResponse(
                     status_code=500,
                     content={"error": str(e), "type": type(e).__name__},
                 )
@@ -521,7 +522,7 @@ class DistroServer:
         @self._core_router.post(
             "/bridge/execute", dependencies=[Depends(verify_api_key)]
         )
-        async def execute_prompt(request: Request) -> JSONResponse:
+        async def execute_prompt(request: Request) -> ORJSONResponse:
             """Execute a prompt on an existing session."""
             from amplifier_distro.server.services import get_services
 
@@ -529,27 +530,27 @@ class DistroServer:
             session_id = body.get("session_id")
             prompt = body.get("prompt")
             if not session_id or not prompt:
-                return JSONResponse(
+                return ORJSONResponse(
                     status_code=400,
                     content={"error": "session_id and prompt are required"},
                 )
             try:
                 services = get_services()
                 response = await services.backend.send_message(session_id, prompt)
-                return JSONResponse(
+                return ORJSONResponse(
                     content={
                         "session_id": session_id,
                         "response": response,
                     }
                 )
             except ValueError as e:
-                return JSONResponse(
+                return ORJSONResponse(
                     status_code=404,
                     content={"error": str(e)},
                 )
             except Exception as e:  # noqa: BLE001
                 logger.warning("Prompt execution failed: %s", e, exc_info=True)
-                return JSONResponse(
+                return ORJSONResponse(
                     status_code=500,
                     content={"error": str(e), "type": type(e).__name__},
                 )
@@ -560,61 +561,63 @@ class DistroServer:
         @self._core_router.post(
             "/memory/remember", dependencies=[Depends(verify_api_key)]
         )
-        async def memory_remember(request: Request) -> JSONResponse:
+        async def memory_remember(request: Request) -> ORJSONResponse:
             """Store a memory with auto-categorization."""
             from amplifier_distro.server.memory import get_memory_service
 
             body = await request.json()
             text = body.get("text", "")
             if not text:
-                return JSONResponse(
+                return ORJSONResponse(
                     status_code=400,
                     content={"error": "text is required"},
                 )
             try:
                 service = get_memory_service()
                 result = service.remember(text)
-                return JSONResponse(content=result)
+                return ORJSONResponse(content=result)
             except (RuntimeError, OSError, ValueError, KeyError) as e:
                 logger.warning("Memory remember failed: %s", e, exc_info=True)
-                return JSONResponse(
+                return ORJSONResponse(
                     status_code=500,
                     content={"error": str(e), "type": type(e).__name__},
                 )
 
         @self._core_router.get("/memory/recall")
-        async def memory_recall(q: str = "") -> JSONResponse:
+        async def memory_recall(q: str = "") -> ORJSONResponse:
             """Search memories by content, tags, and category."""
             from amplifier_distro.server.memory import get_memory_service
 
             if not q:
-                return JSONResponse(
+                return ORJSONResponse(
                     status_code=400,
                     content={"error": "q query parameter is required"},
                 )
             try:
                 service = get_memory_service()
                 results = service.recall(q)
-                return JSONResponse(content={"matches": results, "count": len(results)})
+                return ORJSONResponse(
+                    content={"matches": results, "count": len(results)}
+                )
             except (RuntimeError, OSError, ValueError, KeyError) as e:
                 logger.warning("Memory recall failed: %s", e, exc_info=True)
-                return JSONResponse(
+                return ORJSONResponse(
                     status_code=500,
                     content={"error": str(e), "type": type(e).__name__},
                 )
 
         @self._core_router.get("/memory/work-status")
-        async def memory_work_status() -> JSONResponse:
+        async def memory_work_status() -> ORJSONResponse:
             """Read the current work log."""
             from amplifier_distro.server.memory import get_memory_service
 
             try:
                 service = get_memory_service()
                 result = service.work_status()
-                return JSONResponse(content=result)
+                return ORJSONResponse(content=result)
             except (RuntimeError, OSError, ValueError, KeyError) as e:
                 logger.warning("Work status retrieval failed: %s", e, exc_info=True)
-                return JSONResponse(
+                return ORJSONResponse(
                     status_code=500,
                     content={"error": str(e), "type": type(e).__name__},
                 )
@@ -622,7 +625,7 @@ class DistroServer:
         @self._core_router.post(
             "/memory/work-log", dependencies=[Depends(verify_api_key)]
         )
-        async def memory_update_work_log(request: Request) -> JSONResponse:
+        async def memory_update_work_log(request: Request) -> ORJSONResponse:
             """Update the work log."""
             from amplifier_distro.server.memory import get_memory_service
 
@@ -631,10 +634,10 @@ class DistroServer:
             try:
                 service = get_memory_service()
                 result = service.update_work_log(items)
-                return JSONResponse(content=result)
+                return ORJSONResponse(content=result)
             except (RuntimeError, OSError, ValueError, KeyError) as e:
                 logger.warning("Work log update failed: %s", e, exc_info=True)
-                return JSONResponse(
+                return ORJSONResponse(
                     status_code=500,
                     content={"error": str(e), "type": type(e).__name__},
                 )
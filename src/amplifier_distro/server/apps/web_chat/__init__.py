@@ -13,18 +13,32 @@ Routes:
     GET  /api/session   - Session connection status
     POST /api/session   - Create a new session
     POST /api/chat      - Send a message to active session
+                          (Server-Sent Events when Accept: text/event-stream)
     POST /api/end       - End the active session
 """
 
 from __future__ import annotations
 
+import asyncio
+import atexit
+import contextlib
+import hashlib
+import json
 import logging
 import re
+import time
+from collections.abc import AsyncIterator
 from pathlib import Path
 from typing import Any
 
-from fastapi import APIRouter, Request
-from fastapi.responses import HTMLResponse, JSONResponse
+import orjson
+from fastapi import APIRouter, Query, Request
+from fastapi.responses import (
+    HTMLResponse,
+    ORJSONResponse,
+    Response,
+    StreamingResponse,
+)
 
 from amplifier_distro.conventions import (
     AMPLIFIER_HOME,
@@ -36,28 +50,81 @@ from amplifier_distro.server.apps.web_chat.session_store import (
     WebChatSession,
     WebChatSessionStore,
 )
+from amplifier_distro.server.memory import get_memory_service
+from amplifier_distro.server.services import get_services
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
 _static_dir = Path(__file__).parent / "static"
 
-# --- Memory pattern matching ---
+# How long a "connected" session status may be served without asking
+# the backend again. The UI polls /api/session every few seconds.
+_STATUS_CACHE_TTL = 1.0
+
+# How often last_active updates from chat traffic are written to disk.
+_FLUSH_INTERVAL = 5.0
 
-# Patterns for "remember this: <text>" style messages
-_REMEMBER_PATTERNS = [
-    re.compile(r"^remember\s+this:\s*(.+)", re.IGNORECASE | re.DOTALL),
-    re.compile(r"^remember\s+that\s+(.+)", re.IGNORECASE | re.DOTALL),
-    re.compile(r"^remember:\s*(.+)", re.IGNORECASE | re.DOTALL),
-]
 
-# Patterns for "what do you remember about <query>" style messages
-_RECALL_PATTERNS = [
-    re.compile(r"^what\s+do\s+you\s+remember\s+about\s+(.+)", re.IGNORECASE),
-    re.compile(r"^recall\s+(.+)", re.IGNORECASE),
-    re.compile(r"^search\s+memory\s+(?:for\s+)?(.+)", re.IGNORECASE),
-]
+def _read_index_html() -> bytes | None:
+    """Read the bundled chat page as bytes, or None if it is missing."""
+    html_file = _static_dir / "index.html"
+    return html_file.read_bytes() if html_file.exists() else None
+
+
+# The chat page is static for the life of the process; read it once.
+# Kept as bytes so HTMLResponse sends it as-is instead of re-encoding
+# the page on every request.
+_INDEX_HTML = _read_index_html()
+# Validator for conditional GETs: a reload with a matching If-None-Match
+# gets an empty 304 instead of the whole page.
+_INDEX_ETAG = (
+    f'"{hashlib.sha256(_INDEX_HTML).hexdigest()[:32]}"'
+    if _INDEX_HTML is not None
+    else None
+)
+
+# --- Memory pattern matching ---
+
+# One anchored alternation for every memory command, so classifying a
+# message is a single match() call. The group name prefix gives the
+# action. Remember content may span lines; recall queries stop at the
+# first newline. The pattern is anchored with no nested quantifiers, so
+# sre matches it in linear time; an external DFA engine (re2) measured far
+# slower here because per-call binding overhead dominates such short input.
+_MEMORY_PATTERN_SOURCE = (
+    r"^(?:"
+    r"remember\s+this:\s*(?P<remember_this>(?s:.+))"
+    r"|remember\s+that\s+(?P<remember_that>(?s:.+))"
+    r"|remember:\s*(?P<remember_colon>(?s:.+))"
+    r"|what\s+do\s+you\s+remember\s+about\s+(?P<recall_about>.+)"
+    r"|recall\s+(?P<recall>.+)"
+    r"|search\s+memory\s+(?:for\s+)?(?P<recall_search>.+)"
+    r")"
+)
+# Matched against the casefolded message, so no IGNORECASE work per attempt.
+_MEMORY_PATTERN = re.compile(_MEMORY_PATTERN_SOURCE)
+# For the rare message whose casefold changes length (e.g. "ß" -> "ss"),
+# where spans in the folded string no longer line up with the original.
+_MEMORY_PATTERN_ICASE = re.compile(_MEMORY_PATTERN_SOURCE, re.IGNORECASE)
+
+# First word of every alternative above. Most chat messages are not memory
+# commands; checking these literals first skips the regex for them.
+_MEMORY_PREFIXES = ("remember", "recall", "what", "search")
+
+# Single-space spellings of each command, matched with plain startswith
+# before falling back to _MEMORY_PATTERN for any other whitespace.
+# Entries are (prefix, action, multiline). "search memory <query>" is
+# left to the regex because its optional "for" can follow any whitespace.
+_MEMORY_COMMANDS: tuple[tuple[str, str, bool], ...] = (
+    ("remember this:", "remember", True),
+    ("remember that ", "remember", True),
+    ("remember:", "remember", True),
+    ("what do you remember about ", "recall", False),
+    ("recall ", "recall", False),
+    ("search memory for ", "recall", False),
+)
 
 
 def check_memory_intent(message: str) -> tuple[str, str] | None:
@@ -68,20 +135,51 @@ def check_memory_intent(message: str) -> tuple[str, str] | None:
         action is 'remember' or 'recall'.
     """
     stripped = message.strip()
-    for pattern in _REMEMBER_PATTERNS:
-        match = pattern.match(stripped)
-        if match:
-            return ("remember", match.group(1).strip())
-    for pattern in _RECALL_PATTERNS:
-        match = pattern.match(stripped)
-        if match:
-            return ("recall", match.group(1).strip())
-    return None
-
-
-def _handle_memory_command(action: str, text: str) -> dict[str, Any]:
+    if not stripped[:8].casefold().startswith(_MEMORY_PREFIXES):
+        return None
+
+    lowered = stripped.casefold()
+    if len(lowered) != len(stripped):
+        match = _MEMORY_PATTERN_ICASE.match(stripped)
+    else:
+        for prefix, action, multiline in _MEMORY_COMMANDS:
+            if lowered.startswith(prefix):
+                text = stripped[len(prefix) :].lstrip()
+                if not multiline:
+                    text = text.partition("\n")[0]
+                text = text.strip()
+                if text:
+                    return (action, text)
+                break
+        match = _MEMORY_PATTERN.match(lowered)
+
+    if match is None:
+        return None
+    group = match.lastgroup or ""
+    action = "remember" if group.startswith("remember") else "recall"
+    start, end = match.span(group)
+    return (action, stripped[start:end].strip())
+
+
+# Strong references to in-flight persistence tasks so they aren't
+# garbage-collected before they finish.
+_background_tasks: set[asyncio.Task[None]] = set()
+
+
+async def _persist_memory(mem_id: str) -> None:
+    """Write a memory reserved by remember_begin() off the event loop."""
+    try:
+        await asyncio.to_thread(get_memory_service().remember_finalize, mem_id)
+    except Exception:
+        logger.warning("Failed to persist memory %s", mem_id, exc_info=True)
+
+
+async def _handle_memory_command(action: str, text: str) -> dict[str, Any]:
     """Handle a memory command and return a chat-style response.
 
+    For 'remember', only the entry metadata is computed before replying;
+    the store write runs as a background task.
+
     Args:
         action: 'remember' or 'recall'.
         text: The memory content or search query.
@@ -89,12 +187,13 @@ def _handle_memory_command(action: str, text: str) -> dict[str, Any]:
     Returns:
         Dict with 'response' key suitable for chat response.
     """
-    from amplifier_distro.server.memory import get_memory_service
-
     service = get_memory_service()
 
     if action == "remember":
-        result = service.remember(text)
+        result = service.remember_begin(text)
+        task = asyncio.create_task(_persist_memory(result["id"]))
+        _background_tasks.add(task)
+        task.add_done_callback(_background_tasks.discard)
         return {
             "response": (
                 f"Remembered! Stored as {result['id']} "
@@ -112,10 +211,8 @@ def _handle_memory_command(action: str, text: str) -> dict[str, Any]:
                 "memory_action": "recall",
                 "memory_result": [],
             }
-        lines = [
-            f"Found {len(results)} memory(ies):\n",
-            *[f"- [{m['id']}] ({m['category']}) {m['content']}" for m in results],
-        ]
+        lines = [f"Found {len(results)} memory(ies):\n"]
+        lines.extend(f"- [{m['id']}] ({m['category']}) {m['content']}" for m in results)
         return {
             "response": "\n".join(lines),
             "memory_action": "recall",
@@ -125,8 +222,6 @@ def _handle_memory_command(action: str, text: str) -> dict[str, Any]:
 
 def _get_backend():
     """Get the shared session backend."""
-    from amplifier_distro.server.services import get_services
-
     return get_services().backend
 
 
@@ -136,6 +231,11 @@ class WebChatSessionManager:
     Replaces the module-level _active_session_id global and _session_lock.
     One active session at a time (single-user web chat).
 
+    Lifecycle changes (create, resume, end) are serialized by a lock so
+    two of them can never both leave a session active. send_message()
+    and read-only queries take no lock; they act on whichever session
+    is active when they run.
+
     Pass persistence_path=None to disable disk persistence (test mode).
     In production, persistence_path is resolved at singleton creation time.
     """
@@ -147,12 +247,18 @@ class WebChatSessionManager:
     ) -> None:
         self._backend = backend
         self._store = WebChatSessionStore(persistence_path=persistence_path)
+        # Serializes create/end/resume only. Reads (active_session_id,
+        # list_sessions) and send_message never take it, so readers
+        # already run concurrently without a read/write lock.
+        self._lifecycle_lock = asyncio.Lock()
+        # (monotonic timestamp, session_id, status payload) of the last
+        # connected status reported by session_status()
+        self._status_cache: tuple[float, str, dict[str, Any]] | None = None
 
     @property
     def active_session_id(self) -> str | None:
         """ID of the current active session, or None."""
-        session = self._store.active_session()
-        return session.session_id if session else None
+        return self._store.active_session_id
 
     async def create_session(
         self,
@@ -167,24 +273,25 @@ class WebChatSessionManager:
 
         Returns the SessionInfo from the backend.
         """
-        # Deactivate existing session in store only (backend stays alive for resume)
-        existing = self._store.active_session()
-        if existing:
-            self._store.deactivate(existing.session_id)
-
-        info = await self._backend.create_session(
-            working_dir=working_dir,
-            description=description,
-        )
-        self._store.add(
-            info.session_id,
-            description,
-            extra={
-                "project_id": info.project_id,
-                "working_dir": info.working_dir,
-            },
-        )
-        return info
+        async with self._lifecycle_lock:
+            # Deactivate existing session in store only (backend stays alive)
+            existing = self._store.active_session()
+            if existing:
+                self._store.deactivate(existing.session_id)
+
+            info = await self._backend.create_session(
+                working_dir=working_dir,
+                description=description,
+            )
+            self._store.add(
+                info.session_id,
+                description,
+                extra={
+                    "project_id": info.project_id,
+                    "working_dir": info.working_dir,
+                },
+            )
+            return info
 
     async def send_message(self, message: str) -> str | None:
         """Send message to active session. Returns None if no session.
@@ -205,16 +312,53 @@ class WebChatSessionManager:
             self._store.deactivate(session.session_id)
             raise
 
+    async def stream_message(self, message: str) -> AsyncIterator[str]:
+        """Stream message to active session, yielding response chunks.
+
+        Same bookkeeping as send_message(); yields nothing if no session.
+        """
+        session = self._store.active_session()
+        if session is None:
+            return
+
+        self._store.touch(session.session_id)
+
+        try:
+            async for chunk in self._backend.stream_message(
+                session.session_id, message
+            ):
+                yield chunk
+        except ValueError:
+            # Backend confirmed session is dead — deactivate in store
+            self._store.deactivate(session.session_id)
+            raise
+
     async def end_session(self) -> bool:
         """Deactivate and end the active session.
 
         Returns True if a session existed, False otherwise.
         """
-        session = self._store.active_session()
-        if session is None:
-            return False
-        await self._end_active(session.session_id)
-        return True
+        async with self._lifecycle_lock:
+            session = self._store.active_session()
+            if session is None:
+                return False
+            await self._end_active(session.session_id)
+            return True
+
+    def cached_status(self, session_id: str) -> dict[str, Any] | None:
+        """Return the status cached for session_id if still fresh, else None."""
+        if self._status_cache is None:
+            return None
+        cached_at, cached_id, status = self._status_cache
+        if cached_id != session_id:
+            return None
+        if time.monotonic() - cached_at >= _STATUS_CACHE_TTL:
+            return None
+        return status
+
+    def cache_status(self, session_id: str, status: dict[str, Any]) -> None:
+        """Remember a connected status payload for session_id."""
+        self._status_cache = (time.monotonic(), session_id, status)
 
     def mark_disconnected(self, session_id: str) -> None:
         """Mark a session as inactive in the store without terminating the backend.
@@ -227,9 +371,17 @@ class WebChatSessionManager:
         """
         self._store.deactivate(session_id)
 
-    def list_sessions(self) -> list[WebChatSession]:
-        """All sessions sorted by last_active desc."""
-        return self._store.list_all()
+    def flush(self, force: bool = False) -> None:
+        """Write last_active updates the store has not saved yet.
+
+        Periodic calls leave recently written sessions pending; pass
+        force=True to write everything (shutdown).
+        """
+        self._store.flush(force)
+
+    def list_sessions(self, limit: int | None = None) -> list[WebChatSession]:
+        """All sessions sorted by last_active desc, optionally the newest `limit`."""
+        return self._store.list_all(limit)
 
     async def resume_session(self, session_id: str) -> WebChatSession:
         """Switch active session to session_id and restore LLM context.
@@ -241,22 +393,23 @@ class WebChatSessionManager:
         double-reconnect.
         Raises ValueError if session_id is not found or backend cannot reconnect.
         """
-        store_session = self._store.get(session_id)
-        if store_session is None:
-            raise ValueError(f"Session {session_id!r} not found")
+        async with self._lifecycle_lock:
+            store_session = self._store.get(session_id)
+            if store_session is None:
+                raise ValueError(f"Session {session_id!r} not found")
 
-        # Restore LLM context first — fail fast before committing store changes.
-        # working_dir comes from extra (stored at creation time).
-        # Falls back to "~" for sessions created before this change.
-        working_dir = store_session.extra.get("working_dir", "~")
-        await self._backend.resume_session(session_id, working_dir)
+            # Restore LLM context first — fail fast before committing store
+            # changes. working_dir comes from extra (stored at creation time).
+            # Falls back to "~" for sessions created before this change.
+            working_dir = store_session.extra.get("working_dir", "~")
+            await self._backend.resume_session(session_id, working_dir)
 
-        # Backend succeeded — now safe to update the store.
-        current = self._store.active_session()
-        if current and current.session_id != session_id:
-            self._store.deactivate(current.session_id)
+            # Backend succeeded — now safe to update the store.
+            current = self._store.active_session()
+            if current and current.session_id != session_id:
+                self._store.deactivate(current.session_id)
 
-        return self._store.reactivate(session_id)
+            return self._store.reactivate(session_id)
 
     async def _end_active(self, session_id: str) -> None:
         """Deactivate in store and end on backend. Swallows backend errors."""
@@ -284,15 +437,19 @@ def _get_manager() -> WebChatSessionManager:
             _get_backend(),
             persistence_path=persistence_path,
         )
+        atexit.register(_manager.flush, force=True)
     return _manager
 
 
 @router.get("/", response_class=HTMLResponse)
-async def index() -> HTMLResponse:
+async def index(request: Request) -> Response:
     """Serve the web chat interface."""
-    html_file = _static_dir / "index.html"
-    if html_file.exists():
-        return HTMLResponse(content=html_file.read_text())
+    if _INDEX_HTML is not None:
+        # no-cache: browsers may keep the page but must revalidate it
+        headers = {"ETag": _INDEX_ETAG, "Cache-Control": "no-cache"}
+        if request.headers.get("if-none-match") == _INDEX_ETAG:
+            return Response(status_code=304, headers=headers)
+        return HTMLResponse(content=_INDEX_HTML, headers=headers)
     return HTMLResponse(
         content=(
             "<h1>Amplifier Web Chat</h1>"
@@ -306,7 +463,9 @@ async def index() -> HTMLResponse:
 async def session_status() -> dict:
     """Return session connection status.
 
-    Reports whether a session is active and its ID.
+    Reports whether a session is active and its ID. A connected status is
+    reused for repeat polls within _STATUS_CACHE_TTL seconds instead of
+    querying the backend each time.
     """
     manager = _get_manager()
     session_id = manager.active_session_id
@@ -318,15 +477,21 @@ async def session_status() -> dict:
             "message": "No active session. Click 'New Session' to start.",
         }
 
+    cached = manager.cached_status(session_id)
+    if cached is not None:
+        return cached
+
     try:
         info = await manager._backend.get_session_info(session_id)
         if info and info.is_active:
-            return {
+            status = {
                 "connected": True,
                 "session_id": session_id,
                 "project_id": info.project_id,
                 "working_dir": info.working_dir,
             }
+            manager.cache_status(session_id, status)
+            return status
         else:
             manager.mark_disconnected(session_id)
             return {
@@ -345,22 +510,37 @@ async def session_status() -> dict:
         }
 
 
+async def _read_json(request: Request) -> dict[str, Any]:
+    """Parse a JSON request body, or return {} if it is empty or invalid.
+
+    Reads the body once. An explicit ``Content-Length: 0`` (the "New
+    Session" button) skips the read entirely.
+    """
+    if request.headers.get("content-length") == "0":
+        return {}
+    try:
+        body = await request.json()
+    except json.JSONDecodeError:
+        return {}
+    return body if isinstance(body, dict) else {}
+
+
 @router.post("/api/session")
-async def create_session(request: Request) -> JSONResponse:
+async def create_session(request: Request) -> ORJSONResponse:
     """Create a new Amplifier session for web chat.
 
     Body (all optional):
         working_dir: str - Working directory for the session
         description: str - Human-readable description
     """
-    body = await request.json() if await request.body() else {}
+    body = await _read_json(request)
     try:
         manager = _get_manager()
         info = await manager.create_session(
             working_dir=body.get("working_dir", "~"),
             description=body.get("description", "Web chat session"),
         )
-        return JSONResponse(
+        return ORJSONResponse(
             content={
                 "session_id": info.session_id,
                 "project_id": info.project_id,
@@ -368,52 +548,111 @@ async def create_session(request: Request) -> JSONResponse:
             }
         )
     except RuntimeError as e:
-        return JSONResponse(status_code=503, content={"error": str(e)})
+        return ORJSONResponse(status_code=503, content={"error": str(e)})
     except Exception as e:  # noqa: BLE001
         logger.warning("Session creation failed: %s", e, exc_info=True)
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500, content={"error": str(e), "type": type(e).__name__}
         )
 
 
+def _sse_event(data: dict[str, Any], event: str | None = None) -> bytes:
+    """Encode one Server-Sent Events frame carrying a JSON payload."""
+    frame = b"data: " + orjson.dumps(data) + b"\n\n"
+    if event is None:
+        return frame
+    return b"event: " + event.encode() + b"\n" + frame
+
+
+async def _stream_chat(
+    manager: WebChatSessionManager, user_message: str, session_id: str
+) -> StreamingResponse:
+    """Stream the backend reply to the client as Server-Sent Events.
+
+    The first chunk is awaited before the response starts, so a dead
+    session or unavailable backend still surfaces as a normal JSON error
+    status from chat(). Failures after that arrive as an ``error`` event.
+    """
+    chunks = manager.stream_message(user_message)
+    first = await anext(chunks, None)
+
+    async def _events() -> AsyncIterator[bytes]:
+        try:
+            if first is not None:
+                yield _sse_event({"chunk": first})
+            async for chunk in chunks:
+                yield _sse_event({"chunk": chunk})
+            yield _sse_event(
+                {"session_id": session_id, "session_connected": True},
+                event="done",
+            )
+        except Exception as e:
+            logger.warning("Chat stream failed: %s", e, exc_info=True)
+            yield _sse_event(
+                {
+                    "error": str(e),
+                    "type": type(e).__name__,
+                    "session_connected": manager.active_session_id is not None,
+                },
+                event="error",
+            )
+        finally:
+            await chunks.aclose()
+
+    return StreamingResponse(
+        _events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"},
+    )
+
+
 @router.post("/api/chat")
-async def chat(request: Request) -> JSONResponse:
+async def chat(request: Request) -> Response:
     """Chat endpoint - send a message to the active session.
 
     Memory-aware: intercepts "remember this: ..." and "what do you
     remember about ..." patterns and routes them through the memory
     service. Memory commands work even without an active session.
 
+    Clients sending ``Accept: text/event-stream`` get the reply streamed
+    as ``data: {"chunk": ...}`` events followed by a ``done`` event.
+    Memory commands and errors are always plain JSON.
+
     Body:
         message: str - The user's message
     """
-    manager = _get_manager()
-    body = await request.json()
+    body = await _read_json(request)
     user_message = body.get("message", "")
+    stripped = user_message.strip() if isinstance(user_message, str) else ""
 
-    if not user_message:
-        return JSONResponse(
+    if not stripped:
+        return ORJSONResponse(
             status_code=400,
             content={"error": "message is required"},
         )
 
-    # Check for memory commands first - these work without a session
-    memory_intent = check_memory_intent(user_message)
+    manager = _get_manager()
+    # Check for memory commands first - these work without a session.
+    # Already stripped, so check_memory_intent's own strip() is a no-op.
+    memory_intent = check_memory_intent(stripped)
     if memory_intent is not None:
         action, text = memory_intent
         try:
-            result = _handle_memory_command(action, text)
+            result = await _handle_memory_command(action, text)
             result["session_connected"] = manager.active_session_id is not None
-            return JSONResponse(content=result)
+            return ORJSONResponse(content=result)
         except Exception as e:  # noqa: BLE001
             logger.warning("Memory command failed: %s", e, exc_info=True)
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=500,
                 content={"error": str(e), "type": type(e).__name__},
             )
 
-    if manager.active_session_id is None:
-        return JSONResponse(
+    # Resolve the active session once; the reply belongs to this session
+    # even if a lifecycle change lands while the backend is working.
+    session_id = manager.active_session_id
+    if session_id is None:
+        return ORJSONResponse(
             status_code=409,
             content={
                 "error": "No active session. Create one first via POST /api/session.",
@@ -422,16 +661,18 @@ async def chat(request: Request) -> JSONResponse:
         )
 
     try:
+        if "text/event-stream" in request.headers.get("accept", ""):
+            return await _stream_chat(manager, user_message, session_id)
         response = await manager.send_message(user_message)
-        return JSONResponse(
+        return ORJSONResponse(
             content={
                 "response": response,
-                "session_id": manager.active_session_id,
+                "session_id": session_id,
                 "session_connected": True,
             }
         )
     except ValueError:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=409,
             content={
                 "error": "Session no longer exists. Create a new one.",
@@ -439,53 +680,60 @@ async def chat(request: Request) -> JSONResponse:
             },
         )
     except RuntimeError as e:
-        return JSONResponse(status_code=503, content={"error": str(e)})
+        return ORJSONResponse(status_code=503, content={"error": str(e)})
     except Exception as e:  # noqa: BLE001
         logger.warning("Chat message failed: %s", e, exc_info=True)
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={"error": str(e), "type": type(e).__name__},
         )
 
 
 @router.post("/api/end")
-async def end_session() -> JSONResponse:
+async def end_session() -> ORJSONResponse:
     """End the active web chat session."""
     manager = _get_manager()
     session_id = manager.active_session_id
 
     if session_id is None:
-        return JSONResponse(content={"ended": False, "message": "No active session."})
+        return ORJSONResponse(content={"ended": False, "message": "No active session."})
 
     await manager.end_session()
-    return JSONResponse(content={"ended": True, "session_id": session_id})
+    return ORJSONResponse(content={"ended": True, "session_id": session_id})
 
 
 @router.get("/api/sessions")
-async def list_sessions() -> dict:
+async def list_sessions(limit: int | None = Query(None, ge=1)) -> ORJSONResponse:
     """List all web chat sessions.
 
     Returns all sessions (active and inactive), sorted by last_active desc.
+
+    Query:
+        limit: int >= 1 - Only return the N most recently active sessions
     """
     manager = _get_manager()
-    sessions = manager.list_sessions()
-    return {
-        "sessions": [
-            {
-                "session_id": s.session_id,
-                "description": s.description,
-                "created_at": s.created_at,
-                "last_active": s.last_active,
-                "is_active": s.is_active,
-                "project_id": s.extra.get("project_id", ""),
-            }
-            for s in sessions
-        ]
-    }
+    sessions = manager.list_sessions(limit)
+    # Returned as a response (not a dict) so FastAPI skips its
+    # jsonable_encoder pass and orjson serializes the list directly.
+    return ORJSONResponse(
+        content={
+            "sessions": [
+                {
+                    "session_id": s.session_id,
+                    "description": s.description,
+                    "created_at": s.created_at,
+                    "last_active": s.last_active,
+                    "is_active": s.is_active,
+                    "project_id": s.extra.get("project_id", ""),
+                }
+                for s in sessions
+            ]
+        }
+    )
 
 
 @router.post("/api/session/resume")
-async def resume_session(request: Request) -> JSONResponse:
+async def resume_session(request: Request) -> ORJSONResponse:
     """Resume a previously created session.
 
     Body:
@@ -496,11 +744,11 @@ async def resume_session(request: Request) -> JSONResponse:
         400 if session_id is missing
         404 if session_id is not found in the registry
     """
-    body = await request.json() if await request.body() else {}
+    body = await _read_json(request)
     session_id = body.get("session_id")
 
     if not session_id:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=400,
             content={"error": "session_id is required"},
         )
@@ -508,22 +756,63 @@ async def resume_session(request: Request) -> JSONResponse:
     try:
         manager = _get_manager()
         session = await manager.resume_session(session_id)
-        return JSONResponse(
+        return ORJSONResponse(
             content={
                 "session_id": session.session_id,
                 "resumed": True,
             }
         )
     except ValueError as e:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=404,
             content={"error": str(e)},
         )
 
 
+# --- App lifecycle ---
+
+_flush_task: asyncio.Task[None] | None = None
+
+
+async def _flush_periodically() -> None:
+    """Write pending session touches every _FLUSH_INTERVAL seconds."""
+    while True:
+        await asyncio.sleep(_FLUSH_INTERVAL)
+        if _manager is not None:
+            _manager.flush()
+
+
+async def on_startup() -> None:
+    global _flush_task
+    # Build the manager (and load the session registry) now rather than
+    # on the first user request. Services may not be up in every setup;
+    # handlers still create it lazily through _get_manager() then.
+    try:
+        _get_manager()
+    except RuntimeError:
+        logger.debug("Services not ready; web chat manager created on demand")
+    _flush_task = asyncio.create_task(_flush_periodically())
+
+
+async def on_shutdown() -> None:
+    global _flush_task
+    if _flush_task is not None:
+        _flush_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await _flush_task
+        _flush_task = None
+    # Let in-flight memory writes finish rather than be cancelled at exit
+    if _background_tasks:
+        await asyncio.gather(*_background_tasks, return_exceptions=True)
+    if _manager is not None:
+        _manager.flush(force=True)
+
+
 manifest = AppManifest(
     name="web-chat",
     description="Amplifier web chat interface",
     version="0.1.0",
     router=router,
+    on_startup=on_startup,
+    on_shutdown=on_shutdown,
 )
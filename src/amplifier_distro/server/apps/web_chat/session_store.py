@@ -9,16 +9,27 @@ but stripped of all Slack-specific routing complexity.
 
 from __future__ import annotations
 
-import json
+import heapq
 import logging
-from dataclasses import asdict, dataclass, field
-from datetime import UTC, datetime
+import time
+from dataclasses import dataclass, field
 from pathlib import Path
 
+import orjson
+
+from amplifier_distro.fileutil import atomic_write
+
 logger = logging.getLogger(__name__)
 
+# flush() compacts the log once it holds this many lines per session.
+_COMPACT_RATIO = 4
+
+# last_active only needs rough accuracy on disk: a periodic flush skips a
+# touched session written less than this many seconds ago.
+_TOUCH_PERSIST_INTERVAL = 60.0
 
-@dataclass
+
+@dataclass(slots=True)
 class WebChatSession:
     """One entry in the web chat session registry.
 
@@ -34,17 +45,56 @@ class WebChatSession:
     extra: dict = field(default_factory=dict)
 
 
+# (epoch second, "YYYY-MM-DDTHH:MM:SS") of the last _utc_now_iso() call
+_iso_second: tuple[int, str] = (-1, "")
+
+
+def _utc_now_iso() -> str:
+    """Current UTC time, formatted like datetime.now(UTC).isoformat().
+
+    Roughly twice as fast: the date/time part is formatted at most once
+    per second and only the microseconds change between calls.
+    """
+    global _iso_second
+    second, micros = divmod(time.time_ns() // 1000, 1_000_000)
+    if _iso_second[0] != second:
+        _iso_second = (second, time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second)))
+    return f"{_iso_second[1]}.{micros:06d}+00:00"
+
+
+def _record_line(session: WebChatSession) -> bytes:
+    """Serialize one session as a newline-terminated JSON record."""
+    return orjson.dumps(
+        session, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS
+    )
+
+
 class WebChatSessionStore:
-    """In-memory dict of WebChatSession, optionally persisted to JSON.
+    """In-memory dict of WebChatSession, optionally persisted to JSON lines.
 
     Pass persistence_path=None to disable disk I/O (useful in tests).
-    On every mutation (add, deactivate, reactivate) the store is saved.
+    The file is an append-only log: each line is a full session record
+    and the last line for a session_id wins on load. Lifecycle mutations
+    (add, deactivate, reactivate) append one line immediately. touch()
+    runs on every chat message, so it only marks the session dirty; the
+    owner calls flush() periodically and on shutdown, which appends the
+    dirty sessions and compacts the log once it outgrows the registry.
 
     Thread safety: single-threaded writes assumed (web chat is single-user).
     """
 
     def __init__(self, persistence_path: Path | None = None) -> None:
         self._sessions: dict[str, WebChatSession] = {}
+        # ID returned by active_session(): the first active entry in
+        # insertion order. Kept in step by add/deactivate/reactivate/_load
+        # so the per-request lookup doesn't scan every session.
+        self._active_id: str | None = None
+        # list_all() result, dropped whenever a last_active changes
+        self._sorted_cache: list[WebChatSession] | None = None
+        self._dirty_ids: set[str] = set()
+        # session_id -> time.monotonic() of its last appended record
+        self._persisted_at: dict[str, float] = {}
+        self._log_lines = 0
         self._persistence_path = persistence_path
         self._load()
 
@@ -61,7 +111,7 @@ class WebChatSessionStore:
         """Register a new session. Raises ValueError if session_id already exists."""
         if session_id in self._sessions:
             raise ValueError(f"Session {session_id!r} already exists")
-        now = datetime.now(UTC).isoformat()
+        now = _utc_now_iso()
         session = WebChatSession(
             session_id=session_id,
             description=description,
@@ -71,7 +121,10 @@ class WebChatSessionStore:
             extra=dict(extra) if extra else {},
         )
         self._sessions[session_id] = session
-        self._save()
+        self._sorted_cache = None
+        if self._active_id is None:
+            self._active_id = session_id
+        self._append(session)
         return session
 
     def deactivate(self, session_id: str) -> None:
@@ -80,7 +133,9 @@ class WebChatSessionStore:
         if session is None:
             return
         session.is_active = False
-        self._save()
+        if session_id == self._active_id:
+            self._active_id = self._find_active_id()
+        self._append(session)
 
     def reactivate(self, session_id: str) -> WebChatSession:
         """Mark session as active again. Raises ValueError if not found."""
@@ -88,59 +143,157 @@ class WebChatSessionStore:
         if session is None:
             raise ValueError(f"Session {session_id!r} not found")
         session.is_active = True
-        session.last_active = datetime.now(UTC).isoformat()
-        self._save()
+        session.last_active = _utc_now_iso()
+        self._sorted_cache = None
+        self._active_id = self._find_active_id()
+        self._append(session)
         return session
 
     def get(self, session_id: str) -> WebChatSession | None:
         """Return the session or None."""
         return self._sessions.get(session_id)
 
-    def list_all(self) -> list[WebChatSession]:
-        """All sessions, sorted by last_active descending (most recent first)."""
-        return sorted(
-            self._sessions.values(),
-            key=lambda s: s.last_active,
-            reverse=True,
-        )
+    def list_all(self, limit: int | None = None) -> list[WebChatSession]:
+        """All sessions, sorted by last_active descending (most recent first).
+
+        The sorted order is cached until a session is added or its
+        last_active changes. With limit and no cached order, the `limit`
+        most recent sessions are selected with a heap instead of sorting
+        the whole registry.
+        """
+        cached = self._sorted_cache
+        if cached is None:
+            if limit is not None:
+                return heapq.nlargest(
+                    limit, self._sessions.values(), key=lambda s: s.last_active
+                )
+            cached = self._sorted_cache = sorted(
+                self._sessions.values(),
+                key=lambda s: s.last_active,
+                reverse=True,
+            )
+        return cached[:limit] if limit is not None else list(cached)
+
+    @property
+    def active_session_id(self) -> str | None:
+        """ID of the session active_session() returns, or None."""
+        return self._active_id
 
     def active_session(self) -> WebChatSession | None:
         """Return the first active session, or None."""
-        for session in self._sessions.values():
-            if session.is_active:
-                return session
-        return None
+        if self._active_id is None:
+            return None
+        return self._sessions.get(self._active_id)
 
     def touch(self, session_id: str) -> None:
-        """Update last_active timestamp for an active session. No-op if not found."""
+        """Update last_active timestamp for an active session. No-op if not found.
+
+        Not saved until the next flush() or lifecycle mutation.
+        """
         session = self._sessions.get(session_id)
         if session is not None:
-            session.last_active = datetime.now(UTC).isoformat()
-            self._save()
+            session.last_active = _utc_now_iso()
+            self._sorted_cache = None
+            self._dirty_ids.add(session_id)
+
+    def flush(self, force: bool = False) -> None:
+        """Append sessions touched since the last write; compact if due.
+
+        Without force, sessions written in the last _TOUCH_PERSIST_INTERVAL
+        seconds stay pending. Pass force=True on shutdown. Cheap when
+        nothing is pending.
+        """
+        if self._dirty_ids:
+            now = time.monotonic()
+            due = [
+                self._sessions[sid]
+                for sid in self._dirty_ids
+                if force
+                or now - self._persisted_at.get(sid, -_TOUCH_PERSIST_INTERVAL)
+                >= _TOUCH_PERSIST_INTERVAL
+            ]
+            if due:
+                self._append(*due)
+        if self._log_lines > _COMPACT_RATIO * max(len(self._sessions), 1):
+            self.compact()
+
+    def compact(self) -> None:
+        """Atomically rewrite the log as one line per session."""
+        self._dirty_ids.clear()
+        if self._persistence_path is None:
+            return
+        try:
+            atomic_write(
+                self._persistence_path,
+                b"".join(_record_line(s) for s in self._sessions.values()).decode(),
+            )
+            self._log_lines = len(self._sessions)
+        except OSError:
+            logger.warning("Failed to save web chat sessions", exc_info=True)
+
+    def _find_active_id(self) -> str | None:
+        """Scan for the first active session ID (lifecycle changes only)."""
+        for session in self._sessions.values():
+            if session.is_active:
+                return session.session_id
+        return None
 
     # ------------------------------------------------------------------
     # Persistence
     # ------------------------------------------------------------------
 
-    def _save(self) -> None:
-        """Atomically write all sessions to the persistence file."""
+    def _append(self, *sessions: WebChatSession) -> None:
+        """Append one record line per session to the log."""
+        now = time.monotonic()
+        for session in sessions:
+            self._dirty_ids.discard(session.session_id)
+            self._persisted_at[session.session_id] = now
         if self._persistence_path is None:
             return
         try:
-            from amplifier_distro.fileutil import atomic_write
-
-            data = [asdict(s) for s in self._sessions.values()]
-            atomic_write(self._persistence_path, json.dumps(data, indent=2))
+            self._persistence_path.parent.mkdir(parents=True, exist_ok=True)
+            with self._persistence_path.open("ab") as f:
+                f.write(b"".join(_record_line(s) for s in sessions))
+            self._log_lines += len(sessions)
         except OSError:
             logger.warning("Failed to save web chat sessions", exc_info=True)
 
     def _load(self) -> None:
-        """Load sessions from persistence file. Silently ignores missing/corrupt."""
+        """Replay the persistence file. Silently ignores missing/corrupt data.
+
+        Also reads the older single-JSON-array format. Legacy files, bad
+        lines (e.g. a write torn by a crash) and a missing final newline
+        trigger an immediate compaction so later appends stay parseable.
+        """
         if self._persistence_path is None or not self._persistence_path.exists():
             return
         try:
-            data = json.loads(self._persistence_path.read_text())
-            for entry in data:
+            data = self._persistence_path.read_bytes()
+        except OSError:
+            logger.warning("Failed to load web chat sessions", exc_info=True)
+            return
+
+        needs_compact = bool(data) and not data.endswith(b"\n")
+        if data.lstrip().startswith(b"["):
+            needs_compact = True
+            try:
+                entries = orjson.loads(data)
+            except orjson.JSONDecodeError:
+                logger.warning("Failed to load web chat sessions", exc_info=True)
+                entries = []
+        else:
+            entries = []
+            for line in data.splitlines():
+                if not line.strip():
+                    continue
+                try:
+                    entries.append(orjson.loads(line))
+                except orjson.JSONDecodeError:
+                    needs_compact = True
+            self._log_lines = len(entries)
+
+        for entry in entries:
+            try:
                 session = WebChatSession(
                     session_id=entry["session_id"],
                     description=entry.get("description", ""),
@@ -149,11 +302,15 @@ class WebChatSessionStore:
                     is_active=entry.get("is_active", True),
                     extra=entry.get("extra", {}),
                 )
-                self._sessions[session.session_id] = session
-            logger.info(
-                "Loaded %d web chat sessions from %s",
-                len(data),
-                self._persistence_path,
-            )
-        except (json.JSONDecodeError, KeyError, OSError):
-            logger.warning("Failed to load web chat sessions", exc_info=True)
+            except (KeyError, TypeError, AttributeError):
+                needs_compact = True
+                continue
+            self._sessions[session.session_id] = session
+        self._active_id = self._find_active_id()
+        logger.info(
+            "Loaded %d web chat sessions from %s",
+            len(self._sessions),
+            self._persistence_path,
+        )
+        if needs_compact:
+            self.compact()
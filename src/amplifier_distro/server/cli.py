@@ -14,7 +14,6 @@ Usage:
 
 from __future__ import annotations
 
-import socket
 from pathlib import Path
 
 import click
@@ -22,6 +21,30 @@ import click
 from amplifier_distro import conventions
 
 
+def _daemon_options(f):
+    """Apply the --host/--port/--apps-dir/--dev options shared by start and restart."""
+    f = click.option(
+        "--dev",
+        is_flag=True,
+        help=(
+            "Dev mode: skip wizard, use existing environment,"
+            " mock session backend (no LLM)"
+        ),
+    )(f)
+    f = click.option("--apps-dir", default=None, help="Apps directory")(f)
+    f = click.option(
+        "--port",
+        default=conventions.SERVER_DEFAULT_PORT,
+        type=int,
+        help="Bind port",
+    )(f)
+    return click.option(
+        "--host",
+        default="127.0.0.1",
+        help="Bind host (use 0.0.0.0 for LAN/Tailscale)",
+    )(f)
+
+
 @click.group("amp-distro-server", invoke_without_command=True)
 @click.option(
     "--host",
@@ -74,43 +97,37 @@ def serve(
 
 
 @serve.command()
-@click.option(
-    "--host",
-    default="127.0.0.1",
-    help="Bind host (use 0.0.0.0 for LAN/Tailscale)",
-)
-@click.option(
-    "--port",
-    default=conventions.SERVER_DEFAULT_PORT,
-    type=int,
-    help="Bind port",
-)
-@click.option("--apps-dir", default=None, help="Apps directory")
-@click.option(
-    "--dev",
-    is_flag=True,
-    help="Dev mode: skip wizard, use existing environment, mock session backend (no LLM)",
-)
+@_daemon_options
 def start(host: str, port: int, apps_dir: str | None, dev: bool) -> None:
     """Start the server as a background daemon."""
-    from amplifier_distro.server.daemon import (
-        daemonize,
-        is_running,
-        pid_file_path,
-        wait_for_health,
-    )
-    from amplifier_distro.server.startup import load_env_file
+    from amplifier_distro.server.daemon import is_running, pid_file_path
 
-    pid_file = pid_file_path()
-    if is_running(pid_file):
+    if is_running(pid_file_path()):
         click.echo("Server is already running.", err=True)
         raise SystemExit(1)
 
-    # Load .env files so daemon inherits env vars
+    _load_env_for_daemon()
+    _launch_daemon(host, port, apps_dir, dev)
+
+
+def _load_env_for_daemon() -> None:
+    """Load .env files so the daemon inherits their env vars."""
+    from amplifier_distro.server.startup import load_env_file
+
     loaded = load_env_file()
     if loaded:
         click.echo(f"Loaded env: {', '.join(loaded)}")
 
+
+def _launch_daemon(host: str, port: int, apps_dir: str | None, dev: bool) -> None:
+    """Spawn the daemon and report whether it came up healthy."""
+    from amplifier_distro.server.daemon import (
+        daemonize,
+        pid_file_path,
+        wait_for_health,
+    )
+
+    pid_file = pid_file_path()
     try:
         pid = daemonize(host=host, port=port, apps_dir=apps_dir, dev=dev)
     except RuntimeError as e:
@@ -133,6 +150,11 @@ def start(host: str, port: int, apps_dir: str | None, dev: bool) -> None:
 @serve.command()
 def stop() -> None:
     """Stop the running server daemon."""
+    _stop_daemon()
+
+
+def _stop_daemon() -> None:
+    """Stop the daemon referenced by the PID file, if any."""
     from amplifier_distro.server.daemon import pid_file_path, read_pid, stop_process
 
     pid_file = pid_file_path()
@@ -151,34 +173,14 @@ def stop() -> None:
 
 
 @serve.command()
-@click.option(
-    "--host",
-    default="127.0.0.1",
-    help="Bind host (use 0.0.0.0 for LAN/Tailscale)",
-)
-@click.option(
-    "--port",
-    default=conventions.SERVER_DEFAULT_PORT,
-    type=int,
-    help="Bind port",
-)
-@click.option("--apps-dir", default=None, help="Apps directory")
-@click.option(
-    "--dev",
-    is_flag=True,
-    help="Dev mode: skip wizard, use existing environment, mock session backend (no LLM)",
-)
-@click.pass_context
-def restart(
-    ctx: click.Context,
-    host: str,
-    port: int,
-    apps_dir: str | None,
-    dev: bool,
-) -> None:
+@_daemon_options
+def restart(host: str, port: int, apps_dir: str | None, dev: bool) -> None:
     """Restart the server daemon (stop + start)."""
-    ctx.invoke(stop)
-    ctx.invoke(start, host=host, port=port, apps_dir=apps_dir, dev=dev)
+    # Do the start-side prep first so the new daemon is spawned as soon
+    # as the old one has exited.
+    _load_env_for_daemon()
+    _stop_daemon()
+    _launch_daemon(host, port, apps_dir, dev)
 
 
 @serve.command("status")
@@ -212,10 +214,12 @@ def server_status() -> None:
         click.echo("Server is not running (no PID file)")
 
 
-def _check_port(host: str, port: int) -> bool:
+def _check_port(host: str, port: int, timeout: float = 0.5) -> bool:
     """Check if a port is accepting connections."""
+    import socket
+
     try:
-        with socket.create_connection((host, port), timeout=2):
+        with socket.create_connection((host, port), timeout=timeout):
             return True
     except (ConnectionRefusedError, TimeoutError, OSError):
         return False
@@ -351,7 +355,9 @@ def _run_foreground(
     stub: bool = False,
 ) -> None:
     """Run the server in the foreground (existing behavior + startup improvements)."""
+    import importlib
     import logging
+    import threading
 
     import uvicorn
 
@@ -451,13 +457,23 @@ def _run_foreground(
         logger=logger,
     )
 
-    # Tailscale HTTPS: auto-detect and set up reverse proxy
-    ts_url = _setup_tailscale(port)
+    # Tailscale HTTPS: auto-detect and set up reverse proxy. The URL is
+    # informational, so probe in the background instead of delaying bind.
+    ts_thread = threading.Thread(
+        target=_announce_tailscale, args=(port,), name="tailscale", daemon=True
+    )
+    ts_thread.start()
+
+    # Warm the shutdown-only backup import while the server is running
+    threading.Thread(
+        target=importlib.import_module,
+        args=("amplifier_distro.backup",),
+        name="backup-import",
+        daemon=True,
+    ).start()
 
     click.echo(f"Starting Amplifier Distro Server on {host}:{port}")
     click.echo(f"  Local: http://{host}:{port}")
-    if ts_url:
-        click.echo(f"  HTTPS: {ts_url}  (Tailscale)")
     click.echo(f"  API docs: http://{host}:{port}/api/docs")
 
     if dev:
@@ -491,6 +507,10 @@ def _run_foreground(
             log_level="info",
         )
 
+    # Let an in-flight 'tailscale serve' finish so its atexit teardown
+    # is registered before we exit.
+    ts_thread.join(timeout=10)
+
     # Auto-backup on shutdown (if enabled in distro.yaml)
     try:
         from amplifier_distro.backup import run_auto_backup
@@ -505,6 +525,13 @@ def _run_foreground(
         logger.exception("Auto-backup error")
 
 
+def _announce_tailscale(port: int) -> None:
+    """Set up Tailscale HTTPS and print its URL once available."""
+    ts_url = _setup_tailscale(port)
+    if ts_url:
+        click.echo(f"  HTTPS: {ts_url}  (Tailscale)")
+
+
 def _setup_tailscale(port: int) -> str | None:
     """Auto-detect Tailscale and set up HTTPS reverse proxy.
 
@@ -515,48 +542,78 @@ def _setup_tailscale(port: int) -> str | None:
     Returns the HTTPS URL on success, or None if Tailscale is unavailable.
     """
     import atexit
+    import shutil
 
     from amplifier_distro import tailscale
 
+    # Skip the subprocess entirely when the binary isn't installed
+    if shutil.which("tailscale") is None:
+        return None
+
     url = tailscale.start_serve(port)
     if url:
         atexit.register(tailscale.stop_serve)
     return url
 
 
-def _create_default_config() -> None:
-    """Create a default distro.yaml from environment detection."""
+def _probe_output(cmd: list[str], timeout: float) -> str:
+    """Run *cmd* and return its stripped stdout, or "" on any failure."""
     import subprocess
 
-    from amplifier_distro.config import save_config
-    from amplifier_distro.schema import DistroConfig, IdentityConfig
-
-    # Detect identity
-    gh_handle = ""
-    git_email = ""
     try:
         result = subprocess.run(
-            ["gh", "api", "user", "--jq", ".login"],
+            cmd,
             capture_output=True,
             text=True,
-            timeout=10,
+            timeout=timeout,
         )
-        if result.returncode == 0:
-            gh_handle = result.stdout.strip()
     except (FileNotFoundError, subprocess.TimeoutExpired):
-        pass
+        return ""
+    return result.stdout.strip() if result.returncode == 0 else ""
 
-    try:
-        result = subprocess.run(
-            ["git", "config", "--global", "user.email"],
-            capture_output=True,
-            text=True,
-            timeout=5,
+
+def _git_global_email() -> str:
+    """Read ``user.email`` from the global git config without forking git.
+
+    Like ``git config --global``, reads only ``$GIT_CONFIG_GLOBAL`` when
+    it is set, and otherwise ``~/.gitconfig`` and then the XDG location;
+    returns "" when none sets it or the file can't be parsed.
+    """
+    import configparser
+    import os
+
+    override = os.environ.get("GIT_CONFIG_GLOBAL")
+    if override:
+        paths = [Path(override).expanduser()]
+    else:
+        xdg = os.environ.get("XDG_CONFIG_HOME") or str(Path.home() / ".config")
+        paths = [Path.home() / ".gitconfig", Path(xdg) / "git" / "config"]
+    for path in paths:
+        # gitconfig allows valueless boolean keys and trailing comments
+        parser = configparser.ConfigParser(
+            strict=False,
+            interpolation=None,
+            allow_no_value=True,
+            inline_comment_prefixes=("#", ";"),
         )
-        if result.returncode == 0:
-            git_email = result.stdout.strip()
-    except (FileNotFoundError, subprocess.TimeoutExpired):
-        pass
+        try:
+            parser.read(path, encoding="utf-8")
+        except (configparser.Error, OSError, UnicodeDecodeError):
+            continue
+        email = (parser.get("user", "email", fallback="") or "").strip().strip('"')
+        if email:
+            return email
+    return ""
+
+
+def _create_default_config() -> None:
+    """Create a default distro.yaml from environment detection."""
+    from amplifier_distro.config import save_config
+    from amplifier_distro.schema import DistroConfig, IdentityConfig
+
+    # Detect identity
+    gh_handle = _probe_output(["gh", "api", "user", "--jq", ".login"], 3)
+    git_email = _git_global_email()
 
     # Detect workspace
     home = Path.home()
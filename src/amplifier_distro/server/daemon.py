@@ -18,6 +18,9 @@ from pathlib import Path
 
 from amplifier_distro import conventions
 
+# Invariant prefix of the daemon command line
+_SERVER_CMD = (sys.executable, "-m", "amplifier_distro.server")
+
 
 def server_dir() -> Path:
     """Return the server directory path, constructed from conventions."""
@@ -36,8 +39,13 @@ def write_pid(pid_file: Path, pid: int | None = None) -> None:
         pid_file: Path to write the PID file.
         pid: Process ID to write. Defaults to current process PID.
     """
-    pid_file.parent.mkdir(parents=True, exist_ok=True)
-    pid_file.write_text(str(pid if pid is not None else os.getpid()))
+    text = str(pid if pid is not None else os.getpid())
+    try:
+        pid_file.write_text(text)
+    except FileNotFoundError:
+        # Only the first write needs to create the server directory
+        pid_file.parent.mkdir(parents=True, exist_ok=True)
+        pid_file.write_text(text)
 
 
 def read_pid(pid_file: Path) -> int | None:
@@ -63,6 +71,20 @@ def is_running(pid_file: Path) -> bool:
     pid = read_pid(pid_file)
     if pid is None:
         return False
+    if sys.platform == "linux":
+        # /proc answers without the signal-permission check, and exposes
+        # exited-but-unreaped (zombie) processes that signal 0 reports alive.
+        try:
+            with open(f"/proc/{pid}/stat", "rb") as f:
+                stat = f.read()
+        except FileNotFoundError:
+            return False
+        except OSError:
+            pass
+        else:
+            # The state letter follows the parenthesised command name
+            end = stat.rfind(b")")
+            return stat[end + 2 : end + 3] != b"Z"
     try:
         os.kill(pid, 0)  # Signal 0 checks existence without killing
         return True
@@ -78,17 +100,50 @@ def cleanup_pid(pid_file: Path) -> None:
         pid_file.unlink(missing_ok=True)
 
 
-def is_port_in_use(host: str, port: int) -> bool:
-    """Check if a port is already in use."""
+def is_port_in_use(host: str, port: int, timeout: float = 0.25) -> bool:
+    """Check if a port is already in use.
+
+    A live local listener accepts in well under a millisecond, so the
+    connect timeout is kept short to make probes of a dead port cheap.
+    """
     import socket
 
     try:
-        with socket.create_connection((host, port), timeout=1):
+        with socket.create_connection((host, port), timeout=timeout):
             return True
     except (ConnectionRefusedError, TimeoutError, OSError):
         return False
 
 
+def _health_ok(host: str, port: int, timeout: float = 2.0) -> bool:
+    """Send one ``GET /api/health`` and report whether it returned 200.
+
+    Speaks just enough HTTP/1.0 over a plain socket to read the status
+    line, which keeps urllib/http.client (and their ssl/email imports)
+    off the CLI path. A refused connection doubles as the port probe.
+    """
+    import socket
+
+    try:
+        with socket.create_connection((host, port), timeout=timeout) as sock:
+            sock.sendall(
+                b"GET /api/health HTTP/1.0\r\nHost: "
+                + host.encode("ascii", "replace")
+                + b"\r\n\r\n"
+            )
+            # Read to EOF (the body is tiny) so the server isn't reset mid-write
+            buf = b""
+            while len(buf) < 4096:
+                chunk = sock.recv(4096)
+                if not chunk:
+                    break
+                buf += chunk
+    except OSError:
+        return False
+    parts = buf.split(b" ", 2)
+    return len(parts) >= 2 and parts[0].startswith(b"HTTP/1.") and parts[1] == b"200"
+
+
 def wait_for_health(
     host: str = "127.0.0.1",
     port: int = conventions.SERVER_DEFAULT_PORT,
@@ -98,23 +153,25 @@ def wait_for_health(
     """Wait for the server health endpoint to respond after startup.
 
     Polls http://{host}:{port}/api/health until it returns 200 or timeout.
+    The delay between polls starts at 50ms and doubles (with up to 10%
+    jitter) to at most *interval*, so a fast startup is noticed quickly.
 
     Returns:
         True if server became healthy within timeout.
     """
-    import urllib.error
-    import urllib.request
+    import random
 
-    url = f"http://{host}:{port}/api/health"
+    jitter = random.SystemRandom()
     deadline = time.monotonic() + timeout
+    delay = min(0.05, interval)
     while time.monotonic() < deadline:
-        try:
-            resp = urllib.request.urlopen(url, timeout=2)  # noqa: S310
-            if resp.status == 200:
-                return True
-        except (urllib.error.URLError, OSError, ValueError):
-            pass
-        time.sleep(interval)
+        if _health_ok(host, port):
+            return True
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        time.sleep(min(delay + jitter.uniform(0, delay * 0.1), remaining))
+        delay = min(delay * 2, interval)
     return False
 
 
@@ -146,15 +203,7 @@ def daemonize(
     if check_port and is_port_in_use(host, port):
         raise RuntimeError(f"Port {port} is already in use")
 
-    cmd = [
-        sys.executable,
-        "-m",
-        "amplifier_distro.server",
-        "--host",
-        host,
-        "--port",
-        str(port),
-    ]
+    cmd = [*_SERVER_CMD, "--host", host, "--port", str(port)]
     if apps_dir:
         cmd.extend(["--apps-dir", apps_dir])
     if dev:
@@ -177,6 +226,41 @@ def daemonize(
     return process.pid
 
 
+def _wait_for_exit(pid: int, timeout: float) -> bool:
+    """Wait up to *timeout* seconds for *pid* to exit.
+
+    Uses a pidfd on Linux so the wait blocks in the kernel and returns as
+    soon as the process is gone; elsewhere falls back to polling with
+    signal 0.
+
+    Returns:
+        True if the process exited within the timeout.
+    """
+    import select
+
+    try:
+        pidfd = os.pidfd_open(pid)
+    except ProcessLookupError:
+        return True
+    except (AttributeError, OSError):
+        pass
+    else:
+        try:
+            ready, _, _ = select.select([pidfd], [], [], timeout)
+            return bool(ready)
+        finally:
+            os.close(pidfd)
+
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return True
+        time.sleep(0.25)
+    return False
+
+
 def stop_process(pid_file: Path, timeout: float = 10.0) -> bool:
     """Stop the process referenced by a PID file.
 
@@ -203,14 +287,9 @@ def stop_process(pid_file: Path, timeout: float = 10.0) -> bool:
     except PermissionError:
         return False
 
-    deadline = time.monotonic() + timeout
-    while time.monotonic() < deadline:
-        try:
-            os.kill(pid, 0)
-            time.sleep(0.1)
-        except ProcessLookupError:
-            cleanup_pid(pid_file)
-            return True
+    if _wait_for_exit(pid, timeout):
+        cleanup_pid(pid_file)
+        return True
 
     # Force kill if still alive after timeout
     with contextlib.suppress(ProcessLookupError):
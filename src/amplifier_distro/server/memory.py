@@ -19,24 +19,96 @@ YAML format (work-log.yaml):
       - task: "Build memory service"
         status: "in-progress"
         updated: "2026-01-05T12:00:00Z"
+
+New memories are first appended to memory-store.jsonl (one JSON entry
+per line) so remembering doesn't rewrite the whole store. The journal is
+replayed on load and folded back into memory-store.yaml by compact(),
+which runs automatically once it holds _JOURNAL_COMPACT_LINES entries.
 """
 
 from __future__ import annotations
 
+import json
 import logging
+import os
 import re
 import threading
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field, replace
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
+import orjson
 import yaml
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
 from amplifier_distro import conventions
 
 logger = logging.getLogger(__name__)
 
+# Prefer the libyaml-backed (C) loader
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
+# Characters that must be escaped inside a YAML double-quoted scalar on
+# top of what json.dumps already escapes: anything the YAML reader rejects
+# as non-printable, plus the Unicode line breaks it would fold.
+_YAML_UNSAFE_CHARS = re.compile(
+    "[^\x09\x0a\x0d\x20-\x7e\xa0-\u2027\u202a-\ud7ff\ue000-\ufffd\U00010000-\U0010ffff]"
+)
+
+
+def _yaml_escape_char(match: re.Match[str]) -> str:
+    code = ord(match.group())
+    return f"\\u{code:04x}" if code <= 0xFFFF else f"\\U{code:08x}"
+
+
+def _yaml_quote(value: str) -> str:
+    """Quote *value* as a YAML double-quoted scalar."""
+    return _YAML_UNSAFE_CHARS.sub(
+        _yaml_escape_char, json.dumps(value, ensure_ascii=False)
+    )
+
+
+def _iter_yaml_records(key: str, records: Iterable[dict[str, Any]]) -> Iterator[str]:
+    """Yield the lines of ``{key: records}`` as YAML for the store/work-log schemas.
+
+    Handles only what those schemas contain -- string fields and lists of
+    strings -- which is much cheaper than a general YAML dumper.
+    """
+    empty = True
+    for record in records:
+        if empty:
+            yield f"{key}:\n"
+            empty = False
+        prefix = "- "
+        for name, value in record.items():
+            if isinstance(value, list):
+                rendered = "[" + ", ".join(_yaml_quote(v) for v in value) + "]"
+            else:
+                rendered = _yaml_quote(value)
+            yield f"{prefix}{name}: {rendered}\n"
+            prefix = "  "
+    if empty:
+        yield f"{key}: []\n"
+
+
+_MEM_ID_RE = re.compile(r"mem-(\d+)")
+
+
+def _max_id_number(memories: Iterable[MemoryEntry]) -> int:
+    """Highest N among ``mem-N`` IDs in *memories* (0 if none)."""
+    max_num = 0
+    for m in memories:
+        match = _MEM_ID_RE.match(m.id)
+        if match:
+            max_num = max(max_num, int(match.group(1)))
+    return max_num
+
+
 # --- Category keywords for auto-categorization ---
 
 _CATEGORY_KEYWORDS: dict[str, list[str]] = {
@@ -139,17 +211,51 @@ _CATEGORY_KEYWORDS: dict[str, list[str]] = {
 }
 
 
-# --- Pydantic models ---
+# Every distinct keyword, so each is searched for once per memory
+_ALL_KEYWORDS = frozenset(kw for kws in _CATEGORY_KEYWORDS.values() for kw in kws)
+
+# Canonical objects for every category/tag remember() can assign. Entries
+# loaded from disk are mapped onto these so a large store holds one copy
+# of each label instead of one per entry.
+_LABELS = {s: s for s in (*_CATEGORY_KEYWORDS, *_ALL_KEYWORDS, "general")}
+
 
+def _keyword_hits(text: str) -> frozenset[str]:
+    """Category keywords occurring (as substrings) in *text*."""
+    text_lower = text.lower()
+    return frozenset(kw for kw in _ALL_KEYWORDS if kw in text_lower)
 
-class MemoryEntry(BaseModel):
-    """A single memory entry in the store."""
+
+# Upper bound on memoized recall() queries per service instance
+_RECALL_CACHE_SIZE = 512
+
+# remember_finalize() compacts the journal into the YAML store once it
+# holds this many entries, bounding both replay cost and how far the YAML
+# (which other tools read) lags behind.
+_JOURNAL_COMPACT_LINES = 32
+
+# (inode, mtime_ns, size) of a file
+_FileSignature = tuple[int, int, int]
+# Signatures of the YAML store and its journal (None where missing)
+_StoreSignature = tuple[_FileSignature | None, _FileSignature | None]
+
+
+# --- Models ---
+
+
+@dataclass(slots=True)
+class MemoryEntry:
+    """A single memory entry in the store.
+
+    A plain dataclass: entries are validated where they enter from disk
+    or the API (MemoryStore, _MEMORY_ENTRY), not on every construction.
+    """
 
     id: str
     timestamp: str
     category: str
     content: str
-    tags: list[str] = Field(default_factory=list)
+    tags: list[str] = field(default_factory=list)
 
 
 class MemoryStore(BaseModel):
@@ -158,7 +264,8 @@ class MemoryStore(BaseModel):
     memories: list[MemoryEntry] = Field(default_factory=list)
 
 
-class WorkLogItem(BaseModel):
+@dataclass(slots=True)
+class WorkLogItem:
     """A single work log entry."""
 
     task: str
@@ -172,14 +279,58 @@ class WorkLog(BaseModel):
     items: list[WorkLogItem] = Field(default_factory=list)
 
 
+# Validators for single entries read from the journal / sent to the API
+_MEMORY_ENTRY = TypeAdapter(MemoryEntry)
+_WORK_LOG_ITEM = TypeAdapter(WorkLogItem)
+
+
+def _share_labels(e: MemoryEntry) -> MemoryEntry:
+    """Point *e*'s category and tags at the canonical label strings."""
+    e.category = _LABELS.get(e.category, e.category)
+    e.tags = [_LABELS.get(t, t) for t in e.tags]
+    return e
+
+
+def _entry_to_dict(e: MemoryEntry) -> dict[str, Any]:
+    return {
+        "id": e.id,
+        "timestamp": e.timestamp,
+        "category": e.category,
+        "content": e.content,
+        "tags": list(e.tags),
+    }
+
+
+def _work_item_to_dict(item: WorkLogItem) -> dict[str, Any]:
+    return {"task": item.task, "status": item.status, "updated": item.updated}
+
+
+# Joins an entry's searchable fields into one haystack string
+_FIELD_SEP = "\x00"
+
+# (haystack, (content, category, *tags)) lowercased for matching, plus
+# the entry's dump
+_SearchRow = tuple[str, tuple[str, ...], dict[str, Any]]
+
+
+def _copy_result(d: dict[str, Any]) -> dict[str, Any]:
+    """Copy of a memory dict that shares no mutable state (tags) with *d*."""
+    return {**d, "tags": list(d["tags"])}
+
+
+def _search_row(m: MemoryEntry) -> _SearchRow:
+    fields = (m.content.lower(), m.category.lower(), *(t.lower() for t in m.tags))
+    return (_FIELD_SEP.join(fields), fields, _entry_to_dict(m))
+
+
 # --- Memory Service ---
 
 
 class MemoryService:
     """Cross-interface memory storage and retrieval.
 
-    Reads/writes memory-store.yaml and work-log.yaml in the
-    conventional memory directory (~/.amplifier/memory/).
+    Reads/writes memory-store.yaml (plus its memory-store.jsonl journal)
+    and work-log.yaml in the conventional memory directory (~/.amplifier/memory/).
 
     All paths are derived from conventions.py constants.
     """
@@ -197,7 +348,37 @@ class MemoryService:
             )
         self._memory_dir = memory_dir
         self._store_path = self._memory_dir / conventions.MEMORY_STORE_FILENAME
+        self._journal_path = self._memory_dir / conventions.MEMORY_JOURNAL_FILENAME
         self._work_log_path = self._memory_dir / conventions.WORK_LOG_FILENAME
+        # recall() results keyed on the lowercased query. Only valid while
+        # the store files' signature matches, so writes from any interface
+        # (or another process) invalidate it.
+        self._recall_cache: dict[str, list[dict[str, Any]]] = {}
+        self._recall_cache_sig: _StoreSignature | None = None
+        self._search_index: tuple[_StoreSignature, list[_SearchRow]] | None = None
+        # Entries handed out by remember_begin() but not yet written by
+        # remember_finalize(). _write_lock serializes ID allocation, store
+        # writes (which may happen on a worker thread) and cache rebuilds,
+        # which replay the journal; it is reentrant because the write paths
+        # read the store while holding it.
+        self._pending: dict[str, MemoryEntry] = {}
+        # Pending entries whose write failed; retried by the next
+        # remember_finalize() or compact() so they aren't lost.
+        self._unwritten: set[str] = set()
+        self._write_lock = threading.RLock()
+        # Last parsed YAML store, store-plus-journal and work log with the
+        # signature they were read at; reused while the files are unchanged.
+        # Store entries also carry the highest numeric memory ID so
+        # _next_id() needn't rescan every entry, and the YAML entry its
+        # entries by ID so journal replay can tell records already compacted
+        # into it from IDs another tool reused.
+        self._yaml_cache: (
+            tuple[_FileSignature, MemoryStore, int, dict[str, MemoryEntry]] | None
+        ) = None
+        self._store_cache: tuple[_StoreSignature, MemoryStore, int] | None = None
+        self._work_log_cache: tuple[_FileSignature, WorkLog] | None = None
+        # Entries in the journal as of the last replay or append
+        self._journal_lines = 0
 
     @property
     def memory_dir(self) -> Path:
@@ -209,6 +390,11 @@ class MemoryService:
         """Path to memory-store.yaml."""
         return self._store_path
 
+    @property
+    def journal_path(self) -> Path:
+        """Path to memory-store.jsonl."""
+        return self._journal_path
+
     @property
     def work_log_path(self) -> Path:
         """Path to work-log.yaml."""
@@ -218,87 +404,321 @@ class MemoryService:
         """Create the memory directory if it doesn't exist."""
         self._memory_dir.mkdir(parents=True, exist_ok=True)
 
+    @staticmethod
+    def _file_signature(path: Path) -> _FileSignature | None:
+        """(inode, mtime_ns, size) of *path*, or None if missing."""
+        try:
+            st = path.stat()
+        except OSError:
+            return None
+        return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+    def _store_signature(self) -> _StoreSignature:
+        """Signatures of the store file and its journal."""
+        return (
+            self._file_signature(self._store_path),
+            self._file_signature(self._journal_path),
+        )
+
     def _load_store(self) -> MemoryStore:
-        """Load the memory store from disk."""
-        if not self._store_path.exists():
-            return MemoryStore()
+        """Load the memory store (YAML plus journal) from disk.
+
+        Returns a fresh list each call (callers append to it), but reuses
+        the parsed entries while the file signatures are unchanged.
+        """
+        return MemoryStore(memories=list(self._cached_store()[0].memories))
+
+    def _cached_store(self) -> tuple[MemoryStore, int]:
+        """The current store plus the highest numeric ID in it.
+
+        The store is shared with the cache and must not be modified; the
+        ID lets callers allocate IDs without copying or scanning entries.
+        """
+        cached = self._store_cache
+        if cached is None or cached[0] != self._store_signature():
+            with self._write_lock:
+                cached = self._reload_store()
+        return cached[1], cached[2]
+
+    def _reload_store(self) -> tuple[_StoreSignature, MemoryStore, int]:
+        """Re-read the store if it changed on disk; call with _write_lock held."""
+        signature = self._store_signature()
+        cached = self._store_cache
+        if cached is not None and cached[0] == signature:
+            return cached
+        parsed = self._load_yaml_store(signature[0])
+        if parsed is None:
+            yaml_store, yaml_max, yaml_by_id = MemoryStore(), 0, {}
+        else:
+            yaml_store, yaml_max, yaml_by_id = parsed
+        replayed = self._replay_journal(signature[1], yaml_by_id, yaml_max)
+        cached = (
+            signature,
+            # Entries were validated when parsed/replayed
+            MemoryStore.model_construct(memories=[*yaml_store.memories, *replayed]),
+            max(yaml_max, _max_id_number(replayed)),
+        )
+        if parsed is not None:
+            self._store_cache = cached
+        return cached
+
+    def _load_yaml_store(
+        self, signature: _FileSignature | None
+    ) -> tuple[MemoryStore, int, dict[str, MemoryEntry]] | None:
+        """Parse memory-store.yaml at *signature*; None if it is unreadable."""
+        if signature is None:
+            return MemoryStore(), 0, {}
+        cached = self._yaml_cache
+        if cached is not None and cached[0] == signature:
+            return cached[1:]
         try:
-            data = yaml.safe_load(self._store_path.read_text()) or {}
-            return MemoryStore(**data)
+            data = yaml.load(self._store_path.read_text(), Loader=_YamlLoader) or {}
+            store = MemoryStore(**data)
         except (yaml.YAMLError, OSError, ValueError):
             logger.exception("Failed to load memory store from %s", self._store_path)
-            return MemoryStore()
+            return None
+        for m in store.memories:
+            _share_labels(m)
+        self._yaml_cache = (
+            signature,
+            store,
+            _max_id_number(store.memories),
+            {m.id: m for m in store.memories},
+        )
+        return self._yaml_cache[1:]
+
+    def _replay_journal(
+        self,
+        signature: _FileSignature | None,
+        known: dict[str, MemoryEntry],
+        known_max: int,
+    ) -> list[MemoryEntry]:
+        """Entries appended to the journal that aren't in *known* yet.
+
+        Entries already in the YAML (left behind by a compaction that
+        was interrupted before removing the journal) and unreadable
+        lines (e.g. a write torn by a crash) are skipped. A different
+        memory under an ID that's already taken (another tool writing
+        the YAML directly) is kept under a fresh ID above *known_max*.
+        """
+        self._journal_lines = 0
+        if signature is None:
+            return []
+        try:
+            data = self._journal_path.read_bytes()
+        except OSError:
+            logger.warning("Failed to read %s", self._journal_path, exc_info=True)
+            return []
+        entries: list[MemoryEntry] = []
+        collided: list[int] = []
+        seen = dict(known)
+        for line in data.splitlines():
+            if not line.strip():
+                continue
+            self._journal_lines += 1
+            try:
+                entry = _share_labels(_MEMORY_ENTRY.validate_json(line))
+            except ValueError:
+                logger.warning("Skipping bad line in %s", self._journal_path)
+                continue
+            prior = seen.get(entry.id)
+            if prior is None:
+                seen[entry.id] = entry
+            elif (prior.timestamp, prior.content) == (entry.timestamp, entry.content):
+                continue
+            else:
+                collided.append(len(entries))
+            entries.append(entry)
+        if collided:
+            # Numbered after everything else so the new IDs are stable
+            # until the next compaction writes them out.
+            next_num = max(known_max, _max_id_number(entries))
+            for i in collided:
+                next_num += 1
+                old_id = entries[i].id
+                entries[i] = replace(entries[i], id=f"mem-{next_num:03d}")
+                logger.warning(
+                    "Journaled memory %s collides with another memory; kept as %s",
+                    old_id,
+                    entries[i].id,
+                )
+        return entries
+
+    def _append_journal(self, entries: list[MemoryEntry]) -> None:
+        """Append *entries* to the journal in one write and fsync it.
+
+        If the store cache was current, it is extended with *entries*
+        rather than invalidated, so the next remember() needn't replay
+        the journal to find the highest ID.
+        """
+        self._ensure_dir()
+        line = b"".join(
+            orjson.dumps(e, option=orjson.OPT_APPEND_NEWLINE) for e in entries
+        )
+        with self._journal_path.open("a+b") as f:
+            st = os.fstat(f.fileno())
+            before = (st.st_ino, st.st_mtime_ns, st.st_size) if st.st_size else None
+            if st.st_size:
+                # Start on a fresh line if a previous write was torn
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    line = b"\n" + line
+            f.write(line)
+            f.flush()
+            os.fsync(f.fileno())
+            # Only our write may have happened in between (no other appender)
+            exclusive = os.fstat(f.fileno()).st_size == st.st_size + len(line)
+        self._journal_lines += len(entries)
+
+        cached = self._store_cache
+        signature = self._store_signature()
+        if exclusive and cached is not None and cached[0] == (signature[0], before):
+            self._store_cache = (
+                signature,
+                MemoryStore.model_construct(memories=[*cached[1].memories, *entries]),
+                max(cached[2], _max_id_number(entries)),
+            )
 
     def _save_store(self, store: MemoryStore) -> None:
-        """Save the memory store to disk."""
+        """Save the memory store to disk.
+
+        *store* replaces everything on disk, so the journal is dropped
+        once the YAML is written.
+        """
         self._ensure_dir()
-        data = {"memories": [m.model_dump() for m in store.memories]}
-        from amplifier_distro.fileutil import atomic_write
+        records = (_entry_to_dict(m) for m in store.memories)
+        from amplifier_distro.fileutil import atomic_write_stream
+
+        atomic_write_stream(
+            self._store_path,
+            lambda f: f.writelines(_iter_yaml_records("memories", records)),
+        )
+        signature = self._file_signature(self._store_path)
+        self._yaml_cache = (
+            None
+            if signature is None
+            else (
+                signature,
+                MemoryStore(memories=list(store.memories)),
+                _max_id_number(store.memories),
+                {m.id: m for m in store.memories},
+            )
+        )
+        self._journal_path.unlink(missing_ok=True)
+        self._journal_lines = 0
+
+    def compact(self) -> None:
+        """Fold journaled memories into memory-store.yaml and drop the journal.
+
+        Happens automatically as the journal grows; call it to bring the
+        YAML file fully up to date (e.g. before another tool reads it).
+        """
+        with self._write_lock:
+            self._write_pending(set())
+            self._compact()
+
+    def _write_pending(self, mem_ids: set[str]) -> list[MemoryEntry]:
+        """Journal the pending *mem_ids* plus any whose earlier write failed.
 
-        atomic_write(self._store_path, yaml.dump(data, default_flow_style=False))
+        Written entries leave the pending set; on failure they all stay
+        in it (still recallable) and are retried by the next call.
+        """
+        retry = mem_ids | self._unwritten
+        entries = [e for i, e in self._pending.items() if i in retry]
+        if not entries:
+            return entries
+        try:
+            self._append_journal(entries)
+        except Exception:
+            self._unwritten.update(e.id for e in entries)
+            raise
+        for e in entries:
+            del self._pending[e.id]
+            self._unwritten.discard(e.id)
+        return entries
+
+    def _compact(self) -> None:
+        if self._file_signature(self._journal_path) is None:
+            return
+        self._save_store(self._load_store())
 
     def _load_work_log(self) -> WorkLog:
-        """Load the work log from disk."""
-        if not self._work_log_path.exists():
+        """Load the work log from disk, reusing the last parse if unchanged."""
+        signature = self._file_signature(self._work_log_path)
+        if signature is None:
             return WorkLog()
+        cached = self._work_log_cache
+        if cached is not None and cached[0] == signature:
+            return WorkLog(items=list(cached[1].items))
         try:
-            data = yaml.safe_load(self._work_log_path.read_text()) or {}
-            return WorkLog(**data)
+            data = yaml.load(self._work_log_path.read_text(), Loader=_YamlLoader) or {}
+            log = WorkLog(**data)
         except (yaml.YAMLError, OSError, ValueError):
             logger.exception("Failed to load work log from %s", self._work_log_path)
             return WorkLog()
+        self._work_log_cache = (signature, log)
+        return WorkLog(items=list(log.items))
 
     def _save_work_log(self, log: WorkLog) -> None:
         """Save the work log to disk."""
         self._ensure_dir()
-        data = {"items": [item.model_dump() for item in log.items]}
-        from amplifier_distro.fileutil import atomic_write
+        records = (_work_item_to_dict(item) for item in log.items)
+        from amplifier_distro.fileutil import atomic_write_stream
 
-        atomic_write(self._work_log_path, yaml.dump(data, default_flow_style=False))
+        atomic_write_stream(
+            self._work_log_path,
+            lambda f: f.writelines(_iter_yaml_records("items", records)),
+        )
+        signature = self._file_signature(self._work_log_path)
+        self._work_log_cache = (
+            None if signature is None else (signature, WorkLog(items=list(log.items)))
+        )
 
-    def _next_id(self, store: MemoryStore) -> str:
-        """Generate the next memory ID (mem-001, mem-002, etc.)."""
-        if not store.memories:
-            return "mem-001"
-        # Extract numeric suffixes from existing IDs
-        max_num = 0
-        for m in store.memories:
-            match = re.match(r"mem-(\d+)", m.id)
-            if match:
-                max_num = max(max_num, int(match.group(1)))
-        return f"mem-{max_num + 1:03d}"
+    def _next_id(self, stored_max: int) -> str:
+        """Generate the next memory ID (mem-001, mem-002, etc.).
+
+        Args:
+            stored_max: Highest numeric ID already in the store file.
+                Pending (not yet written) entries are accounted for here.
+        """
+        return self._next_ids(stored_max, 1)[0]
+
+    def _next_ids(self, stored_max: int, count: int) -> list[str]:
+        """Generate the next *count* consecutive memory IDs."""
+        max_num = max(stored_max, _max_id_number(self._pending.values()))
+        return [f"mem-{max_num + i:03d}" for i in range(1, count + 1)]
 
-    def _auto_categorize(self, text: str) -> str:
-        """Auto-categorize a memory based on keyword matching.
+    def _auto_categorize(self, hits: frozenset[str]) -> str:
+        """Auto-categorize a memory from its keyword hits.
 
         Returns the best-matching category, or 'general' if no match.
         """
-        text_lower = text.lower()
         best_category = "general"
         best_score = 0
 
         for category, keywords in _CATEGORY_KEYWORDS.items():
-            score = sum(1 for kw in keywords if kw in text_lower)
+            score = sum(1 for kw in keywords if kw in hits)
             if score > best_score:
                 best_score = score
                 best_category = category
 
         return best_category
 
-    def _auto_tags(self, text: str, category: str) -> list[str]:
-        """Extract auto-generated tags from memory text.
+    def _auto_tags(self, hits: frozenset[str], category: str) -> list[str]:
+        """Extract auto-generated tags from a memory's keyword hits.
 
         Tags are derived from the category and significant words.
         """
         tags = [category]
+        seen = {category}
 
         # Add tags for any category keywords found in the text
-        text_lower = text.lower()
         for cat, keywords in _CATEGORY_KEYWORDS.items():
             if cat == category:
                 continue
             for kw in keywords:
-                if kw in text_lower and kw not in tags:
+                if kw in hits and kw not in seen:
+                    seen.add(kw)
                     tags.append(kw)
                     break  # One tag per secondary category
 
@@ -313,30 +733,112 @@ class MemoryService:
         Returns:
             Dict with the stored memory entry details.
         """
-        store = self._load_store()
-        mem_id = self._next_id(store)
-        category = self._auto_categorize(text)
-        tags = self._auto_tags(text, category)
-        timestamp = datetime.now(UTC).isoformat()
+        result = self.remember_begin(text)
+        self.remember_finalize(result["id"])
+        return result
+
+    def remember_many(self, texts: list[str]) -> list[dict[str, Any]]:
+        """Store several memories at once, e.g. for an import.
+
+        Like calling remember() per text, but IDs are allocated and the
+        entries written under a single lock, with one journal write.
+
+        Args:
+            texts: The memory contents to store, in order.
 
-        entry = MemoryEntry(
-            id=mem_id,
-            timestamp=timestamp,
-            category=category,
-            content=text,
-            tags=tags,
+        Returns:
+            List of dicts with the stored memory entry details.
+        """
+        if not texts:
+            return []
+        # One timestamp for the whole batch: it was stored in one action
+        timestamp = datetime.now(UTC).isoformat()
+        classified = []
+        for text in texts:
+            hits = _keyword_hits(text)
+            category = self._auto_categorize(hits)
+            classified.append((text, category, self._auto_tags(hits, category)))
+
+        with self._write_lock:
+            _, stored_max = self._cached_store()
+            mem_ids = self._next_ids(stored_max, len(classified))
+            entries = [
+                MemoryEntry(
+                    id=mem_id,
+                    timestamp=timestamp,
+                    category=category,
+                    content=text,
+                    tags=tags,
+                )
+                for mem_id, (text, category, tags) in zip(
+                    mem_ids, classified, strict=True
+                )
+            ]
+            self._append_journal(entries)
+            if self._journal_lines >= _JOURNAL_COMPACT_LINES:
+                self._compact()
+
+        logger.info(
+            "Stored %d memories (%s..%s)", len(entries), mem_ids[0], mem_ids[-1]
         )
-        store.memories.append(entry)
-        self._save_store(store)
+        return [_entry_to_dict(e) for e in entries]
+
+    def remember_begin(self, text: str) -> dict[str, Any]:
+        """Build a memory entry and reserve its ID without writing it.
+
+        The entry is visible to recall() immediately; call
+        remember_finalize() with the returned ID to persist it.
+
+        Args:
+            text: The memory content to store.
+
+        Returns:
+            Dict with the new memory entry details.
+        """
+        hits = _keyword_hits(text)
+        category = self._auto_categorize(hits)
+        tags = self._auto_tags(hits, category)
+        timestamp = datetime.now(UTC).isoformat()
+
+        with self._write_lock:
+            _, stored_max = self._cached_store()
+            mem_id = self._next_id(stored_max)
+            entry = MemoryEntry(
+                id=mem_id,
+                timestamp=timestamp,
+                category=category,
+                content=text,
+                tags=tags,
+            )
+            self._pending[mem_id] = entry
+        return _entry_to_dict(entry)
 
-        logger.info("Stored memory %s (category: %s)", mem_id, category)
-        return entry.model_dump()
+    def remember_finalize(self, mem_id: str) -> None:
+        """Write a memory reserved by remember_begin() to the store.
+
+        Unknown or already-written IDs are ignored. If the write fails
+        the entry stays pending, so it is still recalled and is retried
+        by the next remember_finalize() or compact().
+
+        Args:
+            mem_id: ID returned by remember_begin().
+        """
+        with self._write_lock:
+            if mem_id not in self._pending:
+                return
+            written = self._write_pending({mem_id})
+            if self._journal_lines >= _JOURNAL_COMPACT_LINES:
+                self._compact()
+
+        for entry in written:
+            logger.info("Stored memory %s (category: %s)", entry.id, entry.category)
 
     def recall(self, query: str) -> list[dict[str, Any]]:
         """Search memories by content, tags, and category.
 
         Uses case-insensitive substring matching across content, tags,
-        and category fields.
+        and category fields. Results are memoized per query until the
+        store files change.
 
         Args:
             query: Search query string.
@@ -344,25 +846,58 @@ class MemoryService:
         Returns:
             List of matching memory entries as dicts.
         """
-        store = self._load_store()
         query_lower = query.lower()
-        results = []
-
-        for m in store.memories:
-            # Match against content
-            if query_lower in m.content.lower():
-                results.append(m.model_dump())
-                continue
-            # Match against category
-            if query_lower in m.category.lower():
-                results.append(m.model_dump())
-                continue
-            # Match against tags
-            if any(query_lower in tag.lower() for tag in m.tags):
-                results.append(m.model_dump())
-                continue
-
-        return results
+        # Snapshot pending entries before loading the store so an entry
+        # finalized in between is seen at least once.
+        pending = list(self._pending.values())
+        signature = self._store_signature()
+        if signature != self._recall_cache_sig:
+            self._recall_cache.clear()
+            self._recall_cache_sig = signature
+        cached = None if pending else self._recall_cache.get(query_lower)
+        if cached is not None:
+            return [_copy_result(m) for m in cached]
+
+        rows = self._search_rows(signature)
+        if pending:
+            stored_ids = {row[2]["id"] for row in rows}
+            rows = [
+                *rows,
+                *(_search_row(m) for m in pending if m.id not in stored_ids),
+            ]
+
+        # Match against content, category and tags. A query without the
+        # separator can't straddle two fields, so one search of the
+        # haystack will do.
+        if _FIELD_SEP in query_lower:
+            matched = [r for r in rows if any(query_lower in f for f in r[1])]
+        else:
+            matched = [r for r in rows if query_lower in r[0]]
+        results = [_copy_result(dump) for _, _, dump in matched]
+
+        if pending:
+            # New pending entries don't change the store signature, so
+            # results that depend on them can't be cached safely.
+            return results
+        if len(self._recall_cache) >= _RECALL_CACHE_SIZE:
+            # Evict the oldest query (dicts keep insertion order)
+            del self._recall_cache[next(iter(self._recall_cache))]
+        self._recall_cache[query_lower] = results
+        return [_copy_result(m) for m in results]
+
+    def _search_rows(self, signature: _StoreSignature) -> list[_SearchRow]:
+        """Pre-lowercased search rows for the store at *signature*.
+
+        Built once per store version so recall() neither re-lowercases
+        every field nor re-dumps every model per query.
+        """
+        cached = self._search_index
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        with self._write_lock:
+            rows = [_search_row(m) for m in self._cached_store()[0].memories]
+            self._search_index = (signature, rows)
+        return rows
 
     def work_status(self) -> dict[str, Any]:
         """Read the current work log.
@@ -371,7 +906,7 @@ class MemoryService:
             Dict with work log items.
         """
         log = self._load_work_log()
-        return {"items": [item.model_dump() for item in log.items]}
+        return {"items": [_work_item_to_dict(item) for item in log.items]}
 
     def update_work_log(self, items: list[dict[str, Any]]) -> dict[str, Any]:
         """Update the work log with new items.
@@ -383,19 +918,22 @@ class MemoryService:
             Dict with the updated work log items.
         """
         timestamp = datetime.now(UTC).isoformat()
-        log_items = [
-            WorkLogItem(
-                task=item.get("task", ""),
-                status=item.get("status", "pending"),
-                updated=item.get("updated", timestamp),
-            )
+        normalized = [
+            {
+                "task": item.get("task", ""),
+                "status": item.get("status", "pending"),
+                "updated": item.get("updated", timestamp),
+            }
             for item in items
         ]
-        log = WorkLog(items=log_items)
-        self._save_work_log(log)
+        # Validation only rejects bad types here (lax str validation
+        # merely decodes bytes, which JSON input can't contain), so the
+        # normalized dicts are returned as-is rather than dumped again.
+        log_items = [_WORK_LOG_ITEM.validate_python(item) for item in normalized]
+        self._save_work_log(WorkLog(items=log_items))
 
         logger.info("Updated work log with %d items", len(log_items))
-        return {"items": [item.model_dump() for item in log.items]}
+        return {"items": normalized}
 
 
 # --- Module-level singleton ---
@@ -414,6 +952,10 @@ def get_memory_service(memory_dir: Path | None = None) -> MemoryService:
         The MemoryService instance.
     """
     global _instance
+    instance = _instance
+    if instance is not None:
+        # Fast path: no lock once the singleton exists.
+        return instance
     with _instance_lock:
         if _instance is None:
             _instance = MemoryService(memory_dir=memory_dir)
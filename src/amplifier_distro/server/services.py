@@ -109,12 +109,14 @@ def get_services() -> ServerServices:
 
     Raises RuntimeError if services haven't been initialized.
     """
-    with _instance_lock:
-        if _instance is None:
-            raise RuntimeError(
-                "Server services not initialized. Call init_services() first."
-            )
-        return _instance
+    # No lock: this never creates the instance, and reading the global
+    # is atomic, so per-request callers don't contend on _instance_lock.
+    instance = _instance
+    if instance is None:
+        raise RuntimeError(
+            "Server services not initialized. Call init_services() first."
+        )
+    return instance
 
 
 def reset_services() -> None:
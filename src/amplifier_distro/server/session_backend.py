@@ -15,13 +15,36 @@ server level so all apps share a single session pool.
 from __future__ import annotations
 
 import asyncio
-import contextlib
 import logging
-from dataclasses import dataclass
+import random
+import re
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
 from typing import Any, Protocol, runtime_checkable
 
 logger = logging.getLogger(__name__)
 
+# Reconnect backoff: after a server restart every surface resumes at once,
+# so transient resume failures are retried with full-jitter exponential
+# backoff instead of failing the session permanently.  Only errors that can
+# clear up by themselves qualify; the RuntimeErrors LocalBridge raises
+# (foundation missing, no bundle configured, bundle fails to load) won't.
+_RECONNECT_TRANSIENT_ERRORS = (
+    ConnectionError,
+    TimeoutError,
+    BlockingIOError,
+    InterruptedError,
+)
+_RECONNECT_ATTEMPTS = 5
+_RECONNECT_BASE_DELAY = 0.1
+_RECONNECT_MAX_DELAY = 30.0
+# Source of the reconnect jitter
+_jitter = random.SystemRandom()
+# Reconnects are serialized per session through a fixed array of striped
+# locks, so the cold path allocates nothing and no lock ever goes away
+# while another coroutine is still waiting on it.
+_RECONNECT_STRIPES = 64
+
 
 @dataclass
 class SessionInfo:
@@ -36,6 +59,18 @@ class SessionInfo:
     description: str = ""
 
 
+@dataclass(slots=True)
+class _SessionEntry:
+    """BridgeBackend's state for one live session, kept in a single table."""
+
+    handle: Any  # SessionHandle
+    # Built once per handle and shared by get_session_info() and
+    # list_active_sessions() (callers only read it)
+    info: SessionInfo | None = None
+    # Serializes handle.run() calls (FIFO)
+    run_lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+
 @runtime_checkable
 class SessionBackend(Protocol):
     """Protocol for Amplifier session interaction.
@@ -58,6 +93,10 @@ class SessionBackend(Protocol):
         """Send a message to a session. Returns the response text."""
         ...
 
+    def stream_message(self, session_id: str, message: str) -> AsyncIterator[str]:
+        """Send a message to a session. Yields response text chunks as produced."""
+        ...
+
     async def end_session(self, session_id: str) -> None:
         """End a session and clean up."""
         ...
@@ -148,6 +187,12 @@ class MockBackend:
         )
         return response
 
+    async def stream_message(self, session_id: str, message: str) -> AsyncIterator[str]:
+        """Stream the send_message() response back one word at a time."""
+        response = await self.send_message(session_id, message)
+        for chunk in re.findall(r"\s*\S+|\s+$", response):
+            yield chunk
+
     async def end_session(self, session_id: str) -> None:
         if session_id in self._sessions:
             self._sessions[session_id].is_active = False
@@ -187,12 +232,11 @@ class BridgeBackend:
         from amplifier_distro.bridge import LocalBridge
 
         self._bridge = LocalBridge()
-        self._sessions: dict[str, Any] = {}  # session_id -> SessionHandle
-        self._reconnect_locks: dict[str, asyncio.Lock] = {}
-        # Per-session FIFO queues for serializing handle.run() calls
-        self._session_queues: dict[str, asyncio.Queue] = {}
-        # Worker tasks draining each session queue
-        self._worker_tasks: dict[str, asyncio.Task] = {}
+        # session_id -> handle, cached info and run lock
+        self._sessions: dict[str, _SessionEntry] = {}
+        self._reconnect_stripes = [asyncio.Lock() for _ in range(_RECONNECT_STRIPES)]
+        # Queued and in-flight run tasks -> their session_id
+        self._runs: dict[asyncio.Task, str] = {}
         # Tombstone: sessions that were intentionally ended (blocks reconnect)
         self._ended_sessions: set[str] = set()
 
@@ -212,64 +256,56 @@ class BridgeBackend:
             run_preflight=False,  # Server already validated
         )
         handle = await self._bridge.create_session(config)
-        self._sessions[handle.session_id] = handle
-
-        # Pre-start the session worker so the first message doesn't pay
-        # the task-creation overhead, and so the worker is available for
-        # reconnect paths that also route through the queue.
-        queue: asyncio.Queue = asyncio.Queue()
-        self._session_queues[handle.session_id] = queue
-        self._worker_tasks[handle.session_id] = asyncio.create_task(
-            self._session_worker(handle.session_id)
-        )
-
-        return SessionInfo(
+        info = SessionInfo(
             session_id=handle.session_id,
             project_id=handle.project_id,
             working_dir=str(handle.working_dir),
             is_active=True,
             description=description,
         )
+        self._sessions[handle.session_id] = _SessionEntry(handle, info)
+        return info
 
     async def send_message(self, session_id: str, message: str) -> str:
-        handle = self._sessions.get(session_id)
-        if handle is None:
-            # Session handle lost (server restart). Use per-session lock
-            # to prevent concurrent reconnects for the same session_id.
-            lock = self._reconnect_locks.setdefault(session_id, asyncio.Lock())
-            try:
-                async with lock:
-                    # Double-check: another coroutine may have reconnected
-                    # while we waited for the lock.
-                    handle = self._sessions.get(session_id)
-                    if handle is None:
-                        handle = await self._reconnect(session_id)
-            finally:
-                # Clean up lock entry on both success and failure paths
-                self._reconnect_locks.pop(session_id, None)
-
-        # Route through the per-session queue so concurrent calls serialize
-        if session_id not in self._session_queues:
-            self._session_queues[session_id] = asyncio.Queue()
-        if (
-            session_id not in self._worker_tasks
-            or self._worker_tasks[session_id].done()
-        ):
-            self._worker_tasks[session_id] = asyncio.create_task(
-                self._session_worker(session_id)
-            )
-
-        loop = asyncio.get_event_loop()
-        future: asyncio.Future[str] = loop.create_future()
-        await self._session_queues[session_id].put((message, future))
-        return await future
+        entry = self._sessions.get(session_id)
+        if entry is None:
+            # Session handle lost (server restart). The session's lock stripe
+            # prevents concurrent reconnects for the same session_id.
+            stripes = self._reconnect_stripes
+            async with stripes[hash(session_id) % len(stripes)]:
+                # Double-check: another coroutine may have reconnected
+                # while we waited for the lock.
+                entry = self._sessions.get(session_id)
+                if entry is None:
+                    await self._reconnect(session_id)
+                    entry = self._sessions[session_id]
+
+        # Serialize on the session's run lock. The run gets its own task,
+        # shielded so a cancelled caller (e.g. a dropped stream) doesn't
+        # abort handle.run() halfway or let the next message overtake it.
+        run = asyncio.ensure_future(self._run_serialized(entry, session_id, message))
+        self._runs[run] = session_id
+        run.add_done_callback(self._runs.pop)
+        return await asyncio.shield(run)
+
+    async def stream_message(self, session_id: str, message: str) -> AsyncIterator[str]:
+        """Stream a response, serialized with send_message() per session.
+
+        handle.run() only returns the finished reply, so for now the whole
+        response arrives as a single chunk. Callers still get the streaming
+        contract, and finer-grained chunks can be fed in once the bridge
+        exposes content deltas.
+        """
+        yield await self.send_message(session_id, message)
 
     async def _reconnect(self, session_id: str) -> Any:
         """Attempt to resume a session whose handle was lost (e.g. after restart).
 
         On success the handle is cached so subsequent messages don't pay
-        the resume cost again.  On failure the original ValueError is raised
-        so callers see the same error they would have before.
+        the resume cost again.  Transient failures (connection errors,
+        timeouts) are retried with full-jitter exponential backoff; anything
+        else fails fast.  On failure the original ValueError is raised so
+        callers see the same error they would have before.
         """
         if session_id in self._ended_sessions:
             raise ValueError(
@@ -277,154 +313,126 @@ class BridgeBackend:
                 " and cannot be reconnected"
             )
         logger.info(f"Attempting to reconnect lost session {session_id}")
-        try:
-            handle = await self._bridge.resume_session(session_id)
-            self._sessions[session_id] = handle
+        last_err: Exception | None = None
+        for attempt in range(_RECONNECT_ATTEMPTS):
+            if last_err is not None:
+                delay = _jitter.uniform(
+                    0,
+                    min(
+                        _RECONNECT_MAX_DELAY, _RECONNECT_BASE_DELAY * 2 ** (attempt - 1)
+                    ),
+                )
+                logger.info(
+                    f"Retrying reconnect of session {session_id} in {delay:.2f}s"
+                    f" ({last_err})"
+                )
+                await asyncio.sleep(delay)
+            try:
+                handle = await self._bridge.resume_session(session_id)
+            except _RECONNECT_TRANSIENT_ERRORS as err:
+                last_err = err
+                continue
+            except (FileNotFoundError, ValueError, RuntimeError, OSError) as err:
+                logger.warning(
+                    f"Failed to reconnect session {session_id}", exc_info=True
+                )
+                raise ValueError(f"Unknown session: {session_id}") from err
+            self._sessions[session_id] = _SessionEntry(handle)
             logger.info(f"Reconnected session {session_id}")
             return handle
-        except (FileNotFoundError, ValueError, RuntimeError, OSError) as err:
-            logger.warning(f"Failed to reconnect session {session_id}", exc_info=True)
-            raise ValueError(f"Unknown session: {session_id}") from err
+        logger.warning(
+            f"Failed to reconnect session {session_id}"
+            f" after {_RECONNECT_ATTEMPTS} attempts",
+            exc_info=last_err,
+        )
+        raise ValueError(f"Unknown session: {session_id}") from last_err
 
-    async def _session_worker(self, session_id: str) -> None:
-        """Drain the session queue, running handle.run() calls sequentially.
+    async def _run_serialized(
+        self, entry: _SessionEntry, session_id: str, message: str
+    ) -> str:
+        """Run handle.run(message) once the session's earlier runs are done.
 
-        Receives (message, future) tuples from the queue.  A ``None``
-        sentinel signals the worker to exit cleanly (used by end_session
-        and stop).  On CancelledError, drains remaining futures with
-        cancellation so callers don't wait forever.
+        The entry is re-checked after acquiring the lock, so messages
+        still waiting when end_session() pops it fail with ValueError.
         """
-        queue = self._session_queues[session_id]
-        while True:
-            try:
-                item = await queue.get()
-            except asyncio.CancelledError:
-                # Drain remaining items and cancel their futures
-                while not queue.empty():
-                    try:
-                        pending_item = queue.get_nowait()
-                        if pending_item is not None:
-                            _, fut = pending_item
-                            if not fut.done():
-                                fut.cancel()
-                        queue.task_done()
-                    except asyncio.QueueEmpty:
-                        break
-                raise
-
-            if item is None:
-                # Sentinel — exit cleanly
-                queue.task_done()
-                break
-
-            message, future = item
-            try:
-                handle = self._sessions.get(session_id)
-                if handle is None:
-                    future.set_exception(
-                        ValueError(f"Session {session_id} handle not found")
-                    )
-                else:
-                    result = await handle.run(message)
-                    if not future.done():
-                        future.set_result(result)
-            except asyncio.CancelledError:
-                if not future.done():
-                    future.cancel()
-                # No task_done() here — finally handles it for all paths
-                raise
-            except Exception as exc:  # noqa: BLE001
-                if not future.done():
-                    future.set_exception(exc)
-            finally:
-                queue.task_done()  # exactly one call per item, all exit paths
+        async with entry.run_lock:
+            if self._sessions.get(session_id) is not entry:
+                raise ValueError(f"Session {session_id} handle not found")
+            return await entry.handle.run(message)
+
+    @staticmethod
+    async def _drain_runs(entry: _SessionEntry) -> None:
+        """Wait until every run queued so far on *entry* has finished."""
+        async with entry.run_lock:
+            pass
+
+    async def _cancel_runs(self, session_id: str | None = None) -> None:
+        """Cancel the queued and in-flight runs of *session_id* (or all)."""
+        runs = [t for t, sid in self._runs.items() if session_id in (None, sid)]
+        for run in runs:
+            run.cancel()
+        if runs:
+            await asyncio.wait(runs)
 
     async def end_session(self, session_id: str) -> None:
         # Tombstone first — prevents _reconnect() from reviving this session
         self._ended_sessions.add(session_id)
 
-        # Pop handle before signalling the worker so the worker sees no handle
-        # and rejects any racing messages with ValueError
-        handle = self._sessions.pop(session_id, None)
-
-        # Signal worker to exit cleanly via sentinel
-        queue = self._session_queues.get(session_id)
-        if queue is not None:
-            await queue.put(None)
+        # Pop the entry before draining so queued messages see no handle
+        # and are rejected with ValueError
+        entry = self._sessions.pop(session_id, None)
+        if entry is None:
+            return
 
         # Wait up to 5 s for in-flight work to drain
-        worker = self._worker_tasks.get(session_id)
-        if worker is not None and not worker.done():
-            try:
-                await asyncio.wait_for(asyncio.shield(worker), timeout=5.0)
-            except TimeoutError:
-                logger.warning(
-                    "Session worker %s did not drain in 5s, cancelling", session_id
-                )
-                worker.cancel()
-                with contextlib.suppress(asyncio.CancelledError):
-                    await worker
-
-        # Drain any remaining queued futures (unlikely but safe)
-        if queue is not None:
-            while not queue.empty():
-                try:
-                    item = queue.get_nowait()
-                    if item is not None:
-                        _, fut = item
-                        if not fut.done():
-                            fut.cancel()
-                except asyncio.QueueEmpty:
-                    break
-
-        # Clean up references
-        self._session_queues.pop(session_id, None)
-        self._worker_tasks.pop(session_id, None)
-
-        if handle:
-            await self._bridge.end_session(handle)
+        try:
+            await asyncio.wait_for(self._drain_runs(entry), timeout=5.0)
+        except TimeoutError:
+            logger.warning("Session run %s did not drain in 5s, cancelling", session_id)
+            await self._cancel_runs(session_id)
+
+        await self._bridge.end_session(entry.handle)
 
     async def stop(self) -> None:
-        """Gracefully stop all session workers.
+        """Gracefully stop all session runs.
 
-        Sends the None sentinel to every active queue, then waits up to
-        10 s for workers to drain.  Remaining workers are cancelled.
+        Waits up to 10 s for queued and in-flight handle.run() calls to
+        finish, then cancels whatever is still running.
         Must be called during server shutdown.
         """
-        for queue in list(self._session_queues.values()):
-            await queue.put(None)
-
-        if self._worker_tasks:
-            workers = [t for t in self._worker_tasks.values() if not t.done()]
-            if workers:
-                _, still_pending = await asyncio.wait(workers, timeout=10.0)
+        if self._sessions:
+            drains = [
+                asyncio.create_task(self._drain_runs(entry))
+                for entry in self._sessions.values()
+            ]
+            _, still_pending = await asyncio.wait(drains, timeout=10.0)
+            if still_pending:
                 for task in still_pending:
                     task.cancel()
-                    with contextlib.suppress(asyncio.CancelledError):
-                        await task
-
-        self._session_queues.clear()
-        self._worker_tasks.clear()
+                await self._cancel_runs()
+                await asyncio.wait(still_pending)
+
+    @staticmethod
+    def _session_info(entry: _SessionEntry) -> SessionInfo:
+        """The cached SessionInfo for *entry*, built on first use."""
+        info = entry.info
+        if info is None:
+            handle = entry.handle
+            info = entry.info = SessionInfo(
+                session_id=handle.session_id,
+                project_id=handle.project_id,
+                working_dir=str(handle.working_dir),
+            )
+        return info
 
     async def get_session_info(self, session_id: str) -> SessionInfo | None:
-        handle = self._sessions.get(session_id)
-        if handle is None:
+        entry = self._sessions.get(session_id)
+        if entry is None:
             return None
-        return SessionInfo(
-            session_id=handle.session_id,
-            project_id=handle.project_id,
-            working_dir=str(handle.working_dir),
-        )
+        return self._session_info(entry)
 
     def list_active_sessions(self) -> list[SessionInfo]:
-        return [
-            SessionInfo(
-                session_id=h.session_id,
-                project_id=h.project_id,
-                working_dir=str(h.working_dir),
-            )
-            for h in self._sessions.values()
-        ]
+        return [self._session_info(entry) for entry in self._sessions.values()]
 
     async def resume_session(self, session_id: str, working_dir: str) -> None:
         """Restore the LLM context for a session after a server restart.
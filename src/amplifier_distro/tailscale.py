@@ -24,7 +24,7 @@ def get_dns_name() -> str | None:
             ["tailscale", "status", "--json"],
             capture_output=True,
             text=True,
-            timeout=5,
+            timeout=1,
         )
         if result.returncode != 0:
             return None
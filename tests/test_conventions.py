@@ -41,6 +41,9 @@ class TestCanonicalValues:
     def test_memory_store_filename(self):
         assert conventions.MEMORY_STORE_FILENAME == "memory-store.yaml"
 
+    def test_memory_journal_filename(self):
+        assert conventions.MEMORY_JOURNAL_FILENAME == "memory-store.jsonl"
+
     def test_work_log_filename(self):
         assert conventions.WORK_LOG_FILENAME == "work-log.yaml"
 
@@ -143,6 +146,7 @@ class TestStringConstants:
     FILENAME_CONSTANTS = [
         "DISTRO_CONFIG_FILENAME",
         "MEMORY_STORE_FILENAME",
+        "MEMORY_JOURNAL_FILENAME",
         "WORK_LOG_FILENAME",
         "PROJECT_NOTES_FILENAME",
         "TRANSCRIPT_FILENAME",
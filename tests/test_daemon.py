@@ -10,10 +10,16 @@ Tests cover:
 """
 
 import configparser
+import http.server
 import json
 import logging
 import logging.handlers
 import os
+import signal
+import subprocess
+import sys
+import threading
+import time
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -27,6 +33,7 @@ from amplifier_distro.server.daemon import (
     pid_file_path,
     read_pid,
     server_dir,
+    stop_process,
     write_pid,
 )
 from amplifier_distro.server.startup import (
@@ -115,6 +122,21 @@ class TestIsRunning:
     def test_returns_false_for_missing_file(self, tmp_path: Path) -> None:
         assert is_running(tmp_path / "nonexistent.pid") is False
 
+    @pytest.mark.skipif(sys.platform != "linux", reason="reads /proc")
+    def test_returns_false_for_zombie(self, tmp_path: Path) -> None:
+        proc = subprocess.Popen([sys.executable, "-c", "pass"])
+        try:
+            # Wait for the child to exit without reaping it
+            deadline = time.monotonic() + 5
+            stat = Path(f"/proc/{proc.pid}/stat")
+            while b") Z" not in stat.read_bytes() and time.monotonic() < deadline:
+                time.sleep(0.01)
+            pid_file = tmp_path / "test.pid"
+            write_pid(pid_file, proc.pid)
+            assert is_running(pid_file) is False
+        finally:
+            proc.wait()
+
 
 # ---------------------------------------------------------------------------
 # Path construction from conventions
@@ -134,6 +156,13 @@ class TestPathConstruction:
         assert p.name == conventions.SERVER_PID_FILE
         assert p.parent.name == conventions.SERVER_DIR
 
+    def test_paths_follow_home_changes(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        server_dir()
+        monkeypatch.setenv("HOME", str(tmp_path))
+        assert pid_file_path().is_relative_to(tmp_path)
+
     def test_log_file_path_uses_conventions(self) -> None:
         p = log_file_path()
         assert p.name == conventions.SERVER_LOG_FILE
@@ -149,6 +178,134 @@ class TestPathConstruction:
 # ---------------------------------------------------------------------------
 
 
+class TestStopProcess:
+    """Verify stop_process waits for the process to exit."""
+
+    def test_stops_real_process(self, tmp_path: Path) -> None:
+        proc = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+        pid_file = tmp_path / "test.pid"
+        write_pid(pid_file, proc.pid)
+        # Reap in the background so the child doesn't linger as a zombie
+        reaper = threading.Thread(target=proc.wait)
+        reaper.start()
+        start = time.monotonic()
+        assert stop_process(pid_file, timeout=5) is True
+        reaper.join(timeout=5)
+        assert time.monotonic() - start < 5
+        assert proc.returncode == -signal.SIGTERM
+        assert not pid_file.exists()
+
+    def test_polling_fallback_without_pidfd(self, tmp_path: Path) -> None:
+        pid_file = tmp_path / "test.pid"
+        write_pid(pid_file, 4_000_000)
+        with (
+            patch("os.pidfd_open", side_effect=AttributeError, create=True),
+            patch("os.kill", side_effect=[None, ProcessLookupError]),
+        ):
+            assert stop_process(pid_file) is True
+        assert not pid_file.exists()
+
+
+class TestIsPortInUse:
+    """Verify the connect probe against real loopback sockets."""
+
+    def test_detects_listener(self) -> None:
+        import socket
+
+        from amplifier_distro.server.daemon import is_port_in_use
+
+        with socket.socket() as srv:
+            srv.bind(("127.0.0.1", 0))
+            srv.listen()
+            assert is_port_in_use("127.0.0.1", srv.getsockname()[1])
+
+    def test_closed_port_returns_false(self) -> None:
+        import socket
+
+        from amplifier_distro.server.daemon import is_port_in_use
+
+        with socket.socket() as s:
+            s.bind(("127.0.0.1", 0))
+            port = s.getsockname()[1]
+        assert not is_port_in_use("127.0.0.1", port, timeout=0.1)
+
+
+class _HealthHandler(http.server.BaseHTTPRequestHandler):
+    status = 200
+
+    def do_GET(self) -> None:
+        self.send_response(self.status if self.path == "/api/health" else 404)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"ok")
+
+    def log_message(self, *args: object) -> None:
+        pass
+
+
+@pytest.fixture
+def health_server():
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _HealthHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+    _HealthHandler.status = 200
+
+
+class TestWaitForHealth:
+    """Verify wait_for_health polling against real loopback sockets."""
+
+    def test_healthy_server(self, health_server) -> None:
+        from amplifier_distro.server.daemon import wait_for_health
+
+        port = health_server.server_address[1]
+        assert wait_for_health(port=port, timeout=2) is True
+
+    def test_unhealthy_status_is_not_accepted(self, health_server) -> None:
+        from amplifier_distro.server.daemon import wait_for_health
+
+        _HealthHandler.status = 503
+        port = health_server.server_address[1]
+        assert wait_for_health(port=port, timeout=0.3, interval=0.05) is False
+
+    def test_closed_port(self) -> None:
+        import socket
+
+        from amplifier_distro.server.daemon import wait_for_health
+
+        with socket.socket() as s:
+            s.bind(("127.0.0.1", 0))
+            port = s.getsockname()[1]
+        assert wait_for_health(port=port, timeout=0.2, interval=0.05) is False
+
+    def test_backoff_starts_short_and_caps_at_interval(self) -> None:
+        from amplifier_distro.server.daemon import wait_for_health
+
+        clock = [0.0]
+        delays: list[float] = []
+
+        def fake_sleep(seconds: float) -> None:
+            delays.append(seconds)
+            clock[0] += seconds
+
+        with (
+            patch("amplifier_distro.server.daemon._health_ok", return_value=False),
+            patch(
+                "amplifier_distro.server.daemon.time.monotonic",
+                side_effect=lambda: clock[0],
+            ),
+            patch("amplifier_distro.server.daemon.time.sleep", side_effect=fake_sleep),
+        ):
+            assert wait_for_health(timeout=2.0, interval=0.5) is False
+        assert 0.05 <= delays[0] <= 0.055
+        assert delays[1] > delays[0]
+        assert all(d <= 0.55 for d in delays)
+        # Never sleeps past the deadline
+        assert clock[0] == pytest.approx(2.0)
+
+
 class TestStartCommand:
     """Verify the 'start' subcommand spawns a daemon."""
 
@@ -231,6 +388,45 @@ class TestStopCommand:
         assert "No PID file" in result.output
 
 
+class TestRestartCommand:
+    """Verify 'restart' stops the old daemon and then launches a new one."""
+
+    def test_restart_stops_then_launches(self, tmp_path: Path) -> None:
+        pid_file = tmp_path / "test.pid"
+        pid_file.write_text("12345")
+        calls: list[str] = []
+
+        with (
+            patch(
+                "amplifier_distro.server.daemon.pid_file_path",
+                return_value=pid_file,
+            ),
+            patch("amplifier_distro.server.startup.load_env_file", return_value=[]),
+            patch(
+                "amplifier_distro.server.daemon.stop_process",
+                side_effect=lambda _pf: calls.append("stop") or True,
+            ),
+            patch(
+                "amplifier_distro.server.daemon.daemonize",
+                side_effect=lambda **_kw: calls.append("daemonize") or 999,
+            ) as mock_daemonize,
+            patch(
+                "amplifier_distro.server.daemon.wait_for_health",
+                return_value=True,
+            ),
+        ):
+            from amplifier_distro.server.cli import serve
+
+            runner = CliRunner()
+            result = runner.invoke(serve, ["restart", "--port", "9123"])
+
+        assert result.exit_code == 0, result.output
+        assert calls == ["stop", "daemonize"]
+        assert mock_daemonize.call_args.kwargs["port"] == 9123
+        assert "Server stopped." in result.output
+        assert "Server is healthy!" in result.output
+
+
 class TestStatusCommand:
     """Verify the 'status' subcommand reports correctly."""
 
@@ -266,6 +462,69 @@ class TestStatusCommand:
         assert not pid_file.exists()
 
 
+class TestCreateDefaultConfig:
+    """Verify identity probes feed the generated config."""
+
+    def test_uses_probe_results(self, tmp_path: Path) -> None:
+        from amplifier_distro.server.cli import _create_default_config
+
+        (tmp_path / ".gitconfig").write_text(
+            "[user]\n\tname = Me\n\temail = me@example.com\n"
+            '[includeIf "gitdir:~/work/"]\n\tpath = ~/.gitconfig-work\n'
+        )
+        completed = subprocess.CompletedProcess([], 0, stdout="octocat\n", stderr="")
+        with (
+            patch("subprocess.run", return_value=completed) as mock_run,
+            patch("amplifier_distro.config.save_config") as mock_save,
+            patch("pathlib.Path.home", return_value=tmp_path),
+        ):
+            _create_default_config()
+        cfg = mock_save.call_args.args[0]
+        assert cfg.identity.github_handle == "octocat"
+        assert cfg.identity.git_email == "me@example.com"
+        # git itself is never spawned; only gh is
+        assert [c.args[0][0] for c in mock_run.call_args_list] == ["gh"]
+
+    def test_git_email_survives_valueless_keys(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Bare boolean keys and inline comments are valid gitconfig syntax."""
+        from amplifier_distro.server.cli import _git_global_email
+
+        (tmp_path / ".gitconfig").write_text(
+            "[core]\n\tautocrlf\n[user]\n\temail = me@example.com  # work address\n"
+        )
+        monkeypatch.delenv("GIT_CONFIG_GLOBAL", raising=False)
+        monkeypatch.setattr(Path, "home", lambda: tmp_path)
+        assert _git_global_email() == "me@example.com"
+
+    def test_git_email_honours_git_config_global(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        from amplifier_distro.server.cli import _git_global_email
+
+        (tmp_path / ".gitconfig").write_text("[user]\n\temail = home@example.com\n")
+        override = tmp_path / "global.gitconfig"
+        override.write_text("[user]\n\temail = override@example.com\n")
+        monkeypatch.setenv("GIT_CONFIG_GLOBAL", str(override))
+        monkeypatch.setattr(Path, "home", lambda: tmp_path)
+        assert _git_global_email() == "override@example.com"
+
+    def test_missing_tools_leave_identity_blank(self, tmp_path: Path) -> None:
+        from amplifier_distro.server.cli import _create_default_config
+
+        with (
+            patch("subprocess.run", side_effect=FileNotFoundError),
+            patch("amplifier_distro.config.save_config") as mock_save,
+            patch("pathlib.Path.home", return_value=tmp_path),
+            patch.dict(os.environ, {"XDG_CONFIG_HOME": str(tmp_path / "xdg")}),
+        ):
+            _create_default_config()
+        cfg = mock_save.call_args.args[0]
+        assert cfg.identity.github_handle == ""
+        assert cfg.identity.git_email == ""
+
+
 # ---------------------------------------------------------------------------
 # Systemd service file validation
 # ---------------------------------------------------------------------------
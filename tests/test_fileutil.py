@@ -11,7 +11,7 @@ from unittest.mock import patch
 
 import pytest
 
-from amplifier_distro.fileutil import atomic_write
+from amplifier_distro.fileutil import atomic_write, atomic_write_stream
 
 
 class TestAtomicWrite:
@@ -95,3 +95,26 @@ class TestAtomicWrite:
         atomic_write(target, "content")
         tmp_files = list(tmp_path.glob("*.tmp"))
         assert tmp_files == []
+
+
+class TestAtomicWriteStream:
+    """Verify atomic_write_stream() has the same guarantees."""
+
+    def test_writes_streamed_content(self, tmp_path: Path) -> None:
+        target = tmp_path / "test.yaml"
+        atomic_write_stream(target, lambda f: f.writelines(["a\n", "b\n"]))
+        assert target.read_text() == "a\nb\n"
+
+    def test_preserves_original_when_writer_raises(self, tmp_path: Path) -> None:
+        target = tmp_path / "test.yaml"
+        target.write_text("original")
+
+        def _fail(f) -> None:
+            f.write("partial")
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError, match="boom"):
+            atomic_write_stream(target, _fail)
+
+        assert target.read_text() == "original"
+        assert list(tmp_path.glob("*.tmp")) == []
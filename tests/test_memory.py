@@ -16,12 +16,14 @@ Covers:
 from __future__ import annotations
 
 import asyncio
+import threading
 from pathlib import Path
 
 import pytest
 import yaml
 from starlette.testclient import TestClient
 
+from amplifier_distro.server import memory as memory_module
 from amplifier_distro.server.memory import (
     MemoryService,
     get_memory_service,
@@ -93,6 +95,7 @@ class TestMemoryRemember:
 
     def test_remember_persists_to_yaml(self, service: MemoryService):
         service.remember("Persisted memory")
+        service.compact()
         assert service.store_path.exists()
         data = yaml.safe_load(service.store_path.read_text())
         assert len(data["memories"]) == 1
@@ -103,7 +106,45 @@ class TestMemoryRemember:
         svc = MemoryService(memory_dir=new_dir)
         svc.remember("Create dirs")
         assert new_dir.exists()
-        assert svc.store_path.exists()
+        assert svc.journal_path.exists()
+
+
+class TestRememberMany:
+    """remember_many() stores a batch with one ID allocation and one write."""
+
+    def test_assigns_consecutive_ids(self, service: MemoryService):
+        service.remember("First")
+        results = service.remember_many(["Second", "Use git rebase"])
+        assert [r["id"] for r in results] == ["mem-002", "mem-003"]
+        assert results[1]["category"] == "git"
+
+    def test_batch_is_persisted(self, service: MemoryService, memory_dir: Path):
+        service.remember_many(["Use pytest", "Use ruff"])
+        fresh = MemoryService(memory_dir=memory_dir)
+        assert [m.content for m in fresh._load_store().memories] == [
+            "Use pytest",
+            "Use ruff",
+        ]
+
+    def test_skips_pending_ids(self, service: MemoryService):
+        pending = service.remember_begin("Pending")
+        results = service.remember_many(["Batch"])
+        assert results[0]["id"] != pending["id"]
+
+    def test_large_batch_is_compacted(self, service: MemoryService):
+        from amplifier_distro.server.memory import _JOURNAL_COMPACT_LINES
+
+        service.remember_many([f"Memory {i}" for i in range(_JOURNAL_COMPACT_LINES)])
+        assert not service.journal_path.exists()
+        assert len(service.recall("memory")) == _JOURNAL_COMPACT_LINES
+
+    def test_batch_shares_one_timestamp(self, service: MemoryService):
+        results = service.remember_many(["One", "Two", "Three"])
+        assert len({r["timestamp"] for r in results}) == 1
+
+    def test_empty_batch_writes_nothing(self, service: MemoryService):
+        assert service.remember_many([]) == []
+        assert not service.journal_path.exists()
 
 
 class TestMemoryRecall:
@@ -149,6 +190,325 @@ class TestMemoryRecall:
 # --- Auto-categorization ---
 
 
+class TestRecallCache:
+    """recall() memoizes per query until the store file changes."""
+
+    def test_repeat_recall_skips_store_load(
+        self, service: MemoryService, monkeypatch: pytest.MonkeyPatch
+    ):
+        service.remember("Use pytest for testing")
+        first = service.recall("pytest")
+
+        def _fail():
+            raise AssertionError("store should not be reloaded")
+
+        monkeypatch.setattr(service, "_load_store", _fail)
+        assert service.recall("PYTEST") == first
+
+    def test_remember_invalidates_cached_recall(self, service: MemoryService):
+        service.remember("Use pytest for testing")
+        assert len(service.recall("pytest")) == 1
+        service.remember("pytest fixtures are great")
+        assert len(service.recall("pytest")) == 2
+
+    def test_external_write_invalidates_cached_recall(
+        self, service: MemoryService, memory_dir: Path
+    ):
+        service.remember("Use pytest for testing")
+        assert len(service.recall("pytest")) == 1
+        other = MemoryService(memory_dir=memory_dir)
+        other.remember("pytest from another process")
+        assert len(service.recall("pytest")) == 2
+
+    def test_cached_results_are_copies(self, service: MemoryService):
+        service.remember("Use pytest for testing")
+        service.recall("pytest")[0]["content"] = "mutated"
+        assert service.recall("pytest")[0]["content"] == "Use pytest for testing"
+
+    def test_cached_results_do_not_share_tags(self, service: MemoryService):
+        """Antagonist note: a caller mutating tags must not corrupt the
+        memoized result for later identical queries."""
+        service.remember("Use pytest for testing")
+        first = service.recall("pytest")  # computed
+        first[0]["tags"].append("mutated")
+        second = service.recall("pytest")  # served from the cache
+        second[0]["tags"].append("mutated")
+        assert "mutated" not in service.recall("pytest")[0]["tags"]
+
+
+class TestParsedFileCache:
+    """Unchanged store and work-log files are parsed only once."""
+
+    def test_unchanged_store_is_not_reparsed(
+        self, service: MemoryService, monkeypatch: pytest.MonkeyPatch
+    ):
+        service.remember("Use pytest for testing")
+        calls = []
+        real_load = yaml.load
+        monkeypatch.setattr(
+            "amplifier_distro.server.memory.yaml.load",
+            lambda *args, **kwargs: calls.append(1) or real_load(*args, **kwargs),
+        )
+        service.recall("pytest")
+        service.recall("other query")
+        service.remember_begin("Second")
+        assert calls == []
+
+    def test_external_rewrite_is_reloaded(
+        self, service: MemoryService, memory_dir: Path
+    ):
+        service.remember("Use pytest for testing")
+        MemoryService(memory_dir=memory_dir).remember("pytest from elsewhere")
+        assert len(service.recall("pytest")) == 2
+
+    def test_next_id_tracks_external_writes(
+        self, service: MemoryService, memory_dir: Path
+    ):
+        service.remember("First")
+        MemoryService(memory_dir=memory_dir).remember("Second")
+        assert service.remember("Third")["id"] == "mem-003"
+
+    def test_remember_does_not_copy_or_rescan_store(
+        self, service: MemoryService, monkeypatch: pytest.MonkeyPatch
+    ):
+        service.remember_many([f"Memory {i}" for i in range(10)])
+        calls = []
+        monkeypatch.setattr(service, "_load_store", lambda: calls.append(1))
+        real_max = memory_module._max_id_number
+        monkeypatch.setattr(
+            memory_module,
+            "_max_id_number",
+            lambda entries: calls.extend(entries) or real_max(entries),
+        )
+        assert service.remember("Next")["id"] == "mem-011"
+        # Only the journal tail (1 entry) is scanned, not the whole store
+        assert len(calls) <= 1
+
+    def test_next_id_ignores_non_numeric_ids(self, service: MemoryService):
+        service.store_path.parent.mkdir(parents=True, exist_ok=True)
+        service.store_path.write_text(
+            'memories:\n- {id: "mem-007", timestamp: "", category: "", content: ""}\n'
+            '- {id: "custom", timestamp: "", category: "", content: ""}\n'
+        )
+        assert service.remember("Next")["id"] == "mem-008"
+
+    def test_search_index_built_once_per_store_version(
+        self, service: MemoryService, monkeypatch: pytest.MonkeyPatch
+    ):
+        service.remember("Use pytest for testing")
+        service.recall("pytest")
+        calls = []
+        real = MemoryService._load_store
+        monkeypatch.setattr(
+            service, "_load_store", lambda: calls.append(1) or real(service)
+        )
+        # New queries reuse the lowercased rows instead of reloading
+        assert len(service.recall("TESTING")) == 1
+        assert service.recall("nothing") == []
+        assert calls == []
+        service.remember("pytest again")
+        assert len(service.recall("PYTEST")) == 2
+
+    def test_query_does_not_match_across_fields(self, service: MemoryService):
+        """Antagonist note: fields share one search string internally."""
+        service.remember("ends with a\x00")
+        assert service.recall("a\x00") != []
+        assert service.recall("\x00general") == []
+
+    def test_loaded_labels_are_shared(self, service: MemoryService, memory_dir: Path):
+        service.remember_many(["Use git rebase", "Prefer git merge"])
+        service.compact()
+        service.remember("Git branch per feature")
+        first, second, third = (
+            MemoryService(memory_dir=memory_dir)._load_store().memories
+        )
+        assert first.category == "git"
+        assert first.category is second.category is third.category
+        assert first.tags[0] is third.tags[0]
+
+    def test_recall_results_do_not_alias_index(self, service: MemoryService):
+        service.remember("Use pytest for testing")
+        service.recall("use")[0]["tags"].append("mutated")
+        assert "mutated" not in service.recall("pytest")[0]["tags"]
+
+    def test_work_log_cache_returns_fresh_lists(self, service: MemoryService):
+        service.update_work_log([{"task": "A"}])
+        log = service._load_work_log()
+        log.items.clear()
+        assert [i["task"] for i in service.work_status()["items"]] == ["A"]
+        service.update_work_log([{"task": "B"}])
+        assert [i["task"] for i in service.work_status()["items"]] == ["B"]
+
+
+class TestMemoryJournal:
+    """remember() appends to memory-store.jsonl; compact() folds it into the YAML."""
+
+    def test_remember_does_not_rewrite_yaml(self, service: MemoryService):
+        service.remember("First")
+        service.compact()
+        before = service.store_path.read_bytes()
+        service.remember("Second")
+        assert service.store_path.read_bytes() == before
+        assert len(service.journal_path.read_bytes().splitlines()) == 1
+
+    def test_journal_is_replayed_on_load(
+        self, service: MemoryService, memory_dir: Path
+    ):
+        service.remember("Use pytest for testing")
+        fresh = MemoryService(memory_dir=memory_dir)
+        assert [m["id"] for m in fresh.recall("pytest")] == ["mem-001"]
+        assert fresh.remember("Next")["id"] == "mem-002"
+
+    def test_compacts_automatically(self, service: MemoryService):
+        from amplifier_distro.server.memory import _JOURNAL_COMPACT_LINES
+
+        for i in range(_JOURNAL_COMPACT_LINES):
+            service.remember(f"Memory {i}")
+        assert not service.journal_path.exists()
+        data = yaml.safe_load(service.store_path.read_text())
+        assert len(data["memories"]) == _JOURNAL_COMPACT_LINES
+
+    def test_torn_line_is_skipped(self, service: MemoryService, memory_dir: Path):
+        """Antagonist note: a crash mid-append must not lose other entries."""
+        service.remember("First")
+        with service.journal_path.open("ab") as f:
+            f.write(b'{"id": "mem-099"}\n{"id": "mem-0')
+        service.remember("Second")
+        fresh = MemoryService(memory_dir=memory_dir)
+        assert [m.content for m in fresh._load_store().memories] == [
+            "First",
+            "Second",
+        ]
+
+    def test_entries_already_compacted_are_not_duplicated(self, service: MemoryService):
+        """Antagonist note: a compaction interrupted before the journal is
+        removed leaves entries in both files."""
+        service.remember("First")
+        journal = service.journal_path.read_bytes()
+        service.compact()
+        service.journal_path.write_bytes(journal)
+        assert [m.id for m in service._load_store().memories] == ["mem-001"]
+
+    def test_id_reused_by_external_yaml_write_is_not_lost(self, service: MemoryService):
+        """Antagonist note: dev-memory tooling writes memory-store.yaml
+        directly and may hand out an ID that is only in the journal."""
+        service.remember("Journaled note")
+        service.store_path.write_text(
+            'memories:\n  - id: "mem-001"\n    timestamp: "2026-01-05T12:00:00Z"\n'
+            '    category: "general"\n    content: "External note"\n    tags: []\n'
+        )
+
+        assert {(m["id"], m["content"]) for m in service.recall("note")} == {
+            ("mem-001", "External note"),
+            ("mem-002", "Journaled note"),
+        }
+        assert service.remember("Next")["id"] == "mem-003"
+
+        service.compact()
+        data = yaml.safe_load(service.store_path.read_text())
+        assert [(m["id"], m["content"]) for m in data["memories"]] == [
+            ("mem-001", "External note"),
+            ("mem-002", "Journaled note"),
+            ("mem-003", "Next"),
+        ]
+
+    def test_saved_store_replaces_journal(self, service: MemoryService):
+        service.remember("First")
+        service.remember("Second")
+        store = service._load_store()
+        store.memories = [m for m in store.memories if m.id != "mem-001"]
+        service._save_store(store)
+        assert [m.id for m in service._load_store().memories] == ["mem-002"]
+
+
+class TestDeferredRemember:
+    """remember_begin() reserves an entry; remember_finalize() writes it."""
+
+    def test_begin_does_not_write(self, service: MemoryService):
+        result = service.remember_begin("Use pytest for testing")
+        assert result["id"] == "mem-001"
+        assert not service.store_path.exists()
+        assert not service.journal_path.exists()
+
+    def test_pending_entry_is_recallable(self, service: MemoryService):
+        service.remember_begin("Use pytest for testing")
+        assert [m["id"] for m in service.recall("pytest")] == ["mem-001"]
+
+    def test_pending_ids_are_not_reused(self, service: MemoryService):
+        """Antagonist note: IDs must account for entries not yet on disk."""
+        first = service.remember_begin("First")
+        second = service.remember_begin("Second")
+        assert first["id"] != second["id"]
+
+    def test_finalize_writes_once(self, service: MemoryService):
+        result = service.remember_begin("Use pytest for testing")
+        service.remember_finalize(result["id"])
+        service.remember_finalize(result["id"])
+        service.compact()
+        store = yaml.safe_load(service.store_path.read_text())
+        assert [m["id"] for m in store["memories"]] == ["mem-001"]
+        assert len(service.recall("pytest")) == 1
+
+    def test_failed_finalize_keeps_memory_recallable(
+        self, service: MemoryService, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Antagonist note: the chat already replied "Remembered!", so a
+        failed background write must not make the memory disappear."""
+        result = service.remember_begin("Use pytest for testing")
+
+        def _fail(entries):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(service, "_append_journal", _fail)
+        with pytest.raises(OSError):
+            service.remember_finalize(result["id"])
+        assert [m["id"] for m in service.recall("pytest")] == ["mem-001"]
+
+        monkeypatch.undo()
+        second = service.remember_begin("Use ruff for linting")
+        service.remember_finalize(second["id"])  # retries mem-001 too
+        assert service._pending == {}
+        fresh = MemoryService(memory_dir=service.memory_dir)
+        assert [m.id for m in fresh._load_store().memories] == ["mem-001", "mem-002"]
+
+    def test_compact_retries_failed_write(
+        self, service: MemoryService, monkeypatch: pytest.MonkeyPatch
+    ):
+        result = service.remember_begin("Use pytest for testing")
+
+        def _fail(entries):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(service, "_append_journal", _fail)
+        with pytest.raises(OSError):
+            service.remember_finalize(result["id"])
+        monkeypatch.undo()
+
+        service.compact()
+        data = yaml.safe_load(service.store_path.read_text())
+        assert [m["id"] for m in data["memories"]] == ["mem-001"]
+        assert service._pending == {}
+
+    def test_recall_reload_waits_for_write_on_another_thread(
+        self, service: MemoryService
+    ):
+        """Antagonist note: finalize runs on a worker thread; a recall that
+        replays the journal meanwhile must not reset its line count."""
+        service.remember("Use pytest for testing")
+        service._store_cache = None  # force the next recall to replay
+        results: list[list[dict]] = []
+        with service._write_lock:
+            reader = threading.Thread(
+                target=lambda: results.append(service.recall("pytest"))
+            )
+            reader.start()
+            reader.join(timeout=0.05)
+            assert reader.is_alive()
+        reader.join(timeout=5)
+        assert [m["id"] for m in results[0]] == ["mem-001"]
+        assert service._journal_lines == 1
+
+
 class TestAutoCategorization:
     """Test that memories are auto-categorized by keyword matching."""
 
@@ -227,6 +587,11 @@ class TestWorkLog:
         result = service.work_status()
         assert result["items"][0]["task"] == "Roundtrip test"
 
+    def test_work_log_rejects_non_string_task(self, service: MemoryService):
+        with pytest.raises(ValueError):
+            service.update_work_log([{"task": ["not", "a", "string"]}])
+        assert not service.work_log_path.exists()
+
     def test_work_log_adds_timestamp(self, service: MemoryService):
         result = service.update_work_log([{"task": "Auto timestamp"}])
         assert result["items"][0]["updated"] != ""
@@ -430,6 +795,61 @@ class TestWebChatMemoryIntegration:
         assert result is not None
         assert result[0] == "remember"
 
+    def test_check_memory_intent_remember_spans_lines(self):
+        from amplifier_distro.server.apps.web_chat import check_memory_intent
+
+        result = check_memory_intent("remember this: line one\nline two")
+        assert result == ("remember", "line one\nline two")
+
+    def test_check_memory_intent_recall_stops_at_newline(self):
+        from amplifier_distro.server.apps.web_chat import check_memory_intent
+
+        result = check_memory_intent("recall git branching\nand more")
+        assert result == ("recall", "git branching")
+
+    def test_check_memory_intent_irregular_whitespace(self):
+        """Non-canonical spacing falls through to the regex and still matches."""
+        from amplifier_distro.server.apps.web_chat import check_memory_intent
+
+        assert check_memory_intent("remember   that\tx") == ("remember", "x")
+        assert check_memory_intent("search  memory  for  y") == ("recall", "y")
+
+    def test_check_memory_intent_preserves_case(self):
+        """Matching runs on a casefolded copy; captured text keeps its case."""
+        from amplifier_distro.server.apps.web_chat import check_memory_intent
+
+        assert check_memory_intent("RECALL  PyTest Tips") == ("recall", "PyTest Tips")
+        assert check_memory_intent("remember  that Straße ist GROSS") == (
+            "remember",
+            "Straße ist GROSS",
+        )
+
+    def test_check_memory_intent_linear_on_adversarial_whitespace(self):
+        """Antagonist note: any user can send arbitrary text; long runs of
+        whitespace after a command word must not trigger quadratic
+        backtracking."""
+        import time
+
+        from amplifier_distro.server.apps.web_chat import check_memory_intent
+
+        n = 200_000
+        messages = [
+            "remember" + " " * n + "x",
+            "search" + " " * n + "memory" + "\n" * n,
+            "search memory" + " " * n + "for" + " " * n,
+            "what" + " \t" * n,
+        ]
+        start = time.perf_counter()
+        for message in messages:
+            check_memory_intent(message)
+        assert time.perf_counter() - start < 1.0
+
+    def test_check_memory_intent_bare_search_for(self):
+        """Antagonist note: with no query, "for" itself is the query."""
+        from amplifier_distro.server.apps.web_chat import check_memory_intent
+
+        assert check_memory_intent("search memory for") == ("recall", "for")
+
     @pytest.fixture
     def webchat_memory_client(self, memory_dir: Path) -> TestClient:
         """Create a web-chat TestClient with memory service."""
@@ -606,11 +1026,13 @@ class TestYAMLFormatCompatibility:
 
     def test_yaml_has_memories_key(self, service: MemoryService):
         service.remember("Test memory")
+        service.compact()
         data = yaml.safe_load(service.store_path.read_text())
         assert "memories" in data
 
     def test_yaml_entry_has_required_fields(self, service: MemoryService):
         service.remember("Test memory")
+        service.compact()
         data = yaml.safe_load(service.store_path.read_text())
         entry = data["memories"][0]
         assert "id" in entry
@@ -621,14 +1043,54 @@ class TestYAMLFormatCompatibility:
 
     def test_yaml_id_format(self, service: MemoryService):
         service.remember("Test memory")
+        service.compact()
         data = yaml.safe_load(service.store_path.read_text())
         assert data["memories"][0]["id"].startswith("mem-")
 
     def test_yaml_tags_is_list(self, service: MemoryService):
         service.remember("Test memory")
+        service.compact()
         data = yaml.safe_load(service.store_path.read_text())
         assert isinstance(data["memories"][0]["tags"], list)
 
+    @pytest.mark.parametrize(
+        "content",
+        [
+            "plain text",
+            "key: value # not a comment",
+            "- leading dash",
+            "  leading and trailing spaces  ",
+            'quotes " and \\ backslashes',
+            "multi\nline\r\ntext\twith tabs",
+            "yes",
+            "null",
+            "123",
+            "",
+            "unicode café 日本語 😀",
+            "control \x00\x07\x7f\x85\u2028\ufeff chars",
+        ],
+    )
+    def test_hand_written_yaml_round_trips(self, service: MemoryService, content):
+        """Antagonist note: the store is written without yaml.dump, so any
+        string must survive a standard YAML load unchanged."""
+        service.remember(content)
+        service.compact()
+        data = yaml.safe_load(service.store_path.read_text())
+        assert data["memories"][0]["content"] == content
+        fresh = MemoryService(memory_dir=service.memory_dir)
+        assert fresh._load_store().memories[0].content == content
+
+    def test_work_log_round_trips(self, service: MemoryService):
+        items = [{"task": "Ship: v1 # now", "status": "in-progress"}]
+        service.update_work_log(items)
+        data = yaml.safe_load(service.work_log_path.read_text())
+        assert data["items"][0]["task"] == "Ship: v1 # now"
+        assert data["items"][0]["status"] == "in-progress"
+
+    def test_empty_work_log_round_trips(self, service: MemoryService):
+        service.update_work_log([])
+        assert yaml.safe_load(service.work_log_path.read_text()) == {"items": []}
+
 
 # --- Conventions Compliance ---
 
@@ -199,6 +199,25 @@ class TestConfigIO:
             assert loaded.workspace_root == "~/mywork"
             assert loaded.identity.github_handle == "roundtrip_user"
 
+    def test_unchanged_file_is_not_reparsed(self, tmp_path):
+        fake_path = tmp_path / "distro.yaml"
+        with patch("amplifier_distro.config.config_path", return_value=fake_path):
+            save_config(DistroConfig(workspace_root="~/first"))
+            with patch(
+                "amplifier_distro.config.yaml.safe_load", wraps=yaml.safe_load
+            ) as spy:
+                first = load_config()
+                second = load_config()
+                assert spy.call_count == 1
+                # Each call still gets its own object
+                assert first is not second
+                first.identity.github_handle = "mutated"
+                assert load_config().identity.github_handle != "mutated"
+
+                save_config(DistroConfig(workspace_root="~/second"))
+                assert load_config().workspace_root == "~/second"
+                assert spy.call_count == 2
+
     def test_save_creates_parent_directories(self, tmp_path):
         """save_config must create ~/.amplifier/ if it doesn't exist."""
         deep_path = tmp_path / "a" / "b" / "distro.yaml"
@@ -13,6 +13,8 @@ Exit criteria verified:
 6. ServerServices extras dict works for extensibility
 """
 
+import asyncio
+
 import pytest
 
 from amplifier_distro.server.services import (
@@ -22,6 +24,7 @@ from amplifier_distro.server.services import (
     reset_services,
 )
 from amplifier_distro.server.session_backend import (
+    _RECONNECT_STRIPES,
     MockBackend,
     SessionBackend,
     SessionInfo,
@@ -237,9 +240,8 @@ class TestBridgeBackendReconnectLock:
 
         backend = BridgeBackend.__new__(BridgeBackend)
         backend._sessions = {}
-        backend._reconnect_locks = {}
-        backend._session_queues = {}
-        backend._worker_tasks = {}
+        backend._reconnect_stripes = [asyncio.Lock() for _ in range(_RECONNECT_STRIPES)]
+        backend._runs = {}
         backend._ended_sessions = set()
 
         # Mock handle that run() returns a response
@@ -283,18 +285,20 @@ class TestBridgeBackendReconnectLock:
         """Normal send_message with cached handle doesn't touch locks."""
         from unittest.mock import AsyncMock, MagicMock
 
-        from amplifier_distro.server.session_backend import BridgeBackend
+        from amplifier_distro.server.session_backend import (
+            BridgeBackend,
+            _SessionEntry,
+        )
 
         backend = BridgeBackend.__new__(BridgeBackend)
-        backend._reconnect_locks = {}
-        backend._session_queues = {}
-        backend._worker_tasks = {}
+        backend._reconnect_stripes = [asyncio.Lock() for _ in range(_RECONNECT_STRIPES)]
+        backend._runs = {}
         backend._ended_sessions = set()
 
         mock_handle = MagicMock()
         mock_handle.run = AsyncMock(return_value="cached response")
 
-        backend._sessions = {"sess-456": mock_handle}
+        backend._sessions = {"sess-456": _SessionEntry(mock_handle)}
         backend._bridge = MagicMock()
 
         result = await backend.send_message("sess-456", "hi")
@@ -302,8 +306,8 @@ class TestBridgeBackendReconnectLock:
 
         # Bridge should never be called (no reconnect needed)
         backend._bridge.resume_session.assert_not_called()
-        # No locks should have been created
-        assert len(backend._reconnect_locks) == 0
+        # No lock stripe should be held
+        assert not any(lock.locked() for lock in backend._reconnect_stripes)
 
     @pytest.mark.asyncio
     async def test_different_sessions_reconnect_independently(self):
@@ -315,9 +319,8 @@ class TestBridgeBackendReconnectLock:
 
         backend = BridgeBackend.__new__(BridgeBackend)
         backend._sessions = {}
-        backend._reconnect_locks = {}
-        backend._session_queues = {}
-        backend._worker_tasks = {}
+        backend._reconnect_stripes = [asyncio.Lock() for _ in range(_RECONNECT_STRIPES)]
+        backend._runs = {}
         backend._ended_sessions = set()
 
         handles = {}
@@ -349,17 +352,45 @@ class TestBridgeBackendReconnectLock:
         assert resume_count == 2
 
     @pytest.mark.asyncio
-    async def test_lock_cleaned_up_after_successful_reconnect(self):
-        """Lock entry is removed after successful reconnect."""
+    async def test_sessions_sharing_a_stripe_both_reconnect(self):
+        """Two sessions hashed to the same stripe each get their own resume."""
+        from unittest.mock import AsyncMock, MagicMock
+
+        from amplifier_distro.server.session_backend import BridgeBackend
+
+        backend = BridgeBackend.__new__(BridgeBackend)
+        backend._sessions = {}
+        backend._reconnect_stripes = [asyncio.Lock()]  # force a collision
+        backend._runs = {}
+        backend._ended_sessions = set()
+
+        async def fake_resume(session_id, config=None):
+            h = MagicMock()
+            h.run = AsyncMock(return_value=f"response-{session_id}")
+            return h
+
+        backend._bridge = MagicMock()
+        backend._bridge.resume_session = AsyncMock(side_effect=fake_resume)
+
+        results = await asyncio.gather(
+            backend.send_message("sess-C", "hello"),
+            backend.send_message("sess-D", "world"),
+        )
+
+        assert results == ["response-sess-C", "response-sess-D"]
+        assert backend._bridge.resume_session.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_lock_released_after_successful_reconnect(self):
+        """The session's lock stripe is released after a successful reconnect."""
         from unittest.mock import AsyncMock, MagicMock
 
         from amplifier_distro.server.session_backend import BridgeBackend
 
         backend = BridgeBackend.__new__(BridgeBackend)
         backend._sessions = {}
-        backend._reconnect_locks = {}
-        backend._session_queues = {}
-        backend._worker_tasks = {}
+        backend._reconnect_stripes = [asyncio.Lock() for _ in range(_RECONNECT_STRIPES)]
+        backend._runs = {}
         backend._ended_sessions = set()
 
         mock_handle = MagicMock()
@@ -373,21 +404,21 @@ class TestBridgeBackendReconnectLock:
 
         await backend.send_message("sess-cleanup", "hi")
 
-        # Lock should be cleaned up after successful reconnect
-        assert "sess-cleanup" not in backend._reconnect_locks
+        # Stripe is released and no per-session lock state is left behind
+        assert not any(lock.locked() for lock in backend._reconnect_stripes)
+        assert len(backend._reconnect_stripes) == _RECONNECT_STRIPES
 
     @pytest.mark.asyncio
-    async def test_reconnect_failure_cleans_up_lock(self):
-        """Lock entry is removed even when reconnect fails."""
+    async def test_reconnect_failure_releases_lock(self):
+        """The session's lock stripe is released even when reconnect fails."""
         from unittest.mock import AsyncMock, MagicMock
 
         from amplifier_distro.server.session_backend import BridgeBackend
 
         backend = BridgeBackend.__new__(BridgeBackend)
         backend._sessions = {}
-        backend._reconnect_locks = {}
-        backend._session_queues = {}
-        backend._worker_tasks = {}
+        backend._reconnect_stripes = [asyncio.Lock() for _ in range(_RECONNECT_STRIPES)]
+        backend._runs = {}
         backend._ended_sessions = set()
 
         backend._bridge = MagicMock()
@@ -398,8 +429,8 @@ class TestBridgeBackendReconnectLock:
         with pytest.raises(ValueError, match="Unknown session"):
             await backend.send_message("sess-gone", "hello")
 
-        # Lock should be cleaned up even on failure
-        assert "sess-gone" not in backend._reconnect_locks
+        # Stripe should be released even on failure
+        assert not any(lock.locked() for lock in backend._reconnect_stripes)
 
     @pytest.mark.asyncio
     async def test_reconnect_failure_does_not_deadlock_retry(self):
@@ -410,9 +441,8 @@ class TestBridgeBackendReconnectLock:
 
         backend = BridgeBackend.__new__(BridgeBackend)
         backend._sessions = {}
-        backend._reconnect_locks = {}
-        backend._session_queues = {}
-        backend._worker_tasks = {}
+        backend._reconnect_stripes = [asyncio.Lock() for _ in range(_RECONNECT_STRIPES)]
+        backend._runs = {}
         backend._ended_sessions = set()
 
         call_count = 0
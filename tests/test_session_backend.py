@@ -10,6 +10,8 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from amplifier_distro.server.session_backend import _SessionEntry
+
 
 def _make_mock_handle(session_id: str = "test-session-0001") -> MagicMock:
     """Build a mock SessionHandle with a controllable run() method."""
@@ -28,63 +30,72 @@ def bridge_backend():
     with patch(target) as mock_init:
         mock_init.return_value = None  # suppress real __init__
 
-        from amplifier_distro.server.session_backend import BridgeBackend
+        from amplifier_distro.server.session_backend import (
+            _RECONNECT_STRIPES,
+            BridgeBackend,
+        )
 
         backend = BridgeBackend.__new__(BridgeBackend)
         backend._bridge = AsyncMock()
         backend._sessions = {}
-        backend._reconnect_locks = {}
-        backend._session_queues = {}
-        backend._worker_tasks = {}
+        backend._reconnect_stripes = [asyncio.Lock() for _ in range(_RECONNECT_STRIPES)]
+        backend._runs = {}
         backend._ended_sessions = set()
         return backend
 
 
-class TestBridgeBackendQueueInfrastructure:
-    """Verify the queue-based session worker infrastructure."""
-
-    def test_backend_has_session_queues_dict(self, bridge_backend):
-        assert hasattr(bridge_backend, "_session_queues")
-        assert isinstance(bridge_backend._session_queues, dict)
+class TestBridgeBackendRunLockInfrastructure:
+    """Verify the per-session run-lock infrastructure."""
 
-    def test_backend_has_worker_tasks_dict(self, bridge_backend):
-        assert hasattr(bridge_backend, "_worker_tasks")
-        assert isinstance(bridge_backend._worker_tasks, dict)
+    def test_session_entry_has_its_own_run_lock(self):
+        first = _SessionEntry(_make_mock_handle("sess-a"))
+        second = _SessionEntry(_make_mock_handle("sess-b"))
+        assert isinstance(first.run_lock, asyncio.Lock)
+        assert first.run_lock is not second.run_lock
 
     def test_backend_has_ended_sessions_set(self, bridge_backend):
         assert hasattr(bridge_backend, "_ended_sessions")
         assert isinstance(bridge_backend._ended_sessions, set)
 
-    async def test_create_session_starts_worker_task(self, bridge_backend):
-        """create_session() must pre-start a session worker."""
+    async def test_create_session_starts_no_tasks(self, bridge_backend):
+        """create_session() must not leave a background task per session."""
         handle = _make_mock_handle("sess-0001")
         bridge_backend._bridge.create_session = AsyncMock(return_value=handle)
 
         from amplifier_distro.server.session_backend import BridgeBackend
 
+        before = len(asyncio.all_tasks())
         await BridgeBackend.create_session(
             bridge_backend,
             working_dir="/tmp",
             description="test",
         )
 
-        assert "sess-0001" in bridge_backend._worker_tasks
-        worker = bridge_backend._worker_tasks["sess-0001"]
-        assert not worker.done(), "Worker task should still be running"
-        # Cleanup
-        worker.cancel()
-        with pytest.raises((asyncio.CancelledError, Exception)):
-            await worker
+        assert len(asyncio.all_tasks()) == before
+        assert bridge_backend._runs == {}
+
+    async def test_finished_runs_are_forgotten(self, bridge_backend):
+        session_id = "sess-0002"
+        bridge_backend._sessions[session_id] = _SessionEntry(
+            _make_mock_handle(session_id)
+        )
+
+        from amplifier_distro.server.session_backend import BridgeBackend
+
+        await BridgeBackend.send_message(bridge_backend, session_id, "hi")
+        await asyncio.sleep(0)  # let done callbacks run
+
+        assert bridge_backend._runs == {}
 
 
 class TestBridgeBackendSerialization:
-    """Verify messages for the same session are serialized through a queue."""
+    """Verify messages for the same session are serialized by its run lock."""
 
     async def test_send_message_serializes_concurrent_calls(self, bridge_backend):
         """Concurrent send_message calls for the same session run sequentially."""
         session_id = "sess-serial-001"
         handle = _make_mock_handle(session_id)
-        bridge_backend._sessions[session_id] = handle
+        bridge_backend._sessions[session_id] = _SessionEntry(handle)
 
         call_order = []
 
@@ -98,131 +109,148 @@ class TestBridgeBackendSerialization:
 
         from amplifier_distro.server.session_backend import BridgeBackend
 
-        queue = asyncio.Queue()
-        bridge_backend._session_queues[session_id] = queue
-        bridge_backend._worker_tasks[session_id] = asyncio.create_task(
-            BridgeBackend._session_worker(bridge_backend, session_id)  # type: ignore[attr-defined]
+        r1, r2 = await asyncio.gather(
+            BridgeBackend.send_message(bridge_backend, session_id, "A"),
+            BridgeBackend.send_message(bridge_backend, session_id, "B"),
         )
 
-        try:
-            r1, r2 = await asyncio.gather(
-                BridgeBackend.send_message(bridge_backend, session_id, "A"),
-                BridgeBackend.send_message(bridge_backend, session_id, "B"),
-            )
-        finally:
-            bridge_backend._worker_tasks[session_id].cancel()
+        assert r1 == "resp:A"
+        assert r2 == "resp:B"
+        # FIFO: the lock hands over in arrival order, without interleaving
+        assert call_order == ["start:A", "end:A", "start:B", "end:B"]
+
+    async def test_different_sessions_run_concurrently(self, bridge_backend):
+        from amplifier_distro.server.session_backend import BridgeBackend
+
+        running = 0
+        peak = 0
+
+        async def tracked_run(message):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return message
+
+        for sid in ("sess-par-001", "sess-par-002"):
+            handle = _make_mock_handle(sid)
+            handle.run = tracked_run
+            bridge_backend._sessions[sid] = _SessionEntry(handle)
 
-        assert r1 == "resp:A" or r1 == "resp:B"
-        assert r2 == "resp:A" or r2 == "resp:B"
-        assert r1 != r2
+        await asyncio.gather(
+            BridgeBackend.send_message(bridge_backend, "sess-par-001", "A"),
+            BridgeBackend.send_message(bridge_backend, "sess-par-002", "B"),
+        )
 
-        a_start = call_order.index("start:A")
-        a_end = call_order.index("end:A")
-        b_start = call_order.index("start:B")
-        b_end = call_order.index("end:B")
-        assert a_end < b_start or b_end < a_start, f"Calls interleaved: {call_order}"
+        assert peak == 2
 
     async def test_send_message_propagates_exceptions(self, bridge_backend):
         """If handle.run() raises, the exception propagates to the caller."""
         session_id = "sess-exc-001"
         handle = _make_mock_handle(session_id)
         handle.run = AsyncMock(side_effect=RuntimeError("LLM exploded"))
-        bridge_backend._sessions[session_id] = handle
+        bridge_backend._sessions[session_id] = _SessionEntry(handle)
 
         from amplifier_distro.server.session_backend import BridgeBackend
 
-        queue = asyncio.Queue()
-        bridge_backend._session_queues[session_id] = queue
-        bridge_backend._worker_tasks[session_id] = asyncio.create_task(
-            BridgeBackend._session_worker(bridge_backend, session_id)  # type: ignore[attr-defined]
-        )
+        with pytest.raises(RuntimeError, match="LLM exploded"):
+            await BridgeBackend.send_message(bridge_backend, session_id, "hi")
 
-        try:
-            with pytest.raises(RuntimeError, match="LLM exploded"):
-                await BridgeBackend.send_message(bridge_backend, session_id, "hi")
-        finally:
-            bridge_backend._worker_tasks[session_id].cancel()
+        # The lock is released, so the next message still runs
+        handle.run = AsyncMock(return_value="recovered")
+        assert (
+            await BridgeBackend.send_message(bridge_backend, session_id, "again")
+            == "recovered"
+        )
 
 
-class TestBridgeBackendSendMessageQueue:
-    """send_message() routes through the per-session queue."""
+class TestBridgeBackendSendMessage:
+    """send_message() / stream_message() run handle.run() and return its result."""
 
-    async def test_send_message_uses_queue(self, bridge_backend):
-        """send_message() puts work on the queue; result comes back via future."""
-        session_id = "sess-queue-001"
+    async def test_send_message_returns_run_result(self, bridge_backend):
+        session_id = "sess-send-001"
         handle = _make_mock_handle(session_id)
-        bridge_backend._sessions[session_id] = handle
+        bridge_backend._sessions[session_id] = _SessionEntry(handle)
 
         from amplifier_distro.server.session_backend import BridgeBackend
 
-        # Manually pre-start queue and worker (as create_session will do)
-        queue = asyncio.Queue()
-        bridge_backend._session_queues[session_id] = queue
-        bridge_backend._worker_tasks[session_id] = asyncio.create_task(
-            BridgeBackend._session_worker(bridge_backend, session_id)
+        result = await BridgeBackend.send_message(
+            bridge_backend, session_id, "test message"
         )
 
-        try:
-            result = await BridgeBackend.send_message(
+        assert result == f"[response from {session_id}]"
+        handle.run.assert_called_once_with("test message")
+
+    async def test_stream_message_yields_run_result(self, bridge_backend):
+        """stream_message() yields the serialized handle.run() result."""
+        session_id = "sess-stream-001"
+        handle = _make_mock_handle(session_id)
+        bridge_backend._sessions[session_id] = _SessionEntry(handle)
+
+        from amplifier_distro.server.session_backend import BridgeBackend
+
+        chunks = [
+            chunk
+            async for chunk in BridgeBackend.stream_message(
                 bridge_backend, session_id, "test message"
             )
-        finally:
-            bridge_backend._worker_tasks[session_id].cancel()
+        ]
 
-        assert result == f"[response from {session_id}]"
+        assert chunks == [f"[response from {session_id}]"]
         handle.run.assert_called_once_with("test message")
 
 
 class TestBridgeBackendCancellation:
-    """Verify that cancelling the worker during handle.run() is clean."""
+    """Cancelling a caller must not abort its run or break serialization."""
 
-    async def test_no_double_task_done_on_cancel_during_run(self, bridge_backend):
-        """Cancelling the worker during handle.run() must not raise ValueError."""
+    async def test_cancelled_caller_does_not_abort_run(self, bridge_backend):
         session_id = "sess-cancel-run-001"
         handle = _make_mock_handle(session_id)
-        bridge_backend._sessions[session_id] = handle
+        bridge_backend._sessions[session_id] = _SessionEntry(handle)
 
         run_started = asyncio.Event()
+        release = asyncio.Event()
+        call_order = []
 
         async def slow_run(message):
+            call_order.append(f"start:{message}")
             run_started.set()
-            await asyncio.sleep(10)  # long enough to cancel
-            return "never"
+            await release.wait()
+            call_order.append(f"end:{message}")
+            return message
 
         handle.run = slow_run
 
         from amplifier_distro.server.session_backend import BridgeBackend
 
-        queue = asyncio.Queue()
-        bridge_backend._session_queues[session_id] = queue
-        worker = asyncio.create_task(
-            BridgeBackend._session_worker(bridge_backend, session_id)
+        caller = asyncio.create_task(
+            BridgeBackend.send_message(bridge_backend, session_id, "first")
         )
-        bridge_backend._worker_tasks[session_id] = worker
-
-        # Enqueue a message and wait for run() to start
-        fut = asyncio.get_event_loop().create_future()
-        await queue.put(("cancel-me", fut))
         await run_started.wait()
-
-        # Cancel worker while handle.run() is in-flight
-        worker.cancel()
+        caller.cancel()
         with pytest.raises(asyncio.CancelledError):
-            await worker
+            await caller
 
-        # fut should be cancelled, queue should be consistent (no ValueError raised)
-        assert fut.cancelled() or fut.done()
-        # If we get here without ValueError, the bug is fixed
+        # The next message still waits for the first run to finish
+        second = asyncio.create_task(
+            BridgeBackend.send_message(bridge_backend, session_id, "second")
+        )
+        await asyncio.sleep(0.01)
+        assert call_order == ["start:first"]
+        release.set()
+        assert await second == "second"
+        assert call_order == ["start:first", "end:first", "start:second", "end:second"]
 
 
 class TestBridgeBackendEndSession:
-    """end_session() must tombstone, drain the worker, then call bridge.end_session."""
+    """end_session() must tombstone, drain runs, then call bridge.end_session."""
 
     async def test_end_session_adds_tombstone(self, bridge_backend):
         """Session ID is added to _ended_sessions before anything else."""
         session_id = "sess-end-001"
         handle = _make_mock_handle(session_id)
-        bridge_backend._sessions[session_id] = handle
+        bridge_backend._sessions[session_id] = _SessionEntry(handle)
         bridge_backend._bridge.end_session = AsyncMock()
 
         from amplifier_distro.server.session_backend import BridgeBackend
@@ -231,16 +259,18 @@ class TestBridgeBackendEndSession:
 
         assert session_id in bridge_backend._ended_sessions
 
-    async def test_end_session_drains_worker(self, bridge_backend):
+    async def test_end_session_drains_in_flight_run(self, bridge_backend):
         """end_session() waits for in-flight work to complete before returning."""
         session_id = "sess-end-002"
         handle = _make_mock_handle(session_id)
-        bridge_backend._sessions[session_id] = handle
+        bridge_backend._sessions[session_id] = _SessionEntry(handle)
         bridge_backend._bridge.end_session = AsyncMock()
 
         completed = []
+        run_started = asyncio.Event()
 
         async def slow_run(message):
+            run_started.set()
             await asyncio.sleep(0.03)
             completed.append(message)
             return f"done:{message}"
@@ -249,25 +279,80 @@ class TestBridgeBackendEndSession:
 
         from amplifier_distro.server.session_backend import BridgeBackend
 
-        # Pre-start worker
-        queue: asyncio.Queue = asyncio.Queue()
-        bridge_backend._session_queues[session_id] = queue
-        bridge_backend._worker_tasks[session_id] = asyncio.create_task(
-            BridgeBackend._session_worker(bridge_backend, session_id)
-        )
-
-        # Start a send (don't await yet) then immediately end
+        # Start a send (don't await yet) then end once it is running
         send_task = asyncio.create_task(
             BridgeBackend.send_message(bridge_backend, session_id, "finishing")
         )
-        await asyncio.sleep(0)  # let the message enqueue
+        await run_started.wait()
+
+        await BridgeBackend.end_session(bridge_backend, session_id)
+
+        assert completed == ["finishing"]
+        assert await send_task == "done:finishing"
+        assert session_id not in bridge_backend._sessions
+
+    async def test_end_session_rejects_queued_messages(self, bridge_backend):
+        session_id = "sess-end-004"
+        handle = _make_mock_handle(session_id)
+        bridge_backend._sessions[session_id] = _SessionEntry(handle)
+        bridge_backend._bridge.end_session = AsyncMock()
+
+        run_started = asyncio.Event()
+
+        async def slow_run(message):
+            run_started.set()
+            await asyncio.sleep(0.03)
+            return message
+
+        handle.run = slow_run
+
+        from amplifier_distro.server.session_backend import BridgeBackend
+
+        first = asyncio.create_task(
+            BridgeBackend.send_message(bridge_backend, session_id, "first")
+        )
+        queued = asyncio.create_task(
+            BridgeBackend.send_message(bridge_backend, session_id, "queued")
+        )
+        await run_started.wait()
 
         await BridgeBackend.end_session(bridge_backend, session_id)
 
-        if not send_task.done():
-            send_task.cancel()
+        assert await first == "first"
+        with pytest.raises(ValueError, match="handle not found"):
+            await queued
+
+    async def test_end_session_cancels_stuck_run(self, bridge_backend):
+        session_id = "sess-end-005"
+        handle = _make_mock_handle(session_id)
+        bridge_backend._sessions[session_id] = _SessionEntry(handle)
+        bridge_backend._bridge.end_session = AsyncMock()
+
+        run_started = asyncio.Event()
+
+        async def stuck_run(message):
+            run_started.set()
+            await asyncio.sleep(60)
+
+        handle.run = stuck_run
+
+        from amplifier_distro.server.session_backend import BridgeBackend
+
+        send_task = asyncio.create_task(
+            BridgeBackend.send_message(bridge_backend, session_id, "stuck")
+        )
+        await run_started.wait()
+
+        real_wait_for = asyncio.wait_for
+        with patch(
+            "amplifier_distro.server.session_backend.asyncio.wait_for",
+            lambda aw, timeout: real_wait_for(aw, timeout=0.01),
+        ):
+            await BridgeBackend.end_session(bridge_backend, session_id)
 
-        assert "finishing" in completed or send_task.done()
+        with pytest.raises(asyncio.CancelledError):
+            await send_task
+        bridge_backend._bridge.end_session.assert_awaited_once_with(handle)
 
     async def test_reconnect_blocked_after_end_session(self, bridge_backend):
         """_reconnect() must raise ValueError for tombstoned sessions."""
@@ -280,26 +365,106 @@ class TestBridgeBackendEndSession:
             await BridgeBackend._reconnect(bridge_backend, session_id)
 
 
+class TestBridgeBackendReconnectBackoff:
+    """Transient resume failures are retried with full-jitter backoff."""
+
+    async def test_transient_failure_is_retried(self, bridge_backend):
+        from amplifier_distro.server.session_backend import BridgeBackend
+
+        session_id = "sess-retry-001"
+        handle = _make_mock_handle(session_id)
+        bridge_backend._bridge.resume_session.side_effect = [
+            ConnectionRefusedError("bridge restarting"),
+            TimeoutError("provider timed out"),
+            handle,
+        ]
+        sleep = AsyncMock()
+        with patch("amplifier_distro.server.session_backend.asyncio.sleep", sleep):
+            result = await BridgeBackend._reconnect(bridge_backend, session_id)
+
+        assert result is handle
+        assert bridge_backend._sessions[session_id].handle is handle
+        assert bridge_backend._bridge.resume_session.await_count == 3
+        assert sleep.await_count == 2
+        # Full jitter: each delay is drawn from [0, base * 2**retry].
+        first, second = (c.args[0] for c in sleep.await_args_list)
+        assert 0 <= first <= 0.1
+        assert 0 <= second <= 0.2
+
+    @pytest.mark.parametrize(
+        "error",
+        [
+            FileNotFoundError("session dir gone"),
+            ValueError("Ambiguous session prefix"),
+            RuntimeError("amplifier-foundation is not installed"),
+            RuntimeError("Failed to load distro bundle"),
+            PermissionError("permission denied"),
+        ],
+    )
+    async def test_permanent_failure_fails_fast(self, bridge_backend, error):
+        from amplifier_distro.server.session_backend import BridgeBackend
+
+        bridge_backend._bridge.resume_session.side_effect = error
+        sleep = AsyncMock()
+        with (
+            patch("amplifier_distro.server.session_backend.asyncio.sleep", sleep),
+            pytest.raises(ValueError, match="Unknown session"),
+        ):
+            await BridgeBackend._reconnect(bridge_backend, "sess-retry-002")
+
+        assert bridge_backend._bridge.resume_session.await_count == 1
+        sleep.assert_not_awaited()
+
+    async def test_gives_up_after_max_attempts(self, bridge_backend):
+        from amplifier_distro.server.session_backend import (
+            _RECONNECT_ATTEMPTS,
+            BridgeBackend,
+        )
+
+        bridge_backend._bridge.resume_session.side_effect = ConnectionError("down")
+        with (
+            patch("amplifier_distro.server.session_backend.asyncio.sleep", AsyncMock()),
+            pytest.raises(ValueError, match="Unknown session") as exc_info,
+        ):
+            await BridgeBackend._reconnect(bridge_backend, "sess-retry-003")
+
+        assert isinstance(exc_info.value.__cause__, ConnectionError)
+        assert bridge_backend._bridge.resume_session.await_count == _RECONNECT_ATTEMPTS
+        assert "sess-retry-003" not in bridge_backend._sessions
+
+
 class TestBridgeBackendStop:
-    """stop() sends sentinels to all workers and awaits them."""
+    """stop() drains every session's runs before returning."""
 
-    async def test_stop_signals_all_workers(self, bridge_backend):
-        """stop() sends None sentinel to every active queue."""
+    async def test_stop_waits_for_in_flight_runs(self, bridge_backend):
         from amplifier_distro.server.session_backend import BridgeBackend
 
+        completed = []
+        started = []
+
+        async def slow_run(message):
+            started.append(message)
+            await asyncio.sleep(0.02)
+            completed.append(message)
+            return message
+
+        sends = []
         for sid in ("sess-stop-001", "sess-stop-002"):
             handle = _make_mock_handle(sid)
-            bridge_backend._sessions[sid] = handle
-            queue: asyncio.Queue = asyncio.Queue()
-            bridge_backend._session_queues[sid] = queue
-            bridge_backend._worker_tasks[sid] = asyncio.create_task(
-                BridgeBackend._session_worker(bridge_backend, sid)
+            handle.run = slow_run
+            bridge_backend._sessions[sid] = _SessionEntry(handle)
+            sends.append(
+                asyncio.create_task(
+                    BridgeBackend.send_message(bridge_backend, sid, sid)
+                )
             )
+        while len(started) < 2:
+            await asyncio.sleep(0)
 
         await BridgeBackend.stop(bridge_backend)
 
-        for task in bridge_backend._worker_tasks.values():
-            assert task.done(), "Worker should be done after stop()"
+        assert sorted(completed) == ["sess-stop-001", "sess-stop-002"]
+        await asyncio.gather(*sends)
 
     async def test_stop_is_idempotent_with_no_sessions(self, bridge_backend):
         """stop() on a backend with no sessions must not raise."""
@@ -308,6 +473,52 @@ class TestBridgeBackendStop:
         await BridgeBackend.stop(bridge_backend)  # should not raise
 
 
+class TestBridgeBackendSessionInfo:
+    """SessionInfo objects are built once per session and reused."""
+
+    async def test_info_is_reused_across_calls(self, bridge_backend):
+        session_id = "sess-info-001"
+        bridge_backend._sessions[session_id] = _SessionEntry(
+            _make_mock_handle(session_id)
+        )
+
+        from amplifier_distro.server.session_backend import BridgeBackend
+
+        info = await BridgeBackend.get_session_info(bridge_backend, session_id)
+        assert info.working_dir == "/tmp/test"
+        assert BridgeBackend.list_active_sessions(bridge_backend) == [info]
+        assert BridgeBackend.list_active_sessions(bridge_backend)[0] is info
+
+    async def test_create_session_info_is_listed(self, bridge_backend):
+        handle = _make_mock_handle("sess-info-002")
+        bridge_backend._bridge.create_session = AsyncMock(return_value=handle)
+
+        from amplifier_distro.server.session_backend import BridgeBackend
+
+        created = await BridgeBackend.create_session(
+            bridge_backend, working_dir="/tmp", description="described"
+        )
+
+        [listed] = BridgeBackend.list_active_sessions(bridge_backend)
+        assert listed is created
+        assert listed.description == "described"
+
+    async def test_end_session_drops_info(self, bridge_backend):
+        session_id = "sess-info-003"
+        bridge_backend._sessions[session_id] = _SessionEntry(
+            _make_mock_handle(session_id)
+        )
+        bridge_backend._bridge.end_session = AsyncMock()
+
+        from amplifier_distro.server.session_backend import BridgeBackend
+
+        await BridgeBackend.get_session_info(bridge_backend, session_id)
+        await BridgeBackend.end_session(bridge_backend, session_id)
+
+        assert await BridgeBackend.get_session_info(bridge_backend, session_id) is None
+        assert BridgeBackend.list_active_sessions(bridge_backend) == []
+
+
 class TestStopServicesShutdown:
     """stop_services() calls backend.stop() if available."""
 
@@ -354,8 +565,14 @@ class TestStopServicesShutdown:
 
 
 class TestSessionBackendProtocol:
+    def test_protocol_declares_stream_message(self):
+        from amplifier_distro.server.session_backend import SessionBackend
+
+        assert hasattr(SessionBackend, "stream_message")
+
     def test_protocol_declares_resume_session(self):
         from amplifier_distro.server.session_backend import SessionBackend
+
         assert hasattr(SessionBackend, "resume_session"), (
             "SessionBackend Protocol must declare resume_session"
         )
@@ -225,6 +225,7 @@ class TestSetupTailscaleIntegration:
         import atexit as _atexit
 
         with (
+            patch("shutil.which", return_value="/usr/bin/tailscale"),
             patch(
                 "amplifier_distro.tailscale.start_serve",
                 return_value="https://box.ts.net",
@@ -242,3 +243,23 @@ class TestSetupTailscaleIntegration:
             from amplifier_distro.server.cli import _setup_tailscale
 
             assert _setup_tailscale(8400) is None
+
+    def test_setup_skips_subprocess_when_binary_missing(self):
+        with (
+            patch("shutil.which", return_value=None),
+            patch("amplifier_distro.tailscale.subprocess.run") as mock_run,
+        ):
+            from amplifier_distro.server.cli import _setup_tailscale
+
+            assert _setup_tailscale(8400) is None
+            mock_run.assert_not_called()
+
+    def test_announce_prints_url(self, capsys):
+        with patch(
+            "amplifier_distro.server.cli._setup_tailscale",
+            return_value="https://box.ts.net",
+        ):
+            from amplifier_distro.server.cli import _announce_tailscale
+
+            _announce_tailscale(8400)
+        assert "https://box.ts.net" in capsys.readouterr().out
@@ -100,6 +100,65 @@ class TestWebChatManifest:
 
         assert isinstance(manifest, AppManifest)
 
+    def test_shutdown_flushes_session_store(self, monkeypatch: pytest.MonkeyPatch):
+        import asyncio
+
+        import amplifier_distro.server.apps.web_chat as wc
+        from amplifier_distro.server.session_backend import MockBackend
+
+        wc._manager = wc.WebChatSessionManager(MockBackend(), persistence_path=None)
+        flushed = []
+        monkeypatch.setattr(wc._manager, "flush", lambda force: flushed.append(force))
+
+        async def _cycle():
+            await wc.manifest.on_startup()
+            await wc.manifest.on_shutdown()
+
+        asyncio.run(_cycle())
+        assert flushed == [True]
+        assert wc._flush_task is None
+
+    def test_shutdown_waits_for_memory_writes(self, monkeypatch: pytest.MonkeyPatch):
+        import asyncio
+
+        import amplifier_distro.server.apps.web_chat as wc
+        from amplifier_distro.server.session_backend import MockBackend
+
+        wc._manager = wc.WebChatSessionManager(MockBackend(), persistence_path=None)
+        monkeypatch.setattr(wc._manager, "flush", lambda force: None)
+        finished = []
+
+        async def _slow_write():
+            await asyncio.sleep(0.01)
+            finished.append(True)
+
+        async def _cycle():
+            await wc.manifest.on_startup()
+            task = asyncio.create_task(_slow_write())
+            wc._background_tasks.add(task)
+            task.add_done_callback(wc._background_tasks.discard)
+            await wc.manifest.on_shutdown()
+
+        asyncio.run(_cycle())
+        assert finished == [True]
+        assert not wc._background_tasks
+
+    def test_startup_creates_manager(self, tmp_path, monkeypatch: pytest.MonkeyPatch):
+        import asyncio
+
+        import amplifier_distro.server.apps.web_chat as wc
+
+        init_services(dev_mode=True)
+        monkeypatch.setattr(wc, "AMPLIFIER_HOME", str(tmp_path))
+
+        async def _cycle():
+            await wc.manifest.on_startup()
+            created = wc._manager
+            await wc.manifest.on_shutdown()
+            return created
+
+        assert asyncio.run(_cycle()) is not None
+
 
 class TestWebChatIndexEndpoint:
     """Verify GET /apps/web-chat/ serves the chat HTML page.
@@ -133,6 +192,29 @@ class TestWebChatIndexEndpoint:
         response = webchat_client.get("/apps/web-chat/")
         assert "messageInput" in response.text
 
+    def test_index_does_not_reread_file_per_request(
+        self, webchat_client: TestClient, monkeypatch: pytest.MonkeyPatch
+    ):
+        def _fail(*args, **kwargs):
+            raise AssertionError("index.html should be cached at import")
+
+        monkeypatch.setattr(Path, "read_text", _fail)
+        monkeypatch.setattr(Path, "read_bytes", _fail)
+        response = webchat_client.get("/apps/web-chat/")
+        assert response.status_code == 200
+        assert "messageInput" in response.text
+
+    def test_index_revalidates_with_etag(self, webchat_client: TestClient):
+        first = webchat_client.get("/apps/web-chat/")
+        etag = first.headers["etag"]
+        second = webchat_client.get("/apps/web-chat/", headers={"If-None-Match": etag})
+        assert second.status_code == 304
+        assert second.content == b""
+        stale = webchat_client.get(
+            "/apps/web-chat/", headers={"If-None-Match": '"stale"'}
+        )
+        assert stale.status_code == 200
+
 
 class TestWebChatSessionAPI:
     """Verify session management endpoints."""
@@ -160,6 +242,54 @@ class TestWebChatSessionAPI:
         assert "session_id" in data
         assert data["session_id"].startswith("mock-session-")
 
+    def test_session_status_reuses_recent_backend_answer(
+        self, webchat_client: TestClient, monkeypatch: pytest.MonkeyPatch
+    ):
+        import amplifier_distro.server.apps.web_chat as wc
+
+        webchat_client.post("/apps/web-chat/api/session", json={})
+        backend = wc._manager._backend
+        calls = []
+        original = backend.get_session_info
+
+        async def _counting(session_id):
+            calls.append(session_id)
+            return await original(session_id)
+
+        monkeypatch.setattr(backend, "get_session_info", _counting)
+        first = webchat_client.get("/apps/web-chat/api/session").json()
+        second = webchat_client.get("/apps/web-chat/api/session").json()
+        assert first == second
+        assert len(calls) == 1
+
+    def test_session_status_follows_new_session_immediately(
+        self, webchat_client: TestClient
+    ):
+        webchat_client.post("/apps/web-chat/api/session", json={})
+        webchat_client.get("/apps/web-chat/api/session")
+        created = webchat_client.post("/apps/web-chat/api/session", json={}).json()
+        data = webchat_client.get("/apps/web-chat/api/session").json()
+        assert data["session_id"] == created["session_id"]
+
+    def test_create_session_without_body(self, webchat_client: TestClient):
+        response = webchat_client.post("/apps/web-chat/api/session")
+        assert response.status_code == 200
+        assert response.json()["working_dir"] == "~"
+
+    def test_create_session_empty_body_is_not_read(
+        self, webchat_client: TestClient, monkeypatch: pytest.MonkeyPatch
+    ):
+        from starlette.requests import Request
+
+        async def _fail(self):
+            raise AssertionError("empty body should not be parsed")
+
+        monkeypatch.setattr(Request, "json", _fail)
+        response = webchat_client.post(
+            "/apps/web-chat/api/session", headers={"Content-Length": "0"}
+        )
+        assert response.status_code == 200
+
     def test_session_status_connected_after_create(self, webchat_client: TestClient):
         webchat_client.post("/apps/web-chat/api/session", json={})
         data = webchat_client.get("/apps/web-chat/api/session").json()
@@ -191,6 +321,21 @@ class TestWebChatChatAPI:
         )
         assert response.status_code == 400
 
+    def test_chat_whitespace_message_returns_400(self, webchat_client: TestClient):
+        response = webchat_client.post(
+            "/apps/web-chat/api/chat",
+            json={"message": "  \n\t "},
+        )
+        assert response.status_code == 400
+
+    def test_chat_invalid_json_returns_400(self, webchat_client: TestClient):
+        response = webchat_client.post(
+            "/apps/web-chat/api/chat",
+            content=b"not json",
+            headers={"Content-Type": "application/json"},
+        )
+        assert response.status_code == 400
+
     def test_chat_with_session_returns_response(self, webchat_client: TestClient):
         # Create session first
         webchat_client.post("/apps/web-chat/api/session", json={})
@@ -216,6 +361,70 @@ class TestWebChatChatAPI:
         assert "test message" in data["response"]
 
 
+SSE_HEADERS = {"Accept": "text/event-stream"}
+
+
+class TestWebChatStreamingAPI:
+    """Verify POST /apps/web-chat/api/chat streams when asked for SSE.
+
+    Antagonist note: Streaming is opt-in via the Accept header. Plain
+    JSON clients must keep getting a single JSON body, and error paths
+    must keep their JSON status codes.
+    """
+
+    def test_stream_returns_event_stream(self, webchat_client: TestClient):
+        webchat_client.post("/apps/web-chat/api/session", json={})
+        response = webchat_client.post(
+            "/apps/web-chat/api/chat",
+            json={"message": "hello"},
+            headers=SSE_HEADERS,
+        )
+        assert response.status_code == 200
+        assert "text/event-stream" in response.headers["content-type"]
+
+    def test_stream_chunks_reassemble_full_response(self, webchat_client: TestClient):
+        import json
+
+        webchat_client.post("/apps/web-chat/api/session", json={})
+        body = webchat_client.post(
+            "/apps/web-chat/api/chat",
+            json={"message": "stream me please"},
+            headers=SSE_HEADERS,
+        ).text
+        frames = [f for f in body.split("\n\n") if f]
+        chunks = [
+            json.loads(f[len("data: ") :])["chunk"]
+            for f in frames
+            if f.startswith("data: ")
+        ]
+        assert len(chunks) > 1
+        assert "".join(chunks) == "[Mock response to: stream me please]"
+        assert frames[-1].startswith("event: done")
+
+    def test_stream_without_session_returns_409_json(self, webchat_client: TestClient):
+        response = webchat_client.post(
+            "/apps/web-chat/api/chat",
+            json={"message": "hello"},
+            headers=SSE_HEADERS,
+        )
+        assert response.status_code == 409
+        assert response.json()["session_connected"] is False
+
+    def test_stream_dead_session_returns_409_json(self, webchat_client: TestClient):
+        import amplifier_distro.server.apps.web_chat as wc
+
+        webchat_client.post("/apps/web-chat/api/session", json={})
+        session_id = wc._manager.active_session_id
+        wc._manager._backend._sessions[session_id].is_active = False
+        response = webchat_client.post(
+            "/apps/web-chat/api/chat",
+            json={"message": "hello"},
+            headers=SSE_HEADERS,
+        )
+        assert response.status_code == 409
+        assert wc._manager.active_session_id is None
+
+
 class TestWebChatEndSession:
     """Verify POST /apps/web-chat/api/end endpoint."""
 
@@ -433,6 +642,26 @@ class TestWebChatSessionsListAPI:
         assert len(inactive) == 1
         assert sessions[0]["description"] == "second"  # most recently active first
 
+    def test_list_sessions_limit_returns_most_recent(self, webchat_client: TestClient):
+        webchat_client.post("/apps/web-chat/api/session", json={"description": "first"})
+        webchat_client.post(
+            "/apps/web-chat/api/session", json={"description": "second"}
+        )
+        sessions = webchat_client.get(
+            "/apps/web-chat/api/sessions", params={"limit": 1}
+        ).json()["sessions"]
+        assert [s["description"] for s in sessions] == ["second"]
+
+    @pytest.mark.parametrize("limit", [0, -1])
+    def test_list_sessions_rejects_non_positive_limit(
+        self, webchat_client: TestClient, limit: int
+    ):
+        webchat_client.post("/apps/web-chat/api/session", json={})
+        response = webchat_client.get(
+            "/apps/web-chat/api/sessions", params={"limit": limit}
+        )
+        assert response.status_code == 422
+
     def test_list_sessions_project_id_field_is_present(
         self, webchat_client: TestClient
     ):
@@ -453,6 +682,10 @@ class TestWebChatSessionResumeAPI:
         assert response.status_code == 400
         assert "session_id" in response.json()["error"]
 
+    def test_resume_without_body_returns_400(self, webchat_client: TestClient):
+        response = webchat_client.post("/apps/web-chat/api/session/resume")
+        assert response.status_code == 400
+
     def test_resume_unknown_session_returns_404(self, webchat_client: TestClient):
         response = webchat_client.post(
             "/apps/web-chat/api/session/resume",
@@ -7,6 +7,7 @@ All store tests use persistence_path=None (in-memory mode).
 from __future__ import annotations
 
 import asyncio
+import json
 
 import pytest
 
@@ -185,6 +186,26 @@ class TestWebChatSessionStore:
         assert sessions[0].session_id == "sess-002"
         assert sessions[1].session_id == "sess-001"
 
+    def test_list_all_limit_returns_most_recent(self):
+        store = WebChatSessionStore()
+        for i, ts in enumerate(["10", "12", "11"]):
+            s = store.add(f"sess-{i}", "x")
+            s.last_active = f"2026-01-01T{ts}:00:00"
+        sessions = store.list_all(limit=2)
+        assert [s.session_id for s in sessions] == ["sess-1", "sess-2"]
+
+    def test_list_all_reorders_after_touch(self):
+        """Antagonist note: the cached order must not outlive a touch()."""
+        store = WebChatSessionStore()
+        s1 = store.add("sess-001", "first")
+        s2 = store.add("sess-002", "second")
+        s1.last_active = "2026-01-01T10:00:00"
+        s2.last_active = "2026-01-01T12:00:00"
+        assert store.list_all()[0].session_id == "sess-002"
+        store.touch("sess-001")
+        assert store.list_all()[0].session_id == "sess-001"
+        assert store.list_all(limit=1)[0].session_id == "sess-001"
+
     # ------------------------------------------------------------------
     # active_session()
     # ------------------------------------------------------------------
@@ -206,6 +227,27 @@ class TestWebChatSessionStore:
         store.deactivate("sess-001")
         assert store.active_session() is None
 
+    def test_active_session_falls_back_to_next_active(self):
+        """Antagonist note: the cached id must track deactivate/reactivate."""
+        store = WebChatSessionStore()
+        store.add("sess-001", "first")
+        store.add("sess-002", "second")
+        assert store.active_session().session_id == "sess-001"
+        store.deactivate("sess-001")
+        assert store.active_session().session_id == "sess-002"
+        assert store.active_session_id == "sess-002"
+        store.reactivate("sess-001")
+        assert store.active_session().session_id == "sess-001"
+
+    def test_active_session_restored_from_disk(self, tmp_path):
+        path = tmp_path / "sessions.json"
+        store = WebChatSessionStore(persistence_path=path)
+        store.add("sess-001", "old")
+        store.deactivate("sess-001")
+        store.add("sess-002", "current")
+        reloaded = WebChatSessionStore(persistence_path=path)
+        assert reloaded.active_session().session_id == "sess-002"
+
     # ------------------------------------------------------------------
     # touch()
     # ------------------------------------------------------------------
@@ -219,10 +261,31 @@ class TestWebChatSessionStore:
         assert updated is not None
         assert updated.last_active >= old_ts
 
+    def test_timestamps_are_iso_utc(self):
+        from datetime import UTC, datetime
+
+        store = WebChatSessionStore()
+        s = store.add("sess-001", "test")
+        parsed = datetime.fromisoformat(s.last_active)
+        assert parsed.utcoffset().total_seconds() == 0
+        assert abs((datetime.now(UTC) - parsed).total_seconds()) < 5
+
     def test_touch_missing_does_not_raise(self):
         store = WebChatSessionStore()
         store.touch("nonexistent")  # should not raise
 
+    def test_touch_is_written_on_flush(self, tmp_path):
+        """Antagonist note: touch() defers the write; flush() must land it."""
+        path = tmp_path / "sessions.json"
+        store = WebChatSessionStore(persistence_path=path)
+        created = store.add("sess-001", "test").last_active
+        store.touch("sess-001")
+        on_disk = WebChatSessionStore(persistence_path=path).get("sess-001")
+        assert on_disk.last_active == created
+        store.flush(force=True)
+        on_disk = WebChatSessionStore(persistence_path=path).get("sess-001")
+        assert on_disk.last_active == store.get("sess-001").last_active
+
     # ------------------------------------------------------------------
     # Persistence — roundtrip
     # ------------------------------------------------------------------
@@ -256,6 +319,71 @@ class TestWebChatSessionStore:
         store = WebChatSessionStore(persistence_path=path)
         assert store.list_all() == []
 
+    def test_persistence_appends_one_line_per_mutation(self, tmp_path):
+        path = tmp_path / "sessions.json"
+        store = WebChatSessionStore(persistence_path=path)
+        store.add("sess-001", "test")
+        store.deactivate("sess-001")
+        store.reactivate("sess-001")
+        assert len(path.read_text().splitlines()) == 3
+        assert WebChatSessionStore(persistence_path=path).get("sess-001").is_active
+
+    def test_persistence_reads_legacy_json_array(self, tmp_path):
+        """Antagonist note: files written before the log format must load."""
+        path = tmp_path / "sessions.json"
+        path.write_text(
+            json.dumps(
+                [
+                    {
+                        "session_id": "sess-001",
+                        "description": "old",
+                        "created_at": "2026-01-01T00:00:00+00:00",
+                        "last_active": "2026-01-01T00:00:00+00:00",
+                        "is_active": False,
+                        "extra": {},
+                    }
+                ],
+                indent=2,
+            )
+        )
+        store = WebChatSessionStore(persistence_path=path)
+        store.add("sess-002", "new")
+        reloaded = WebChatSessionStore(persistence_path=path)
+        assert [s.session_id for s in reloaded.list_all()] == ["sess-002", "sess-001"]
+
+    def test_persistence_skips_torn_last_line(self, tmp_path):
+        path = tmp_path / "sessions.json"
+        store = WebChatSessionStore(persistence_path=path)
+        store.add("sess-001", "test")
+        with path.open("a") as f:
+            f.write('{"session_id": "sess-0')
+        store = WebChatSessionStore(persistence_path=path)
+        store.add("sess-002", "after crash")
+        reloaded = WebChatSessionStore(persistence_path=path)
+        assert reloaded.get("sess-001") is not None
+        assert reloaded.get("sess-002") is not None
+
+    def test_periodic_flush_skips_recently_written_session(self, tmp_path):
+        """Antagonist note: a busy chat must not append on every flush tick."""
+        path = tmp_path / "sessions.json"
+        store = WebChatSessionStore(persistence_path=path)
+        store.add("sess-001", "test")
+        store.touch("sess-001")
+        store.flush()
+        assert len(path.read_text().splitlines()) == 1
+        store.flush(force=True)
+        assert len(path.read_text().splitlines()) == 2
+
+    def test_flush_compacts_long_log(self, tmp_path):
+        path = tmp_path / "sessions.json"
+        store = WebChatSessionStore(persistence_path=path)
+        store.add("sess-001", "test")
+        for _ in range(4):
+            store.touch("sess-001")
+            store.flush(force=True)
+        # 5 lines for 1 session exceeds the 4:1 ratio, so it was rewritten
+        assert len(path.read_text().splitlines()) == 1
+
     def test_persistence_missing_file_is_ignored(self, tmp_path):
         """Missing file doesn't crash the store — starts empty."""
         path = tmp_path / "nonexistent.json"
@@ -342,6 +470,27 @@ class TestWebChatSessionManager:
         # Second session is now active
         assert manager.active_session_id == info2.session_id
 
+    def test_concurrent_create_session_leaves_one_active(self):
+        from amplifier_distro.server.apps.web_chat import WebChatSessionManager
+        from amplifier_distro.server.session_backend import MockBackend
+
+        class SlowBackend(MockBackend):
+            async def create_session(self, **kwargs):
+                await asyncio.sleep(0.01)
+                return await super().create_session(**kwargs)
+
+        manager = WebChatSessionManager(SlowBackend(), persistence_path=None)
+
+        async def _race():
+            await asyncio.gather(
+                manager.create_session(description="a"),
+                manager.create_session(description="b"),
+            )
+
+        asyncio.run(_race())
+        active = [s for s in manager.list_sessions() if s.is_active]
+        assert len(active) == 1
+
     # ------------------------------------------------------------------
     # send_message()
     # ------------------------------------------------------------------
@@ -374,6 +523,15 @@ class TestWebChatSessionManager:
         # Store should have deactivated the session
         assert manager.active_session_id is None
 
+    def test_repeated_message_reaches_backend(self):
+        """Sessions are stateful: a repeated prompt is a new turn, not a replay."""
+        manager, backend = self._make_manager()
+        asyncio.run(manager.create_session(working_dir="~", description="test"))
+        asyncio.run(manager.send_message("continue"))
+        asyncio.run(manager.send_message("continue"))
+        sent = [c["message"] for c in backend.calls if c["method"] == "send_message"]
+        assert sent == ["continue", "continue"]
+
     # ------------------------------------------------------------------
     # end_session()
     # ------------------------------------------------------------------